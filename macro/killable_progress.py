@@ -1,5 +1,8 @@
 """
-Example KillableThread progress indicators.
+Example killable progress indicators.
+
+``CancellableThread`` is used rather than ``KillableThread``, it does not slow down the code run in the thread.
+The thread ends when it reaches ``cancel_token.sleep()`` or ``cancel_token.checkpoint()`` after ``kill()``.
 
 This macro will only work if extension is installed.
 
@@ -12,7 +15,8 @@ import time
 # default is: lo_pip = "lo_pip" to get macro working inf your template copy.
 from lo_pip.oxt_logger import OxtLogger
 from lo_pip.thread.runners import run_in_thread
-from lo_pip.thread.killable_thread import KillableThread
+from lo_pip.thread import cancel_token
+from lo_pip.thread.cancellable_thread import CancellableThread
 
 
 # https://wiki.documentfoundation.org/Macros/Python_Guide/Useful_functions
@@ -21,14 +25,14 @@ from lo_pip.thread.killable_thread import KillableThread
 def log_runner(logger) -> None:
     while True:
         logger.debug("running log_runner")
-        time.sleep(1)
+        cancel_token.sleep(1)
 
 
 @run_in_thread
 def actual_log_progress() -> None:
     logger = OxtLogger(log_name=__name__)
     logger.debug("Log_progress: Start")
-    my_progress = KillableThread(target=log_runner, args=(logger,))
+    my_progress = CancellableThread(target=log_runner, args=(logger,))
     my_progress.start()
     logger.debug("Log_progress: Started")
     time.sleep(10)
@@ -30,6 +30,9 @@ def _args_action_build(args: argparse.Namespace) -> None:
             make_dist=args.make_dist,
             pre_install_pure_packages=args.process_pure,
             compile_idl=args.compile_idl,
+            zip_bytecode=args.zip_bytecode,
+            bytecode_report=args.bytecode_report,
+            incremental=args.incremental,
         )
     )
     print("Building...", flush=True)
@@ -78,6 +81,28 @@ def _args_add_sub_build(parser: argparse.ArgumentParser) -> None:
     parser.add_argument(
         "-d", "--no-dist", help="Do not process dist", action="store_false", dest="make_dist", default=True
     )
+    parser.add_argument(
+        "-b",
+        "--zip-bytecode",
+        help="Store compiled bytecode in the embedded zip files, same as zip_bytecode in pyproject.toml",
+        action="store_true",
+        dest="zip_bytecode",
+        default=build_args.zip_bytecode,
+    )
+    parser.add_argument(
+        "--bytecode-report",
+        help="Report the import time of the embedded zip files with and without bytecode",
+        action="store_true",
+        dest="bytecode_report",
+        default=build_args.bytecode_report,
+    )
+    parser.add_argument(
+        "--incremental",
+        help="Reuse the outputs of unchanged build stages from the build cache in .build_cache",
+        action="store_true",
+        dest="incremental",
+        default=build_args.incremental,
+    )
 
 
 # endregion Args Parse
@@ -37,6 +37,9 @@ class BasicConfig(metaclass=ConfigMeta):
         self._sym_link_cpython = bool(kwargs["sym_link_cpython"])
         self._uninstall_on_update = bool(kwargs["uninstall_on_update"])
         self._install_on_no_uninstall_permission = bool(kwargs["install_on_no_uninstall_permission"])
+        self._install_batch = bool(kwargs.get("install_batch", True))
+        self._internet_probe_hosts = cast(List[str], kwargs.get("internet_probe_hosts", []))
+        self._internet_probe_ttl = int(kwargs.get("internet_probe_ttl", 0))
         self._unload_after_install = bool(kwargs["unload_after_install"])
         self._run_imports = set(kwargs["run_imports"])
         self._run_imports_linux = set(kwargs["run_imports_linux"])
@@ -50,10 +53,16 @@ class BasicConfig(metaclass=ConfigMeta):
         self._cmd_clean_file_enabled = bool(kwargs["cmd_clean_file_enabled"])
         self._libreoffice_debug_port = int(kwargs.get("libreoffice_debug_port", 0))
         self._pip_shared_dirs = cast(List[str], kwargs.get("pip_shared_dirs", []))
+        self._wheel_cache_dir = str(kwargs.get("wheel_cache_dir", ""))
+        self._wheel_cache_max_mb = int(kwargs.get("wheel_cache_max_mb", 0))
 
         if "requirements" not in kwargs:
             kwargs["requirements"] = {}
         self._requirements: Dict[str, str] = dict(**kwargs["requirements"])
+        self._requirement_table = cast(Dict[str, Any], kwargs.get("requirement_table", {}))
+        self._trace_report = bool(kwargs.get("trace_report", False))
+        self._pip_worker = bool(kwargs.get("pip_worker", False))
+        self._precompile = bool(kwargs.get("precompile", True))
 
     # region Properties
     @property
@@ -129,6 +138,37 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._has_locals
 
+    @property
+    def install_batch(self) -> bool:
+        """
+        Gets the flag indicating if all unmet requirements are installed with a single pip call.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.install_batch)
+
+        If the batch install fails then each package is installed one at a time.
+        """
+        return self._install_batch
+
+    @property
+    def internet_probe_hosts(self) -> List[str]:
+        """
+        Gets the hosts that are raced to check for an internet connection.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.internet_probe_hosts)
+        """
+        return self._internet_probe_hosts
+
+    @property
+    def internet_probe_ttl(self) -> int:
+        """
+        Gets the number of seconds the result of an internet check is kept in the user profile.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.internet_probe_ttl)
+
+        If ``0`` the internet connection is checked on every start.
+        """
+        return self._internet_probe_ttl
+
     @property
     def install_on_no_uninstall_permission(self) -> bool:
         """
@@ -220,6 +260,26 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._pip_shared_dirs
 
+    @property
+    def pip_worker(self) -> bool:
+        """
+        Gets the flag indicating if pip commands should run in one long lived python process.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_worker)
+
+        If this is set to ``True`` then pip is imported once and reused for each pip command of a session.
+        """
+        return self._pip_worker
+
+    @property
+    def precompile(self) -> bool:
+        """
+        Gets the flag indicating if the packages installed in a run are compiled to bytecode in the background.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.precompile)
+        """
+        return self._precompile
+
     @property
     def py_pkg_dir(self) -> str:
         """
@@ -234,6 +294,19 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._require_install_name_match
 
+    @property
+    def requirement_table(self) -> Dict[str, Any]:
+        """
+        Gets the requirement table.
+
+        The value for this property is built from pyproject.toml (tool.oxt.requirements and tool.oxt.py_packages)
+        when the extension is built.
+
+        It holds the compiled version specs and the ``py_packages`` for each platform.
+        Empty if the extension was built before the table was added.
+        """
+        return self._requirement_table
+
     @property
     def requirements(self) -> Dict[str, str]:
         """
@@ -315,6 +388,17 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._sym_link_cpython
 
+    @property
+    def trace_report(self) -> bool:
+        """
+        Gets the flag indicating if a json report of the time taken by each install phase should be written.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.trace_report)
+
+        If this is set to ``True`` then the report is written next to the log file.
+        """
+        return self._trace_report
+
     @property
     def uninstall_on_update(self) -> bool:
         """
@@ -329,6 +413,28 @@ class BasicConfig(metaclass=ConfigMeta):
         """
         return self._unload_after_install
 
+    @property
+    def wheel_cache_dir(self) -> str:
+        """
+        Gets the wheel cache directory as set in the configuration.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_dir)
+
+        An empty string means the default user cache directory is used.
+        """
+        return self._wheel_cache_dir
+
+    @property
+    def wheel_cache_max_mb(self) -> int:
+        """
+        Gets the size budget of the wheel cache in megabytes.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_max_mb)
+
+        If this is set to ``0`` then the wheel cache is not used.
+        """
+        return self._wheel_cache_max_mb
+
     @property
     def window_timeout(self) -> int:
         """
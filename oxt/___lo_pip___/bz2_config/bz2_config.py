@@ -8,7 +8,11 @@ import platform
 from ..config import Config
 
 
-class B2ZItemT(TypedDict):
+class _B2ZItemOptionalT(TypedDict, total=False):
+    pyd_sha256: str
+
+
+class B2ZItemT(_B2ZItemOptionalT):
     url: str
     md5: str
 
@@ -2,7 +2,7 @@
 # region Imports
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, List, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Set, TYPE_CHECKING
 import json
 import os
 import sys
@@ -203,6 +203,21 @@ class Config(metaclass=Singleton):
             site_packages.mkdir(parents=True, exist_ok=True)
         return str(site_packages)
 
+    def _get_wheel_cache_dir(self) -> str:
+        """Gets the wheel cache directory, the default is a ``lo_pip/wheels`` folder in the user cache directory."""
+        if self._basic_config.wheel_cache_max_mb <= 0:
+            return ""
+        cache_dir = self._basic_config.wheel_cache_dir
+        if cache_dir:
+            return str(Path(os.path.expandvars(cache_dir)).expanduser())
+        if self._is_win:
+            root = Path(os.getenv("LOCALAPPDATA", "") or Path.home() / "AppData" / "Local")
+        elif self._is_mac:
+            root = Path.home() / "Library" / "Caches"
+        else:
+            root = Path(os.getenv("XDG_CACHE_HOME", "") or Path.home() / ".cache")
+        return str(root / "lo_pip" / "wheels")
+
     def _get_windows_site_packages_dir(self) -> str:
         # sourcery skip: class-extract-method
         if self.is_shared_installed or self.is_bundled_installed:
@@ -330,6 +345,19 @@ class Config(metaclass=Singleton):
         """
         return self._basic_config.py_pkg_dir
 
+    @property
+    def requirement_table(self) -> Dict[str, Any]:
+        """
+        Gets the requirement table.
+
+        The value for this property is built from pyproject.toml (tool.oxt.requirements and tool.oxt.py_packages)
+        when the extension is built.
+
+        It holds the compiled version specs and the ``py_packages`` for each platform.
+        Empty if the extension was built before the table was added.
+        """
+        return self._basic_config.requirement_table
+
     @property
     def requirements(self) -> Dict[str, str]:
         """
@@ -459,6 +487,37 @@ class Config(metaclass=Singleton):
         """
         return self._pip_wheel_url
 
+    @property
+    def install_batch(self) -> bool:
+        """
+        Gets the flag indicating if all unmet requirements are installed with a single pip call.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.install_batch)
+
+        If the batch install fails then each package is installed one at a time.
+        """
+        return self._basic_config.install_batch
+
+    @property
+    def internet_probe_hosts(self) -> List[str]:
+        """
+        Gets the hosts that are raced to check for an internet connection.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.internet_probe_hosts)
+        """
+        return self._basic_config.internet_probe_hosts
+
+    @property
+    def internet_probe_ttl(self) -> int:
+        """
+        Gets the number of seconds the result of an internet check is kept in the user profile.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.internet_probe_ttl)
+
+        If ``0`` the internet connection is checked on every start.
+        """
+        return self._basic_config.internet_probe_ttl
+
     @property
     def install_on_no_uninstall_permission(self) -> bool:
         """
@@ -587,6 +646,30 @@ class Config(metaclass=Singleton):
         """
         return self.basic_config.uninstall_on_update
 
+    @property
+    def wheel_cache_dir(self) -> str:
+        """
+        Gets the directory of the wheel cache that is shared by all LibreOffice profiles of the user.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_dir)
+
+        Empty string if the wheel cache is disabled.
+        """
+        try:
+            return self._wheel_cache_dir
+        except AttributeError:
+            self._wheel_cache_dir = self._get_wheel_cache_dir()
+            return self._wheel_cache_dir
+
+    @property
+    def wheel_cache_max_size(self) -> int:
+        """
+        Gets the size budget of the wheel cache in bytes.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.wheel_cache_max_mb)
+        """
+        return self._basic_config.wheel_cache_max_mb * 1024 * 1024
+
     @property
     def window_timeout(self) -> int:
         """
@@ -629,6 +712,17 @@ class Config(metaclass=Singleton):
         """
         return self._basic_config.sym_link_cpython
 
+    @property
+    def trace_report(self) -> bool:
+        """
+        Gets the flag indicating if a json report of the time taken by each install phase should be written.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.trace_report)
+
+        If this is set to ``True`` then the report is written next to the log file.
+        """
+        return self._basic_config.trace_report
+
     @property
     def run_imports(self) -> Set[str]:
         """
@@ -743,6 +837,26 @@ class Config(metaclass=Singleton):
         """
         return self._basic_config.pip_shared_dirs
 
+    @property
+    def pip_worker(self) -> bool:
+        """
+        Gets the flag indicating if pip commands should run in one long lived python process.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.pip_worker)
+
+        If this is set to ``True`` then pip is imported once and reused for each pip command of a session.
+        """
+        return self._basic_config.pip_worker
+
+    @property
+    def precompile(self) -> bool:
+        """
+        Gets the flag indicating if the packages installed in a run are compiled to bytecode in the background.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.precompile)
+        """
+        return self._basic_config.precompile
+
     # endregion Properties
 
 
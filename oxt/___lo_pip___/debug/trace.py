@@ -0,0 +1,274 @@
+"""
+Lightweight tracing of the install phases.
+
+Spans time a block of code and can be nested. When tracing is enabled each run writes a json report
+with the duration, outcome and attributes, such as subprocess wall times, of every span.
+When tracing is disabled ``Tracer().span()`` returns a shared span that does nothing.
+
+Example usage:
+
+.. code-block:: python
+
+    from ___lo_pip___.debug.trace import Tracer, traced
+
+    tracer = Tracer()
+    tracer.start("/path/pip_install_trace.json")
+
+    with tracer.span("requirements_check") as span:
+        span.set("met", check_requirements())
+
+    @traced("install_pkg")
+    def install() -> None:
+        ...
+
+    tracer.save()
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List, TypeVar, cast
+from pathlib import Path
+import functools
+import json
+import os
+import tempfile
+import threading
+import time
+
+from ..meta.singleton import Singleton
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class Span:
+    """A timed block of code."""
+
+    __slots__ = ("name", "attrs", "children", "outcome", "_start", "_end", "_tracer")
+
+    def __init__(self, tracer: Tracer, name: str, attrs: Dict[str, Any]) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.children: List[Span] = []
+        self.outcome = "ok"
+        self._tracer = tracer
+        self._start = 0.0
+        self._end = 0.0
+
+    def __enter__(self) -> Span:
+        self._start = time.perf_counter()
+        self._tracer._push(self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:  # noqa: ANN401
+        self._end = time.perf_counter()
+        if exc_type is not None:
+            self.outcome = "error"
+            self.attrs["error"] = f"{exc_type.__name__}: {exc}"
+        self._tracer._pop(self)
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        """
+        Sets an attribute of the span.
+
+        Args:
+            key (str): Attribute name such as ``returncode``.
+            value (Any): Any value that can be saved as json.
+        """
+        self.attrs[key] = value
+
+    def fail(self, reason: str = "") -> None:
+        """Sets the outcome of the span to ``failed`` without raising an error."""
+        self.outcome = "failed"
+        if reason:
+            self.attrs["reason"] = reason
+
+    @property
+    def duration(self) -> float:
+        """Gets the duration in seconds."""
+        end = self._end or time.perf_counter()
+        return end - self._start
+
+    def to_dict(self, origin: float) -> Dict[str, Any]:
+        """
+        Gets the span as a dictionary.
+
+        Args:
+            origin (float): ``time.perf_counter()`` value that start times are relative to.
+        """
+        result: Dict[str, Any] = {
+            "name": self.name,
+            "start": round(self._start - origin, 6),
+            "duration": round(self.duration, 6),
+            "outcome": self.outcome,
+        }
+        if self.attrs:
+            result["attrs"] = self.attrs
+        if self.children:
+            result["children"] = [child.to_dict(origin) for child in self.children]
+        return result
+
+
+class _NullSpan:
+    """Span used when tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NullSpan:
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:  # noqa: ANN401
+        pass
+
+    def set(self, key: str, value: Any) -> None:  # noqa: ANN401
+        pass
+
+    def fail(self, reason: str = "") -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer(metaclass=Singleton):
+    """Singleton Class. Collects spans and writes the trace report."""
+
+    def __init__(self) -> None:
+        self._enabled = False
+        self._report_file: Path | None = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._roots: List[Span] = []
+        self._origin = 0.0
+        self._started = 0.0
+
+    # region Methods
+    def _get_stack(self) -> List[Span]:
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def _push(self, span: Span) -> None:
+        stack = self._get_stack()
+        if stack:
+            stack[-1].children.append(span)
+        else:
+            # spans started on other threads with no parent are added at the top level.
+            with self._lock:
+                self._roots.append(span)
+        stack.append(span)
+
+    def _pop(self, span: Span) -> None:
+        stack = self._get_stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+        elif span in stack:
+            stack.remove(span)
+
+    def start(self, report_file: str | Path) -> None:
+        """
+        Enables tracing and clears any spans of a previous run.
+
+        Args:
+            report_file (str | Path): Json file the report is written to by ``save()``.
+        """
+        with self._lock:
+            self._report_file = Path(report_file)
+            self._roots = []
+            self._local = threading.local()
+            self._origin = time.perf_counter()
+            self._started = time.time()
+            self._enabled = True
+
+    def span(self, name: str, **attrs: Any) -> Span | _NullSpan:  # noqa: ANN401
+        """
+        Gets a span to use as a context manager.
+
+        Args:
+            name (str): Name of the span such as ``requirements_check``.
+            attrs (Any): Attributes of the span.
+
+        Returns:
+            Span: New span if tracing is enabled; Otherwise, a span that does nothing.
+        """
+        if not self._enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+
+    def get_report(self) -> Dict[str, Any]:
+        """Gets the report as a dictionary."""
+        with self._lock:
+            roots = list(self._roots)
+        return {
+            "started": self._started,
+            "pid": os.getpid(),
+            "duration": round(time.perf_counter() - self._origin, 6),
+            "spans": [span.to_dict(self._origin) for span in roots],
+        }
+
+    def save(self) -> Path | None:
+        """
+        Writes the report and disables tracing.
+
+        Returns:
+            Path | None: Report file if tracing was enabled; Otherwise, ``None``.
+        """
+        if not self._enabled or self._report_file is None:
+            return None
+        self._enabled = False
+        report = self.get_report()
+        pth = self._report_file
+        pth.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=pth.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, default=str)
+        os.replace(tmp, pth)
+        return pth
+
+    @staticmethod
+    def get_report_file(log_file: str | Path) -> Path:
+        """
+        Gets the report file that goes next to a log file.
+
+        Args:
+            log_file (str | Path): Log file such as ``pip_install.log``.
+
+        Returns:
+            Path: Report file such as ``pip_install_trace.json``.
+        """
+        log_file = Path(log_file)
+        return log_file.with_name(f"{log_file.stem}_trace.json")
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def enabled(self) -> bool:
+        """Gets if tracing is enabled."""
+        return self._enabled
+
+    # endregion Properties
+
+
+def traced(name: str = "") -> Callable[[_F], _F]:
+    """
+    Decorator that runs a function in a span.
+
+    Args:
+        name (str, optional): Span name. Defaults to the function qualified name.
+    """
+
+    def decorator(func: _F) -> _F:
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+            tracer = Tracer()
+            if not tracer._enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+
+        return cast(_F, wrapper)
+
+    return decorator
@@ -13,6 +13,7 @@ from ...lo_util.resource_resolver import ResourceResolver
 from ...lo_util.configuration import Configuration, SettingsT
 from ...settings.settings import Settings
 from ..file_open_dialog import FileOpenDialog
+from .handler_names import EXAMPLE_IMPLE_NAME
 
 from ...oxt_logger import OxtLogger
 
@@ -22,7 +23,7 @@ if TYPE_CHECKING:
     from com.sun.star.awt import UnoControlButton  # service
 
 
-IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.Example"
+IMPLEMENTATION_NAME = EXAMPLE_IMPLE_NAME
 
 
 class ButtonListener(unohelper.Base, XActionListener):
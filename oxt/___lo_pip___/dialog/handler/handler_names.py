@@ -0,0 +1,14 @@
+"""
+Implementation names of the options dialog handlers.
+
+Kept apart from the handler modules so ``py_runner.py`` can register the handlers without importing them.
+"""
+
+from __future__ import annotations
+from ...basic_config import BasicConfig
+
+_IMPLE_PREFIX = BasicConfig().lo_implementation_name
+
+EXAMPLE_IMPLE_NAME = f"{_IMPLE_PREFIX}.Example"
+LOGGER_OPTIONS_IMPLE_NAME = f"{_IMPLE_PREFIX}.LoggingOptionsPage"
+UNINSTALL_IMPLE_NAME = f"{_IMPLE_PREFIX}.OptUninstallPage"
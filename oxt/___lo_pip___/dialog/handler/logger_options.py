@@ -8,7 +8,6 @@ from com.sun.star.awt import XContainerWindowEventHandler
 from com.sun.star.beans import XPropertyChangeListener
 from com.sun.star.beans import PropertyChangeEvent  # struct
 
-from ...basic_config import BasicConfig
 from ...config import Config
 from ...lo_util.resource_resolver import ResourceResolver
 
@@ -17,6 +16,7 @@ from ...settings.settings import Settings
 
 from ...oxt_logger import OxtLogger
 from ..message_dialog import MessageDialog
+from .handler_names import LOGGER_OPTIONS_IMPLE_NAME
 from ...lo_util.clipboard import copy_to_clipboard
 
 if TYPE_CHECKING:
@@ -28,7 +28,7 @@ if TYPE_CHECKING:
     from com.sun.star.awt import UnoControlFixedText
 
 
-IMPLEMENTATION_NAME = f"{BasicConfig().lo_implementation_name}.LoggingOptionsPage"
+IMPLEMENTATION_NAME = LOGGER_OPTIONS_IMPLE_NAME
 
 _LOG_OPTS = {
     "optLogNone": "NONE",
@@ -19,6 +19,7 @@ from com.sun.star.awt import PosSize
 
 from ..dialog_base import DialogBase
 from ..message_dialog import MessageDialog
+from .handler_names import UNINSTALL_IMPLE_NAME
 from ...basic_config import BasicConfig
 from ...settings.general_settings import GeneralSettings  # noqa: F401
 from ...lo_util.resource_resolver import ResourceResolver
@@ -28,6 +29,9 @@ from ...events.named_events import GenNamedEvent
 from ...events.lo_events import LoEvents
 from ...install.progress_window.progress_dialog_true import ProgressDialogTrue
 from ...install.progress import Progress
+from ...install.startup_fingerprint import StartupFingerprint
+from ...install.pip_worker.pip_worker import PipWorker
+from ...debug.trace import Tracer
 from ...thread.stoppable_thread import StoppableThread
 from ...lo_util.clipboard import copy_to_clipboard
 from ...input_output import file_util
@@ -104,23 +108,36 @@ class ButtonUninstallListener(XActionListener, unohelper.Base):
             progress = Progress(start_msg=msg, title=title)
             progress.start()
 
+            tracer = Tracer()
+            if self._config.trace_report and self._log.log_file:
+                tracer.start(Tracer.get_report_file(self._log.log_file))
             installer = InstallPkg(self.dialog_handler.ctx, flag_upgrade=False)
             success = True
             self._log.debug("_uninstall_items() uninstall_pkgs: %s", self.dialog_handler.uninstall_pkgs)
             for item in self.dialog_handler.uninstall_pkgs:
-                try:
-                    unload_module(item)
-                    success = success and installer.uninstall(item, remove_tracking_file=True)
-                except Exception as e:
-                    self._log.error("_uninstall_items(): %s", e, exc_info=True)
-                    success = False
+                with tracer.span("uninstall", pkg=item) as span:
+                    try:
+                        unload_module(item)
+                        success = success and installer.uninstall(item, remove_tracking_file=True)
+                        if not success:
+                            span.fail()
+                    except Exception as e:
+                        self._log.error("_uninstall_items(): %s", e, exc_info=True)
+                        span.fail(str(e))
+                        success = False
             self.dialog_handler.uninstall_pkgs.clear()
+            StartupFingerprint().invalidate()
+            PipWorker().stop()
             return success
         except Exception as e:
             self._log.error("_uninstall_items(): %s", e, exc_info=True)
         finally:
             if progress:
                 progress.kill()
+            try:
+                Tracer().save()
+            except Exception as e:
+                self._log.error("_uninstall_items() Unable to save trace report: %s", e)
         return False
 
     # endregion Watch Action Thread
@@ -342,7 +359,7 @@ class CheckBoxUninstallListener(XPropertyChangeListener, unohelper.Base):
 
 
 class OptionsDialogUninstallHandler(DialogBase, XContainerWindowEventHandler, unohelper.Base):
-    IMPLE_NAME = f"{BasicConfig().lo_implementation_name}.OptUninstallPage"
+    IMPLE_NAME = UNINSTALL_IMPLE_NAME
     SERVICE_NAMES = (IMPLE_NAME,)
 
     def __init__(self, ctx: Any) -> None:  # noqa: ANN401
@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Any
-import tempfile
 import hashlib
+import tempfile
 import shutil
 from pathlib import Path
 
@@ -11,6 +11,7 @@ from ...oxt_logger import OxtLogger
 from ..download import Download
 from ..pip_installers.base_installer import BaseInstaller
 from ..progress import Progress
+from ..remote_zip import RemoteZip, RemoteZipError
 
 
 class BZ2Install(BaseInstaller):
@@ -59,13 +60,19 @@ class BZ2Install(BaseInstaller):
                 path_bz2 = Path(temp_dir)
 
                 url = str(bz_itm["url"])
+                bz_file = path_bz2 / "_bz2.pyd"
+                # the md5 is of the whole zip, only a pinned hash of _bz2.pyd allows extracting it alone.
+                pyd_sha256 = str(bz_itm.get("pyd_sha256", ""))
+                if pyd_sha256 and self.is_internet and self._extract_remote(url=url, dst=bz_file, sha256=pyd_sha256):
+                    self._copy_file(src=bz_file, dst=self._bz2_config.install_dir / "_bz2.pyd")
+                    return
+
                 filename = path_bz2 / "embedded_py.zip"
-                dl = Download()
-                data, _, err = dl.url_open(url, verify=False)
-                if err:
+                # md5 is computed while downloading
+                result = Download().download_file(url, filename, hash_name="md5", verify=False)
+                if result.err:
                     self._logger.error("Unable to download embedded python file")
                     return
-                dl.save_binary(pth=filename, data=data)
 
                 if filename.exists():
                     self._logger.info("embedded_py.zip file has been saved")
@@ -74,7 +81,7 @@ class BZ2Install(BaseInstaller):
                     return
 
                 if md5_str := str(bz_itm["md5"]):
-                    if not self._verify_file(filename=filename, md5_str=md5_str):
+                    if result.hexdigest != md5_str:
                         self._logger.error("MD5 verification failed")
                         return
                     else:
@@ -95,6 +102,38 @@ class BZ2Install(BaseInstaller):
                 self._logger.debug("Ending Progress Window")
                 progress.kill()
 
+    def _extract_remote(self, url: str, dst: Path, sha256: str) -> bool:
+        """
+        Extracts only ``_bz2.pyd`` from the remote embedded python zip using range requests.
+
+        The md5 of the whole zip can not be checked this way, the extracted ``_bz2.pyd`` is checked
+        against the pinned ``pyd_sha256`` of the bz2 config instead.
+
+        Args:
+            url (str): Url of the embedded python zip.
+            dst (Path): File ``_bz2.pyd`` is extracted to.
+            sha256 (str): Expected sha256 of ``_bz2.pyd``.
+
+        Returns:
+            bool: ``True`` if extracted and verified; Otherwise, ``False`` and the whole zip needs to be downloaded.
+        """
+        try:
+            with RemoteZip(url, verify=False) as rz:
+                rz.extract("_bz2.pyd", dst)
+            with open(dst, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            if digest != sha256.lower():
+                self._logger.error("SHA256 verification of extracted _bz2.pyd failed, downloading whole file")
+                dst.unlink()
+                return False
+            self._logger.info("_bz2.pyd has been extracted from remote embedded python file and verified")
+            return True
+        except (RemoteZipError, KeyError) as err:
+            self._logger.debug(f"Unable to extract _bz2.pyd from remote file, downloading whole file: {err}")
+        except Exception as err:
+            self._logger.error(f"Unable to extract _bz2.pyd from remote file: {err}", exc_info=True)
+        return False
+
     def _copy_file(self, src: Path, dst: Path) -> None:
         """Copy file"""
         try:
@@ -108,10 +147,6 @@ class BZ2Install(BaseInstaller):
             self._logger.error(f"Unable to copy file: {err}", exc_info=True)
             raise
 
-    def _verify_file(self, filename: Path, md5_str: str) -> bool:
-        result = hashlib.md5(open(filename, "rb").read()).hexdigest()
-        return result == md5_str
-
     def _unzip(self, filename: Path, dst: str | Path) -> None:
         """Unzip the downloaded wheel file"""
         # sourcery skip: raise-specific-error
@@ -0,0 +1,237 @@
+"""
+Index of the distributions installed on ``sys.path``.
+
+``importlib.metadata.version()`` searches every ``sys.path`` entry each time it is called.
+This index scans each entry once and keeps a map of normalized distribution name to version and dist-info path.
+Each entry is only scanned again when its modification time changes or when it is asked to be refreshed,
+such as after an install into it.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, NamedTuple, Tuple
+import os
+import re
+import sys
+import zipfile
+
+from ..meta.singleton import Singleton
+
+
+class DistInfo(NamedTuple):
+    """Installed distribution"""
+
+    name: str
+    """Normalized distribution name such as ``typing-extensions``"""
+    version: str
+    """Version such as ``4.12.2``"""
+    path: str
+    """Path to the dist-info or egg-info folder"""
+
+
+class DistributionIndex(metaclass=Singleton):
+    """One pass index of installed distributions keyed by normalized name."""
+
+    def __init__(self) -> None:
+        # entry -> (mtime_ns, {name: DistInfo})
+        self._entries: Dict[str, Tuple[int, Dict[str, DistInfo]]] = {}
+        self._sys_path: Tuple[str, ...] = ()
+        self._dists: Dict[str, DistInfo] = {}
+
+    # region Static Methods
+    @staticmethod
+    def canonical_name(name: str) -> str:
+        """
+        Gets a normalized distribution name such as ``typing-extensions`` for ``Typing_Extensions``.
+
+        Args:
+            name (str): Distribution name.
+
+        Returns:
+            str: Normalized name.
+        """
+        return re.sub(r"[-_.]+", "-", name).lower()
+
+    # endregion Static Methods
+
+    # region Scan
+    def _get_mtime(self, entry: str) -> int:
+        try:
+            return os.stat(entry or ".").st_mtime_ns
+        except OSError:
+            return -1
+
+    def _read_version(self, metadata: bytes) -> str:
+        for line in metadata.decode("utf-8", errors="replace").splitlines():
+            if not line:
+                # end of headers
+                break
+            if line.startswith("Version:"):
+                return line[8:].strip()
+        return ""
+
+    def _parse_info_name(self, info_name: str) -> Tuple[str, str]:
+        """
+        Gets the name and version from a folder name such as ``verr-1.1.2.dist-info``.
+
+        Returns:
+            Tuple[str, str]: Name and version. Version is empty if it is not part of the name.
+        """
+        stem = info_name.rsplit(".", 1)[0]
+        name, _, ver = stem.partition("-")
+        # egg-info names may also hold the python version such as ``verr-1.1.2-py3.11.egg-info``
+        return name, ver.split("-", 1)[0]
+
+    def _scan_dir(self, entry: str) -> Dict[str, DistInfo]:
+        results: Dict[str, DistInfo] = {}
+        try:
+            with os.scandir(entry) as it:
+                for item in it:
+                    if not item.name.endswith((".dist-info", ".egg-info")):
+                        continue
+                    name, ver = self._parse_info_name(item.name)
+                    if not ver:
+                        meta_name = "METADATA" if item.name.endswith(".dist-info") else "PKG-INFO"
+                        meta_path = os.path.join(item.path, meta_name) if item.is_dir() else item.path
+                        try:
+                            with open(meta_path, "rb") as f:
+                                ver = self._read_version(f.read())
+                        except OSError:
+                            continue
+                    c_name = self.canonical_name(name)
+                    if c_name not in results:
+                        results[c_name] = DistInfo(c_name, ver, item.path)
+        except OSError:
+            pass
+        return results
+
+    def _scan_zip(self, entry: str) -> Dict[str, DistInfo]:
+        results: Dict[str, DistInfo] = {}
+        try:
+            with zipfile.ZipFile(entry) as zf:
+                for zname in zf.namelist():
+                    parts = zname.split("/")
+                    if len(parts) < 2 or not parts[0].endswith((".dist-info", ".egg-info")):
+                        continue
+                    name, ver = self._parse_info_name(parts[0])
+                    c_name = self.canonical_name(name)
+                    if c_name in results:
+                        continue
+                    if not ver:
+                        if parts[1] not in ("METADATA", "PKG-INFO"):
+                            continue
+                        ver = self._read_version(zf.read(zname))
+                    results[c_name] = DistInfo(c_name, ver, os.path.join(entry, parts[0]))
+        except (OSError, zipfile.BadZipFile):
+            pass
+        return results
+
+    def _scan(self, entry: str) -> Dict[str, DistInfo]:
+        # an empty sys.path entry is the current directory
+        entry = entry or "."
+        if os.path.isdir(entry):
+            return self._scan_dir(entry)
+        if zipfile.is_zipfile(entry):
+            return self._scan_zip(entry)
+        return {}
+
+    def _update(self, entries: List[str], force: bool) -> None:
+        changed = False
+        for entry in entries:
+            mtime = self._get_mtime(entry)
+            cached = self._entries.get(entry)
+            if not force and cached is not None and cached[0] == mtime:
+                continue
+            self._entries[entry] = (mtime, self._scan(entry) if mtime >= 0 else {})
+            changed = True
+        current = tuple(sys.path)
+        if changed or current != self._sys_path:
+            self._sys_path = current
+            self._merge()
+
+    def _merge(self) -> None:
+        # first entry on sys.path wins, the same as importlib.metadata
+        dists: Dict[str, DistInfo] = {}
+        for entry in self._sys_path:
+            cached = self._entries.get(entry)
+            if cached is None:
+                continue
+            for name, info in cached[1].items():
+                if name not in dists:
+                    dists[name] = info
+        self._dists = dists
+
+    def _ensure(self) -> None:
+        current = tuple(sys.path)
+        if current == self._sys_path:
+            return
+        self._update([entry for entry in current if entry not in self._entries], force=False)
+
+    # endregion Scan
+
+    # region Methods
+    def refresh(self, *paths: str) -> None:
+        """
+        Updates the index after distributions have been installed or removed.
+
+        Args:
+            paths (str, optional): ``sys.path`` entries to scan again, such as the target directory of an install.
+                If omitted each entry whose modification time changed is scanned again.
+        """
+        if paths:
+            self._update([str(pth) for pth in paths], force=True)
+        else:
+            self._update(list(sys.path), force=False)
+
+    def clear(self) -> None:
+        """Clears the index. The next lookup scans every ``sys.path`` entry."""
+        self._entries.clear()
+        self._sys_path = ()
+        self._dists = {}
+
+    def get(self, name: str) -> DistInfo | None:
+        """
+        Gets an installed distribution.
+
+        Args:
+            name (str): Distribution name such as ``verr``.
+
+        Returns:
+            DistInfo | None: The distribution if installed; Otherwise, ``None``.
+        """
+        self._ensure()
+        return self._dists.get(self.canonical_name(name))
+
+    def get_version(self, name: str) -> str:
+        """
+        Gets the version of an installed distribution.
+
+        Args:
+            name (str): Distribution name such as ``verr``.
+
+        Returns:
+            str: The version of the distribution or an empty string if the distribution is not installed.
+        """
+        info = self.get(name)
+        return info.version if info else ""
+
+    def get_path(self, name: str) -> str:
+        """
+        Gets the dist-info path of an installed distribution.
+
+        Args:
+            name (str): Distribution name such as ``verr``.
+
+        Returns:
+            str: The dist-info path or an empty string if the distribution is not installed.
+        """
+        info = self.get(name)
+        return info.path if info else ""
+
+    # endregion Methods
+
+    def __contains__(self, name: str) -> bool:
+        return self.get(name) is not None
+
+    def __len__(self) -> int:
+        self._ensure()
+        return len(self._dists)
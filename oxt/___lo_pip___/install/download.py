@@ -1,7 +1,11 @@
 from __future__ import annotations
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, NamedTuple, Tuple
 import ssl
 import json
+import hashlib
+import os
+import re
+from http.client import HTTPException
 from pathlib import Path
 from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
@@ -10,6 +14,23 @@ from urllib.error import URLError, HTTPError
 from ..meta.singleton import Singleton
 from ..oxt_logger import OxtLogger
 from ..config import Config
+from .internet_probe import InternetProbe
+
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-\d+/(\d+|\*)")
+
+
+class DownloadResult(NamedTuple):
+    """Result of ``Download.download_file()``"""
+
+    path: Path
+    """Downloaded file"""
+    size: int
+    """Number of bytes downloaded"""
+    hexdigest: str
+    """Hash of the downloaded file, empty if no hash was requested"""
+    err: str
+    """Error message, empty on success"""
 
 
 class Download(metaclass=Singleton):
@@ -17,6 +38,7 @@ class Download(metaclass=Singleton):
 
     def __init__(self) -> None:
         self._logger = OxtLogger(log_name=__name__)
+        self._timeout = 30.0
 
     def url_open(
         self,
@@ -74,6 +96,128 @@ class Download(metaclass=Singleton):
 
         return result, headers, err
 
+    def _open_stream(self, url: str, start: int, validator: str, verify: bool) -> Any:  # noqa: ANN401
+        req = Request(url)
+        if start > 0:
+            req.add_header("Range", f"bytes={start}-")
+            if validator:
+                # server sends the whole file again if it changed since the first request
+                req.add_header("If-Range", validator)
+        if verify:
+            return urlopen(req, timeout=self._timeout)
+        context = ssl._create_unverified_context()
+        return urlopen(req, timeout=self._timeout, context=context)
+
+    def _get_progress_logger(self, name: str) -> Callable[[int, int], None]:
+        next_pct = [10]
+
+        def log_progress(written: int, total: int) -> None:
+            if total <= 0:
+                return
+            pct = written * 100 // total
+            if pct >= next_pct[0]:
+                self._logger.debug("Downloading %s %i%% (%i of %i bytes)", name, pct, written, total)
+                next_pct[0] = pct - pct % 10 + 10
+
+        return log_progress
+
+    def download_file(
+        self,
+        url: str,
+        dst: Path | str,
+        hash_name: str = "sha256",
+        verify: bool = True,
+        on_progress: Callable[[int, int], None] | None = None,
+        chunk_size: int = 64 * 1024,
+        retries: int = 3,
+    ) -> DownloadResult:
+        """
+        Downloads a file from url to ``dst`` in chunks.
+
+        The file is written to ``dst`` with a ``.part`` suffix and renamed when the download is complete.
+        The hash is updated as each chunk is written so the file does not need to be read again to verify it.
+        If the connection drops the download is resumed with a HTTP ``Range`` request when the server supports it;
+        Otherwise, it starts over.
+
+        Args:
+            url (str): Url to download.
+            dst (Path | str): File to save to.
+            hash_name (str, optional): Name of a ``hashlib`` hash such as ``sha256`` or ``md5``. Empty for no hash. Defaults to ``sha256``.
+            verify (bool, optional): Verify ssl. Defaults to True.
+            on_progress (Callable[[int, int], None], optional): Called after each chunk with the bytes downloaded and the total bytes. Total is ``0`` when not known.
+                Defaults to logging every 10 percent.
+            chunk_size (int, optional): Bytes read per chunk. Defaults to 64 KiB.
+            retries (int, optional): Number of times a dropped download is resumed. Defaults to 3.
+
+        Returns:
+            DownloadResult: Result. On failure ``err`` is set and ``dst`` is not created.
+        """
+        dst = Path(dst)
+        if not self.is_internet:
+            err = "No internet connection!"
+            self._logger.error(err)
+            return DownloadResult(dst, 0, "", err)
+
+        if on_progress is None:
+            on_progress = self._get_progress_logger(dst.name)
+        part = dst.with_name(f"{dst.name}.part")
+        hasher = hashlib.new(hash_name) if hash_name else None
+        written = 0
+        total = 0
+        validator = ""
+        err = ""
+        attempt = 0
+        with open(part, "wb") as f:
+            while True:
+                try:
+                    with self._open_stream(url, written, validator, verify) as response:
+                        status = getattr(response, "status", 200)
+                        headers = response.headers
+                        if written > 0 and status == 206:
+                            match = _CONTENT_RANGE.match(headers.get("Content-Range", ""))
+                            if match is None or int(match.group(1)) != written:
+                                raise URLError("Unexpected Content-Range")
+                            self._logger.debug("download_file() Resuming %s at %i bytes", url, written)
+                        elif written > 0:
+                            # range not supported or file changed, start over
+                            self._logger.debug("download_file() Server did not resume, starting over: %s", url)
+                            f.seek(0)
+                            f.truncate()
+                            written = 0
+                            hasher = hashlib.new(hash_name) if hash_name else None
+                        if written == 0:
+                            total = int(headers.get("Content-Length", 0) or 0)
+                            validator = headers.get("ETag") or headers.get("Last-Modified") or ""
+                        while True:
+                            chunk = response.read(chunk_size)
+                            if not chunk:
+                                break
+                            f.write(chunk)
+                            if hasher is not None:
+                                hasher.update(chunk)
+                            written += len(chunk)
+                            on_progress(written, total)
+                    if total and written < total:
+                        raise URLError(f"Connection closed after {written} of {total} bytes")
+                    break
+                except HTTPError as e:
+                    self._logger.error(e)
+                    err = str(e)
+                    break
+                except (URLError, OSError, HTTPException) as e:
+                    reason = str(getattr(e, "reason", e))
+                    attempt += 1
+                    if attempt > retries:
+                        self._logger.error(reason)
+                        err = reason
+                        break
+                    self._logger.debug("download_file() %s, retry %i of %i", reason, attempt, retries)
+        if err:
+            part.unlink(missing_ok=True)
+            return DownloadResult(dst, written, "", err)
+        os.replace(part, dst)
+        return DownloadResult(dst, written, "" if hasher is None else hasher.hexdigest(), "")
+
     def save_binary(self, pth: Path | str, data: Any) -> bool:
         """
         Save binary data to file
@@ -119,9 +263,13 @@ class Download(metaclass=Singleton):
 
     @property
     def is_internet(self) -> bool:
-        """Gets if there is an internet connection."""
+        """
+        Gets if there is an internet connection.
+
+        Waits for ``InternetProbe`` if the check is still running in the background.
+        """
         try:
             return self._is_internet
         except AttributeError:
-            self._is_internet = self.check_internet_connection()
+            self._is_internet = InternetProbe().wait()
             return self._is_internet
@@ -0,0 +1,186 @@
+"""
+Inter-process lock that lets only one extension install at a time.
+
+Every extension built from this template uses the same lock file in the LibreOffice user profile,
+so installs are serialized across extensions and across processes that share the profile.
+A waiting extension blocks in the operating system until the lock is released instead of polling.
+A wait with a timeout polls the lock on Linux and Mac, ``flock()`` has no timeout.
+The lock is released by the operating system if the process that holds it ends.
+"""
+
+from __future__ import annotations
+from typing import Any
+from pathlib import Path
+import os
+import time
+
+if os.name == "nt":
+    import ctypes
+    from ctypes import wintypes
+
+    _WAIT_OBJECT_0 = 0x00000000
+    _WAIT_ABANDONED = 0x00000080
+    _WAIT_TIMEOUT = 0x00000102
+    _INFINITE = 0xFFFFFFFF
+else:
+    import fcntl
+
+_POLL_INTERVAL = 0.05
+
+
+class InstallLock:
+    """
+    Inter-process install lock.
+
+    Uses ``fcntl.flock()`` on a lock file on Linux and Mac, and a named mutex on Windows.
+    Must be released by the thread that acquired it.
+    """
+
+    def __init__(self, lock_file: str | Path) -> None:
+        """
+        Constructor
+
+        Args:
+            lock_file (str | Path): Lock file such as ``<user profile>/ooopip_install.lock``.
+                On Windows the file name is used to name the mutex.
+        """
+        self._lock_file = Path(lock_file)
+        self._fd = -1
+        self._mutex: Any = None
+        self._waited = False
+        self._wait_time = 0.0
+
+    # region Methods
+    def _acquire_posix(self, blocking: bool, timeout: float) -> bool:
+        self._lock_file.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self._lock_file, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                if not blocking:
+                    os.close(fd)
+                    return False
+                self._waited = True
+                start = time.perf_counter()
+                if timeout < 0:
+                    # sleeps until the holder releases the lock
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                elif not self._poll_posix(fd, start + timeout):
+                    self._wait_time = time.perf_counter() - start
+                    os.close(fd)
+                    return False
+                self._wait_time = time.perf_counter() - start
+        except Exception:
+            os.close(fd)
+            raise
+        self._fd = fd
+        return True
+
+    def _poll_posix(self, fd: int, deadline: float) -> bool:
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return False
+            time.sleep(min(_POLL_INTERVAL, remaining))
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return True
+            except BlockingIOError:
+                continue
+
+    def _acquire_win(self, blocking: bool, timeout: float) -> bool:
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+        kernel32.CreateMutexW.restype = wintypes.HANDLE
+        kernel32.CreateMutexW.argtypes = (wintypes.LPVOID, wintypes.BOOL, wintypes.LPCWSTR)
+        kernel32.WaitForSingleObject.argtypes = (wintypes.HANDLE, wintypes.DWORD)
+        kernel32.WaitForSingleObject.restype = wintypes.DWORD
+        name = "Local\\" + self._lock_file.name.replace("\\", "_")
+        mutex = kernel32.CreateMutexW(None, False, name)
+        if not mutex:
+            raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+        result = kernel32.WaitForSingleObject(mutex, 0)
+        if result not in (_WAIT_OBJECT_0, _WAIT_ABANDONED):
+            if not blocking:
+                kernel32.CloseHandle(mutex)
+                return False
+            self._waited = True
+            start = time.perf_counter()
+            # sleeps until the holder releases the mutex, an abandoned mutex is acquired.
+            result = kernel32.WaitForSingleObject(mutex, _INFINITE if timeout < 0 else int(timeout * 1000))
+            self._wait_time = time.perf_counter() - start
+            if result == _WAIT_TIMEOUT:
+                kernel32.CloseHandle(mutex)
+                return False
+            if result not in (_WAIT_OBJECT_0, _WAIT_ABANDONED):
+                kernel32.CloseHandle(mutex)
+                raise ctypes.WinError(ctypes.get_last_error())  # type: ignore[attr-defined]
+        self._mutex = mutex
+        return True
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        """
+        Acquires the lock.
+
+        Args:
+            blocking (bool, optional): Wait for the lock if it is held. Defaults to True.
+            timeout (float, optional): Seconds to wait when ``blocking``, a negative value waits forever. Defaults to -1.
+
+        Returns:
+            bool: ``True`` if the lock was acquired; Otherwise, ``False``.
+        """
+        if self.is_locked:
+            raise RuntimeError("InstallLock is already acquired.")
+        self._waited = False
+        self._wait_time = 0.0
+        if os.name == "nt":
+            return self._acquire_win(blocking, timeout)
+        return self._acquire_posix(blocking, timeout)
+
+    def release(self) -> None:
+        """Releases the lock, waking the next waiting extension."""
+        if self._fd >= 0:
+            try:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            finally:
+                os.close(self._fd)
+                self._fd = -1
+        if self._mutex is not None:
+            kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore[attr-defined]
+            try:
+                kernel32.ReleaseMutex(self._mutex)
+            finally:
+                kernel32.CloseHandle(self._mutex)
+                self._mutex = None
+
+    def __enter__(self) -> InstallLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: Any) -> None:  # noqa: ANN401
+        self.release()
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def is_locked(self) -> bool:
+        """Gets if this instance holds the lock."""
+        return self._fd >= 0 or self._mutex is not None
+
+    @property
+    def waited(self) -> bool:
+        """Gets if the last ``acquire()`` had to wait for another install to finish."""
+        return self._waited
+
+    @property
+    def wait_time(self) -> float:
+        """Gets the seconds the last ``acquire()`` waited."""
+        return self._wait_time
+
+    @property
+    def lock_file(self) -> Path:
+        """Gets the lock file."""
+        return self._lock_file
+
+    # endregion Properties
@@ -7,6 +7,8 @@ from typing import Any, Dict
 from ..config import Config
 from ..oxt_logger import OxtLogger
 from .download import Download
+from .pip_worker.pip_worker import PipWorker
+from .pip_detect import PipDetect
 
 from .pip_installers.base_installer import STARTUP_INFO
 
@@ -54,15 +56,27 @@ class InstallPip:
 
     def is_pip_installed(self) -> bool:
         """Check if PIP is installed."""
+        env = self._get_env()
+        return PipDetect().is_installed(
+            python=str(self._config.python_path), env=env, fallback=lambda: self._is_pip_installed_process(env)
+        )
+
+    def _is_pip_installed_process(self, env: Dict[str, str]) -> bool:
+        """Check if PIP is installed by running python."""
         # cmd = self._cmd_pip("--version")
         # cmd = '"{}" -m pip -V'.format(self.path_python)
+        worker = PipWorker()
+        if worker.enabled:
+            installed = worker.is_pip_installed(str(self._config.python_path), env)
+            if installed is not None:
+                return installed
         cmd = [str(self._config.python_path), "-m", "pip", "-V"]
         if STARTUP_INFO:
             result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, startupinfo=STARTUP_INFO
             )
         else:
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
         return result.returncode == 0
 
     @property
@@ -52,12 +52,10 @@ class InstallPipFromWheel:
 
             filename = path_pip / "pip-wheel.whl"
 
-            dl = Download()
-            data, _, err = dl.url_open(url, verify=False)
-            if err:
+            result = Download().download_file(url, filename, verify=False)
+            if result.err:
                 self._logger.error("Unable to download PIP installation wheel file")
                 return
-            dl.save_binary(pth=filename, data=data)
 
             if filename.exists():
                 self._logger.info("PIP wheel file has been saved")
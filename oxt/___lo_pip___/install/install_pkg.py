@@ -4,11 +4,11 @@ import os
 import subprocess
 from typing import Any, Dict
 from pathlib import Path
-from importlib.metadata import PackageNotFoundError, version
 
 from ..config import Config
 from ..ver.rules.ver_rules import VerRules
 from ..oxt_logger import OxtLogger
+from .distribution_index import DistributionIndex
 
 
 # https://docs.python.org/3.8/library/importlib.metadata.html#module-importlib.metadata
@@ -192,7 +192,4 @@ class InstallPkg:
         Returns:
             str: The version of the package or an empty string if the package is not installed.
         """
-        try:
-            return version(package_name)
-        except PackageNotFoundError:
-            return ""
+        return DistributionIndex().get_version(package_name)
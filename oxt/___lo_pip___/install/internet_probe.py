@@ -0,0 +1,205 @@
+"""
+Background check for an internet connection.
+
+The check is started while the requirements are being checked so that, when an install is needed,
+the result is usually already known. Several hosts are checked at the same time and the first one that
+answers decides the result. The result is cached in the LibreOffice user profile for
+``Config().internet_probe_ttl`` seconds so starting LibreOffice again does not check again.
+"""
+
+from __future__ import annotations
+from typing import Any, Callable, Dict, List
+from pathlib import Path
+import json
+import os
+import socket
+import ssl
+import tempfile
+import threading
+import time
+from urllib.request import Request, urlopen
+
+from ..config import Config
+from ..input_output import file_util
+from ..meta.singleton import Singleton
+from ..oxt_logger import OxtLogger
+
+
+class InternetProbe(metaclass=Singleton):
+    """Singleton class. Checks for an internet connection on a background thread."""
+
+    def __init__(self) -> None:
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._config = Config()
+        self._timeout = 5.0
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._result = False
+        self._saved = False
+        self._cache_file = Path(
+            file_util.get_user_profile_path(True),
+            f"{self._config.lo_implementation_name}_internet.json",
+        )
+
+    # region Methods
+    def _read_cache(self) -> bool | None:
+        ttl = self._config.internet_probe_ttl
+        if ttl <= 0:
+            return None
+        try:
+            with open(self._cache_file, "r", encoding="utf-8") as f:
+                data: Dict[str, Any] = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            age = time.time() - float(data["time"])
+            if age < 0 or age > ttl:
+                return None
+            return bool(data["online"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _write_cache(self, online: bool) -> None:
+        if self._config.internet_probe_ttl <= 0:
+            return
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self._cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"online": online, "time": time.time()}, f)
+            os.replace(tmp, self._cache_file)
+        except OSError as e:
+            self._log.error("_write_cache() Unable to save internet check result: %s", e)
+
+    def _check_host(self, host: str) -> bool:
+        try:
+            with socket.create_connection((host, 443), timeout=self._timeout):
+                return True
+        except OSError:
+            return False
+
+    def _check_url(self, url: str) -> bool:
+        # the url check goes through any configured proxy, where a direct connection to a host may be blocked.
+        try:
+            req = Request(url, method="HEAD")
+            if url.startswith("https"):
+                context = ssl._create_unverified_context()
+                urlopen(req, timeout=self._timeout, context=context).close()
+            else:
+                urlopen(req, timeout=self._timeout).close()
+            return True
+        except Exception:
+            return False
+
+    def _get_checks(self) -> List[Callable[[], bool]]:
+        checks: List[Callable[[], bool]] = []
+        url = self._config.test_internet_url
+        if url:
+            checks.append(lambda: self._check_url(url))
+        for host in self._config.internet_probe_hosts:
+            checks.append(lambda host=host: self._check_host(host))
+        return checks
+
+    def _set_result(self, online: bool) -> None:
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._result = online
+            self._done.set()
+
+    def _probe(self) -> None:
+        checks = self._get_checks()
+        if not checks:
+            self._log.debug("_probe() No url or hosts to check.")
+            self._set_result(False)
+            return
+        remaining = [len(checks)]
+
+        def run(check: Callable[[], bool]) -> None:
+            online = check()
+            with self._lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if online or last:
+                self._set_result(online)
+
+        start = time.perf_counter()
+        for check in checks:
+            threading.Thread(target=run, args=(check,), daemon=True).start()
+        self._done.wait()
+        self._log.debug("_probe() Internet: %s, checked in %.3fs", self._result, time.perf_counter() - start)
+
+    def start(self) -> None:
+        """
+        Starts checking for an internet connection in the background.
+
+        If a cached result is still valid then no check is started.
+        Calling this method more than once does nothing.
+        """
+        with self._lock:
+            if self._thread is not None or self._done.is_set():
+                return
+            cached = self._read_cache()
+            if cached is not None:
+                self._log.debug("start() Using cached internet check result: %s", cached)
+                self._result = cached
+                self._done.set()
+                return
+            self._thread = threading.Thread(target=self._probe, name="InternetProbe", daemon=True)
+            self._thread.start()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Gets if there is an internet connection, waiting for the check to finish.
+
+        The check is started if it has not been started yet.
+
+        Args:
+            timeout (float, optional): Max seconds to wait. Defaults to waiting until the check is done.
+
+        Returns:
+            bool: ``True`` if there is an internet connection; Otherwise, ``False``.
+            ``False`` is also returned if the check is not done before ``timeout``.
+        """
+        self.start()
+        if not self._done.wait(timeout):
+            self._log.debug("wait() Timed out waiting for internet check.")
+            return False
+        with self._lock:
+            # only save a result that was checked, not one read from the cache.
+            save = self._thread is not None and not self._saved
+            self._saved = True
+        if save:
+            self._write_cache(self._result)
+        return self._result
+
+    def invalidate(self) -> None:
+        """Removes the cached result so the next check is done again."""
+        with self._lock:
+            if self._thread is not None and not self._done.is_set():
+                return
+            self._thread = None
+            self._done.clear()
+            self._result = False
+            self._saved = False
+        try:
+            if self._cache_file.exists():
+                self._cache_file.unlink()
+        except OSError as e:
+            self._log.error("invalidate() Unable to remove internet check result: %s", e)
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def cache_file(self) -> Path:
+        """Gets the cache file path."""
+        return self._cache_file
+
+    @property
+    def is_done(self) -> bool:
+        """Gets if the check is done."""
+        return self._done.is_set()
+
+    # endregion Properties
@@ -0,0 +1,100 @@
+"""
+Detects if pip is installed without starting python when possible.
+
+The python that runs pip gets ``PYTHONPATH`` set to the paths of this process, see ``_get_env()`` of the installers.
+When pip is found on those paths with ``importlib.machinery.PathFinder`` then the target python can import it too.
+A positive result is cached for the python executable and the modification time of the pip ``dist-info`` folder,
+so installing, upgrading or removing pip is noticed. When pip is not found on those paths it may still be in the
+site-packages of the target python, so the caller checks by running python.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict, Iterable, List, Tuple
+from importlib.machinery import PathFinder
+from pathlib import Path
+import os
+import time
+
+from ..meta.singleton import Singleton
+from ..oxt_logger import OxtLogger
+
+
+class PipDetect(metaclass=Singleton):
+    """Singleton Class. Cached detection of pip."""
+
+    def __init__(self) -> None:
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        # python path -> (dist-info path, mtime_ns)
+        self._cache: Dict[str, Tuple[str, int]] = {}
+
+    # region Methods
+    def _get_mtime(self, pth: str) -> int:
+        try:
+            return os.stat(pth).st_mtime_ns
+        except OSError:
+            return -1
+
+    def _find_dist_info(self, pip_dir: Path) -> str:
+        for dist_info in pip_dir.parent.glob("pip-*.dist-info"):
+            return str(dist_info)
+        return ""
+
+    def find_pip(self, paths: Iterable[str]) -> str:
+        """
+        Finds the pip ``dist-info`` folder on paths without importing pip.
+
+        Args:
+            paths (Iterable[str]): Paths to search such as ``PYTHONPATH`` entries.
+
+        Returns:
+            str: Path of the pip ``dist-info`` folder if pip is found; Otherwise, empty string.
+        """
+        search: List[str] = [pth for pth in paths if pth]
+        spec = PathFinder.find_spec("pip", search)
+        if spec is None or not spec.submodule_search_locations:
+            return ""
+        pip_dir = Path(list(spec.submodule_search_locations)[0])
+        return self._find_dist_info(pip_dir)
+
+    def is_installed(self, python: str, env: Dict[str, str], fallback: Callable[[], bool]) -> bool:
+        """
+        Gets if pip is installed for a python executable.
+
+        Args:
+            python (str): Python executable that runs pip.
+            env (Dict[str, str]): Environment python is run with, ``PYTHONPATH`` is searched for pip.
+            fallback (Callable[[], bool]): Called when pip is not found on ``PYTHONPATH``, such as running ``python -m pip -V``.
+
+        Returns:
+            bool: ``True`` if pip is installed; Otherwise, ``False``.
+        """
+        key = os.path.realpath(python)
+        cached = self._cache.get(key)
+        if cached is not None:
+            dist_info, mtime = cached
+            if self._get_mtime(dist_info) == mtime:
+                self._log.debug("is_installed() pip found in cache: %s", dist_info)
+                return True
+            del self._cache[key]
+
+        start = time.perf_counter()
+        dist_info = self.find_pip(env.get("PYTHONPATH", "").split(os.pathsep))
+        self._log.debug(
+            "is_installed() find_spec: %s in %.4f seconds", bool(dist_info), time.perf_counter() - start
+        )
+        if dist_info:
+            mtime = self._get_mtime(dist_info)
+            if mtime >= 0:
+                self._cache[key] = (dist_info, mtime)
+            return True
+
+        start = time.perf_counter()
+        result = fallback()
+        self._log.debug("is_installed() subprocess: %s in %.3f seconds", result, time.perf_counter() - start)
+        return result
+
+    def clear(self) -> None:
+        """Clears the cached results."""
+        self._cache.clear()
+
+    # endregion Methods
@@ -11,6 +11,8 @@ from typing import Any, List, Dict
 from ...config import Config
 from ...oxt_logger import OxtLogger
 from ..download import Download
+from ..pip_worker.pip_worker import PipWorker
+from ..pip_detect import PipDetect
 from ...lo_util.resource_resolver import ResourceResolver
 
 IS_WIN = platform.system() == "Windows"
@@ -135,11 +137,15 @@ class BaseInstaller:
             cmd = self._cmd_pip(*[*cmd, "-r", f"{path}"])
             msg = "Install - Installing requirements success!"
             err_msg = "Install - Installing requirements failed!"
-        if STARTUP_INFO:
+        process = None
+        worker = PipWorker()
+        if worker.enabled:
+            process = worker.run(str(self.path_python), cmd[3:], self._get_env())
+        if process is None and STARTUP_INFO:
             process = subprocess.run(
                 cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
             )  # noqa: E501
-        else:
+        elif process is None:
             process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
         if process.returncode == 0:
             self._logger.info(msg)
@@ -149,15 +155,27 @@ class BaseInstaller:
 
     def is_pip_installed(self) -> bool:
         """Check if PIP is installed."""
+        env = self._get_env()
+        return PipDetect().is_installed(
+            python=str(self.path_python), env=env, fallback=lambda: self._is_pip_installed_process(env)
+        )
+
+    def _is_pip_installed_process(self, env: Dict[str, str]) -> bool:
+        """Check if PIP is installed by running python."""
         # cmd = self._cmd_pip("--version")
         # cmd = '"{}" -m pip -V'.format(self.path_python)
+        worker = PipWorker()
+        if worker.enabled:
+            installed = worker.is_pip_installed(str(self.path_python), env)
+            if installed is not None:
+                return installed
         cmd = [str(self.path_python), "-m", "pip", "-V"]
         if STARTUP_INFO:
             result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env(), startupinfo=STARTUP_INFO
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env, startupinfo=STARTUP_INFO
             )
         else:
-            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=self._get_env())
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
         return result.returncode == 0
 
     @property
@@ -41,12 +41,10 @@ class DefaultInstaller(BaseInstaller):
 
                 url = cfg.url_pip
                 filename = path_pip / "get-pip.py"
-                dl = Download()
-                data, _, err = dl.url_open(url, verify=False)
-                if err:
+                result = Download().download_file(url, filename, verify=False)
+                if result.err:
                     self._logger.error("Unable to download PIP installation file")
                     return
-                dl.save_binary(pth=filename, data=data)
 
                 if filename.exists():
                     self._logger.info("PIP installation file has been saved")
@@ -0,0 +1,205 @@
+"""
+Client of the long lived pip process, see ``worker.py``.
+
+Starting python and importing pip takes about a second. When ``Config().pip_worker`` is ``True``
+the installers send their pip commands to one process that is started once and keeps pip imported.
+A worker that does not answer in time is killed and the command is run in a new process.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List
+from pathlib import Path
+import atexit
+import json
+import os
+import re
+import subprocess
+import threading
+
+from ...config import Config
+from ...meta.singleton import Singleton
+from ...oxt_logger import OxtLogger
+
+# https://stackoverflow.com/search?q=%5Bpython%5D+run+subprocess+without+popup+terminal
+# silent subprocess
+if os.name == "nt":
+    STARTUP_INFO = subprocess.STARTUPINFO()
+    STARTUP_INFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+else:
+    STARTUP_INFO = None
+
+# commands that change pip itself must not run in the process that has pip imported.
+_PIP_REQ = re.compile(r"^pip(?![\w.-])", re.IGNORECASE)
+
+
+class PipWorker(metaclass=Singleton):
+    """Singleton Class. Runs pip commands in a long lived python process."""
+
+    def __init__(self) -> None:
+        self._config = Config()
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._proc: subprocess.Popen | None = None
+        self._python = ""
+        self._env: Dict[str, str] = {}
+        self._request_id = 0
+        self._timeout = 600.0
+        self._script = Path(__file__).parent / "worker.py"
+        atexit.register(self.stop)
+
+    # region Methods
+    def _start(self, python: str, env: Dict[str, str]) -> subprocess.Popen:
+        if self._proc is not None and self._proc.poll() is None:
+            if self._python == python and self._env.get("PYTHONPATH") == env.get("PYTHONPATH"):
+                return self._proc
+            self._log.debug("_start() Python or PYTHONPATH changed, restarting pip worker.")
+            self._stop()
+        self._log.debug("_start() Starting pip worker: %s", python)
+        self._proc = subprocess.Popen(
+            [python, "-u", str(self._script)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            encoding="utf-8",
+            errors="replace",
+            text=True,
+            env=env,
+            startupinfo=STARTUP_INFO,
+        )
+        self._python = python
+        self._env = env
+        return self._proc
+
+    def _stop(self) -> None:
+        proc = self._proc
+        self._proc = None
+        if proc is None:
+            return
+        try:
+            if proc.poll() is None and proc.stdin is not None:
+                proc.stdin.write(json.dumps({"op": "exit"}) + "\n")
+                proc.stdin.flush()
+                proc.wait(5)
+        except Exception:
+            proc.kill()
+            proc.wait()
+        finally:
+            for stream in (proc.stdin, proc.stdout):
+                if stream is not None:
+                    stream.close()
+
+    def _read_line(self, proc: subprocess.Popen) -> str | None:
+        # readline() has no timeout, read in a thread so a wedged worker can not hold the install lock.
+        lines: List[str] = []
+        done = threading.Event()
+
+        def read() -> None:
+            try:
+                lines.append(proc.stdout.readline())  # type: ignore[union-attr]
+            except Exception:
+                lines.append("")
+            finally:
+                done.set()
+
+        threading.Thread(target=read, name="pip_worker_read", daemon=True).start()
+        if not done.wait(self._timeout):
+            return None
+        return lines[0]
+
+    def _request(self, python: str, env: Dict[str, str], request: Dict[str, Any]) -> Dict[str, Any] | None:
+        with self._lock:
+            try:
+                proc = self._start(python, env)
+                self._request_id += 1
+                request["id"] = self._request_id
+                assert proc.stdin is not None and proc.stdout is not None
+                proc.stdin.write(json.dumps(request) + "\n")
+                proc.stdin.flush()
+                line = self._read_line(proc)
+                if line is None:
+                    proc.kill()
+                    proc.wait()
+                    raise TimeoutError(f"pip worker did not answer in {self._timeout} seconds")
+                if not line:
+                    raise EOFError("pip worker ended")
+                response = json.loads(line)
+                if response.get("id") != request["id"]:
+                    raise ValueError("pip worker response does not match request")
+                return response
+            except Exception as e:
+                self._log.error("_request() pip worker failed, falling back to a new process: %s", e)
+                self._stop()
+                return None
+
+    def can_run(self, args: List[str]) -> bool:
+        """
+        Gets if pip arguments can be run by the worker.
+
+        Args:
+            args (List[str]): pip arguments such as ``["install", "verr>=1.1.2"]``.
+
+        Returns:
+            bool: ``False`` if the command installs or removes pip itself; Otherwise, ``True``.
+        """
+        return not any(_PIP_REQ.match(arg) for arg in args[1:])
+
+    def run(self, python: str, args: List[str], env: Dict[str, str]) -> subprocess.CompletedProcess | None:
+        """
+        Runs a pip command in the worker.
+
+        Args:
+            python (str): Python executable to run the worker with.
+            args (List[str]): pip arguments such as ``["install", "verr>=1.1.2"]``.
+            env (Dict[str, str]): Environment of the worker, the worker is restarted if ``PYTHONPATH`` changes.
+
+        Returns:
+            subprocess.CompletedProcess | None: Result the same as ``subprocess.run()`` would give,
+            or ``None`` if the worker is not usable and the command must be run in a new process.
+        """
+        if not self.can_run(args):
+            return None
+        response = self._request(python, env, {"op": "pip", "args": args})
+        if response is None:
+            return None
+        return subprocess.CompletedProcess(
+            args=[python, "-m", "pip", *args],
+            returncode=int(response.get("returncode", 1)),
+            stdout=str(response.get("stdout", "")),
+            stderr=str(response.get("stderr", "")),
+        )
+
+    def is_pip_installed(self, python: str, env: Dict[str, str]) -> bool | None:
+        """
+        Gets if pip can be imported by the worker.
+
+        Args:
+            python (str): Python executable to run the worker with.
+            env (Dict[str, str]): Environment of the worker.
+
+        Returns:
+            bool | None: ``True`` if pip is installed, ``False`` if not, ``None`` if the worker is not usable.
+        """
+        response = self._request(python, env, {"op": "version"})
+        if response is None:
+            return None
+        return response.get("returncode") == 0
+
+    def stop(self) -> None:
+        """Ends the worker process if it is running."""
+        with self._lock:
+            self._stop()
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def enabled(self) -> bool:
+        """Gets if the worker is enabled by ``Config().pip_worker``."""
+        return self._config.pip_worker
+
+    @property
+    def is_running(self) -> bool:
+        """Gets if the worker process is running."""
+        return self._proc is not None and self._proc.poll() is None
+
+    # endregion Properties
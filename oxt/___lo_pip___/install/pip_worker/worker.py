@@ -0,0 +1,91 @@
+"""
+Long lived pip process.
+
+This file is run as a script by ``PipWorker`` with the python of LibreOffice, it does not import ``___lo_pip___``.
+Requests are read from stdin and responses are written to stdout, one json object per line.
+
+Requests:
+
+- ``{"op": "version"}`` responds with ``{"returncode": 0, "stdout": "pip 24.0 from ..."}``
+- ``{"op": "pip", "args": ["install", "verr>=1.1.2"]}`` runs pip in this process and responds with
+  ``{"returncode": 0, "stdout": "...", "stderr": "..."}``. Any pip command can be run such as ``uninstall`` or ``list``.
+- ``{"op": "exit"}`` ends the process.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List
+import contextlib
+import importlib
+import io
+import json
+import os
+import sys
+
+
+def _import_pip() -> Any:  # noqa: ANN401
+    # pip may have been installed after this process started.
+    importlib.invalidate_caches()
+    return importlib.import_module("pip")
+
+
+def _version() -> Dict[str, Any]:
+    try:
+        pip = _import_pip()
+    except ImportError as e:
+        return {"returncode": 1, "stdout": "", "stderr": str(e)}
+    pip_dir = os.path.dirname(pip.__file__)
+    ver = f"{sys.version_info.major}.{sys.version_info.minor}"
+    return {"returncode": 0, "stdout": f"pip {pip.__version__} from {pip_dir} (python {ver})\n", "stderr": ""}
+
+
+def _run_pip(args: List[str]) -> Dict[str, Any]:
+    try:
+        _import_pip()
+        from pip._internal.cli.main import main as pip_main
+    except ImportError as e:
+        return {"returncode": 1, "stdout": "", "stderr": str(e)}
+    out = io.StringIO()
+    err = io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            returncode = pip_main(args)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else 1
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}", file=sys.stderr)
+            returncode = 1
+    # installed and removed distributions must be seen by the next request.
+    importlib.invalidate_caches()
+    return {"returncode": returncode or 0, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def main() -> int:
+    # keep the real stdout for responses, anything else that writes to stdout, such as a build backend, goes to stderr.
+    response_out = os.fdopen(os.dup(sys.stdout.fileno()), "w", encoding="utf-8")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {"returncode": 1, "stdout": "", "stderr": f"Invalid request: {e}"}
+        else:
+            op = request.get("op")
+            if op == "exit":
+                break
+            if op == "version":
+                response = _version()
+            elif op == "pip":
+                response = _run_pip([str(arg) for arg in request.get("args", [])])
+            else:
+                response = {"returncode": 1, "stdout": "", "stderr": f"Unknown op: {op}"}
+            response["id"] = request.get("id")
+        response_out.write(json.dumps(response) + "\n")
+        response_out.flush()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
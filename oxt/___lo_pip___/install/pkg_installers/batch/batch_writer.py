@@ -1,7 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import List
+from ..pkg_install_data import PkgInstallData
 from ...py_packages.packages import Packages
+from ...tracking_index import TrackingIndex
 from ....lo_util.target_path import TargetPath
 from ....config import Config
 from ....oxt_logger import OxtLogger
@@ -31,6 +34,22 @@ class BatchWriter(ABC):
         """
         raise NotImplementedError
 
+    def get_tracked_packages(self) -> List[PkgInstallData]:
+        """
+        Gets the tracked packages of the configuration in all target paths with one query.
+
+        Returns:
+            List[PkgInstallData]: Tracked packages.
+        """
+        names = {pkg.name for pkg in self.packages.get_all_packages(all_pkg=True)}
+        if not names:
+            return []
+        return TrackingIndex().get_packages(*self.target_path.get_targets(), names=names)
+
+    @property
+    def tracking_index(self) -> TrackingIndex:
+        return TrackingIndex()
+
     @property
     def packages(self) -> Packages:
         return self._packages
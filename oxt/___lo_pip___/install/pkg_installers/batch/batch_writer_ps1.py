@@ -3,7 +3,7 @@ This module writes the batch file for windows cleanup.
 """
 
 from __future__ import annotations
-from typing import Dict, Iterable, Set, Tuple
+from typing import Iterable
 from pathlib import Path
 from .batch_writer import BatchWriter
 from ..pkg_install_data import PkgInstallData
@@ -134,7 +134,7 @@ class BatchWriterPs1(BatchWriter):
         try:
             if not pkg.package:
                 raise ValueError("Package name not found")
-            target_path = Path(self.target_path.get_package_target(pkg.package))
+            target_path = Path(pkg.target or self.target_path.get_package_target(pkg.package))
 
             dirs = pkg.new_dirs
             self._write_remove_folders(str(target_path), sw, dirs)
@@ -150,40 +150,6 @@ class BatchWriterPs1(BatchWriter):
         except Exception as e:
             self.log.exception("Error writing output for %s: %s", pkg.package or "unknown", e)
 
-    def _get_file_names(self, sw: StrList) -> Set[str]:
-        """
-        Get the file names.
-
-        Returns:
-            set[str]: The file names.
-        """
-
-        f_names: Set[str] = set()
-        results: Dict[Tuple[str, str], set] = {}
-        pkgs = self.packages.get_all_packages(all_pkg=True)
-        remove_json_files: Dict[str, Set[str]] = {}
-        for tp in self.target_path.get_targets():
-            if not tp in remove_json_files:
-                remove_json_files[tp] = set()
-
-            for pkg in pkgs:
-                json_name = f"{self.config.lo_implementation_name}_{pkg.name}.json"
-                if not tp in results:
-                    results[tp, json_name] = set()
-                file_path = Path(tp, json_name)
-                if file_path.exists():
-                    str_p = str(file_path)
-                    results[tp, json_name].add(str(file_path))
-                    remove_json_files[tp].add(str_p)
-
-        for _, files in results.items():
-            f_names.update(files)
-
-        for key, value in remove_json_files.items():
-            self._write_remove_files(key, sw, value)
-
-        return f_names
-
     def get_contents(self) -> str:
         """
         Get the contents of the batch file.
@@ -194,10 +160,10 @@ class BatchWriterPs1(BatchWriter):
         sw = StrList(sep=self._line_sep)
         self._write_remove_dirs_fn(sw)
         self._write_remove_files_fn(sw)
-        data_files = self._get_file_names(sw)
-        for file in data_files:
-            pkg = PkgInstallData.from_file(Path(file))
+        for pkg in self.get_tracked_packages():
             self._write_output_for_pkg(pkg, sw)
+        store_file = self.tracking_index.store_file
+        self._write_remove_files(str(store_file.parent), sw, [store_file.name])
 
         return sw.to_string()
 
@@ -3,24 +3,33 @@ import os
 import sys
 import shutil
 import subprocess
+import contextlib
 import glob
-import json
+import re
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Set, cast
+from typing import Any, Deque, Dict, Iterator, List, Tuple, Set, cast
 
 
 # import pkg_resources
 import importlib.metadata
-from importlib.metadata import PackageNotFoundError, version
 from ...config import Config
+from ...debug.trace import Tracer
 from ...lo_util.resource_resolver import ResourceResolver
 from ...lo_util.target_path import TargetPath
 from ...oxt_logger import OxtLogger
 from ...ver.rules.ver_rules import VerRules, VerProto
+from ..distribution_index import DistributionIndex
 from ..download import Download
-from ..progress import Progress
+from ..progress import ProgressSession
 from ..py_packages.packages import Packages
+from ..pip_worker.pip_worker import PipWorker
+from ..startup_fingerprint import StartupFingerprint
+from ..tracking_index import TrackingIndex
+from ..wheel_cache.wheel_cache import WheelCache
 from ...settings.install_settings import InstallSettings
+from ...thread import cancel_token
 
 
 # https://docs.python.org/3.8/library/importlib.metadata.html#module-importlib.metadata
@@ -34,6 +43,13 @@ if os.name == "nt":
 else:
     STARTUP_INFO = None
 
+# pip stdout lines that are kept after streaming, the installed packages and the wheel files used.
+_PIP_KEEP_LINE = re.compile(r"^Successfully installed |\.whl\b")
+# number of pip stderr lines kept for logging an error.
+_PIP_ERR_LINES = 200
+# a package requirement by name such as ``verr>=1.1.2``, the ones the wheel cache can look up.
+_PIP_NAME_REQ = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*)\s*([<>=!~^].*)?$")
+
 
 class InstallPkg:
     """Install pip packages."""
@@ -58,7 +74,9 @@ class InstallPkg:
         self._logger = self._get_logger()
         self._flag_upgrade = flag_upgrade
         self._show_progress = bool(kwargs.get("show_progress", self._config.show_progress))
-        self._saved_json_files = set()
+        self._progress: ProgressSession | None = None
+        self._progress_hold = 0
+        self._saved_packages: Set[str] = set()
         self._resource_resolver = ResourceResolver(ctx=self.ctx)
         self._target_path = TargetPath()
         self._no_pip_remove = self._config.no_pip_remove.copy()  # {"pip", "setuptools", "wheel"}
@@ -78,10 +96,7 @@ class InstallPkg:
         Returns:
             str: The version of the package or an empty string if the package is not installed.
         """
-        try:
-            return version(package_name)
-        except PackageNotFoundError:
-            return ""
+        return DistributionIndex().get_version(package_name)
 
     def unload_module(self, module_name: str) -> None:
         """
@@ -105,6 +120,8 @@ class InstallPkg:
 
     def _cmd_pip(self, *args: str) -> List[str]:
         cmd: List[str] = [str(self._path_python), "-m", "pip", *args]
+        if args and args[0] in ("install", "download") and self.wheel_cache is not None:
+            cmd.append(f"--find-links={self.wheel_cache.root}")
         if self._config.log_pip_installs and self._config.log_file:
             log_file = self._config.log_file
 
@@ -113,22 +130,16 @@ class InstallPkg:
             cmd.append(f"--log={log_file}")
         return cmd
 
-    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+    def _get_target_args(self, pkg: str) -> List[str]:
         """
-        Install a package.
+        Gets the pip target arguments for a package such as ``--target=...`` or ``--user``.
 
         Args:
             pkg (str): The name of the package to install.
-            ver (str): The version of the package to install.
-            force (bool): Force install even if package is already installed.
 
         Returns:
-            bool: True if successful, False otherwise.
+            List[str]: Target arguments, empty if pip default location is to be used.
         """
-        if pkg in self.no_pip_install:
-            self._logger.debug("_install_pkg() %s is in the no install list. Not Installing and continuing.", pkg)
-            return True
-
         auto_target = False
         if self.config.auto_install_in_site_packages:
             if self.config.site_packages:
@@ -140,95 +151,380 @@ class InstallPkg:
                 self._logger.debug(
                     "Ignoring auto_install_in_site_packages and continuing to install in user directory via pip --user"
                 )
-        cmd = ["install"]
-        if force:
-            cmd.append("--force-reinstall")
-        elif self.flag_upgrade:
-            cmd.append("--upgrade")
 
         if not auto_target and self.config.is_win and len(self.config.isolate_windows) > 0:
             auto_target = True
 
         if auto_target:
-            cmd.append(f"--target={self._target_path.get_package_target(pkg)}")
-        elif self.config.is_user_installed:
-            cmd.append("--user")
+            return [f"--target={self._target_path.get_package_target(pkg)}"]
+        if self.config.is_user_installed:
+            return ["--user"]
+        return []
 
-        pkg_cmd = f"{pkg}{ver}" if ver else pkg
-        cmd = self._cmd_pip(*[*cmd, pkg_cmd])
-        self._logger.debug(f"Running command {cmd}")
-        self._logger.info(f"Installing package {pkg}")
-        if self._flag_upgrade:
-            msg = f"Pip Install - Upgrading success for: {pkg_cmd}"
-            err_msg = f"Pip Install - Upgrading failed for: {pkg_cmd}"
-        else:
-            msg = f"Pip Install success for: {pkg_cmd}"
-            err_msg = f"Pip Install failed for: {pkg_cmd}"
+    def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
+        """
+        Install a package.
 
-        site_packages_dir = self._get_site_packages_dir(pkg)
-        if pkg in self.no_pip_remove:  # ignore pip
-            is_ignore = True
-            before_dirs = []
-            before_files = []
-            before_shared = {}
-        else:
-            is_ignore = False
-            before_dirs = self._get_directory_names(site_packages_dir)
-            before_files = self._get_file_names(site_packages_dir)
-            before_shared = self._get_pip_shared_files(pkg)
-
-        progress: Progress | None = None
-        if self._config.show_progress and self.show_progress:
-            # display a terminal window to show progress
-            self._logger.debug("Starting Progress Window")
-            msg = self.resource_resolver.resolve_string("msg08")
-            title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
-            progress = Progress(start_msg=f"{msg}: {pkg}", title=title)
-            progress.start()
-        else:
+        Args:
+            pkg (str): The name of the package to install.
+            ver (str): The version of the package to install.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with Tracer().span("install_pkg", pkg=pkg, ver=ver) as span:
+            if pkg in self.no_pip_install:
+                self._logger.debug("_install_pkg() %s is in the no install list. Not Installing and continuing.", pkg)
+                return True
+
+            cmd = ["install"]
+            if force:
+                cmd.append("--force-reinstall")
+            elif self.flag_upgrade:
+                cmd.append("--upgrade")
+
+            cmd.extend(self._get_target_args(pkg))
+
+            pkg_cmd = f"{pkg}{ver}" if ver else pkg
+            cmd = self._cmd_pip(*[*cmd, pkg_cmd])
+            self._logger.debug(f"Running command {cmd}")
+            self._logger.info(f"Installing package {pkg}")
+            if self._flag_upgrade:
+                msg = f"Pip Install - Upgrading success for: {pkg_cmd}"
+                err_msg = f"Pip Install - Upgrading failed for: {pkg_cmd}"
+            else:
+                msg = f"Pip Install success for: {pkg_cmd}"
+                err_msg = f"Pip Install failed for: {pkg_cmd}"
+
+            site_packages_dir = self._get_site_packages_dir(pkg)
+            is_ignore = pkg in self.no_pip_remove  # ignore pip
+
+            with self._show_progress_step(pkg):
+                process = self._run_install(cmd, [pkg_cmd])
+
+            result = False
+            if process.returncode == 0:
+                if not is_ignore:
+                    self._track_installed(pkg=pkg, pth=site_packages_dir, output=process.stdout)
+                self._logger.info(msg)
+                result = True
+            else:
+                self._logger.error(err_msg)
+                try:
+                    self._logger.error(process.stderr)
+                except Exception as err:
+                    self._logger.error("Error decoding stderr: %s", err)
+
+            if not result:
+                span.fail(err_msg)
+            return result
+
+    def _install_pkgs(self, pkgs: Dict[str, str], force: bool) -> bool:
+        """
+        Install several packages using a single pip call per target directory.
+
+        All packages are resolved together by pip. When done the installed distributions are attributed to each
+        package and a tracking file is written for each package.
+
+        If the batch call fails then the packages of that batch are installed one at a time using ``_install_pkg()``.
+
+        Args:
+            pkgs (Dict[str, str]): Package names and their version constraints such as ``{"verr": ">=1.1.2"}``.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if all packages installed successful, False otherwise.
+        """
+        batches: Dict[str, Dict[str, str]] = {}
+        for pkg, ver in pkgs.items():
+            if pkg in self.no_pip_install:
+                self._logger.debug("_install_pkgs() %s is in the no install list. Not Installing and continuing.", pkg)
+                continue
+            batches.setdefault(self._get_site_packages_dir(pkg), {})[pkg] = ver
+
+        result = True
+        for site_packages_dir, batch in batches.items():
+            if len(batch) > 1 and self._install_batch(site_packages_dir, batch, force):
+                continue
+            if len(batch) > 1:
+                self._logger.warning(
+                    "_install_pkgs() Batch install failed. Installing packages one at a time: %s", ", ".join(batch)
+                )
+            for pkg, ver in batch.items():
+                # every package is tried, a failed package does not stop the rest.
+                ok = self._install_pkg(pkg, ver, force)
+                result = result and ok
+        return result
+
+    def _install_batch(self, site_packages_dir: str, pkgs: Dict[str, str], force: bool) -> bool:
+        """
+        Install packages that share the same target directory using a single pip call.
+
+        Args:
+            site_packages_dir (str): The directory the packages are installed into.
+            pkgs (Dict[str, str]): Package names and their version constraints.
+            force (bool): Force install even if package is already installed.
+
+        Returns:
+            bool: True if successful, False otherwise.
+        """
+        with Tracer().span("install_batch", pkgs=list(pkgs)) as span:
+            first_pkg = next(iter(pkgs))
+            cmd = ["install"]
+            if force:
+                cmd.append("--force-reinstall")
+            elif self.flag_upgrade:
+                cmd.append("--upgrade")
+
+            cmd.extend(self._get_target_args(first_pkg))
+
+            pkg_cmds = [f"{pkg}{ver}" if ver else pkg for pkg, ver in pkgs.items()]
+            cmd = self._cmd_pip(*[*cmd, *pkg_cmds])
+            self._logger.debug(f"Running command {cmd}")
+            self._logger.info(f"Installing packages {', '.join(pkgs)}")
+
+            with self._show_progress_step(", ".join(pkgs)):
+                process = self._run_install(cmd, pkg_cmds)
+
+            if process.returncode != 0:
+                self._logger.error(f"Pip Install failed for: {' '.join(pkg_cmds)}")
+                span.fail()
+                try:
+                    self._logger.error(process.stderr)
+                except Exception as err:
+                    self._logger.error("Error decoding stderr: %s", err)
+                return False
+
+            dists = self._get_installed_dists(site_packages_dir, process.stdout)
+            owners = self._get_dist_owners(site_packages_dir, list(pkgs), dists)
+            for pkg in pkgs:
+                if pkg in self.no_pip_remove:
+                    continue
+                self._save_tracking(pkg=pkg, pth=site_packages_dir, entries=owners[pkg])
+            self._logger.info(f"Pip Install success for: {' '.join(pkg_cmds)}")
+            return True
+
+    # region Progress
+    @contextlib.contextmanager
+    def _hold_progress(self) -> Iterator[None]:
+        """
+        Keeps the progress window that the first package starts up until all packages are done.
+
+        Nothing is shown if no package is installed.
+        """
+        self._progress_hold += 1
+        try:
+            yield
+        finally:
+            self._progress_hold -= 1
+            if self._progress_hold == 0:
+                self._close_progress()
+
+    @contextlib.contextmanager
+    def _show_progress_step(self, pkgs: str) -> Iterator[None]:
+        """
+        Shows the packages being installed in the progress window, starting the window if it is not already showing.
+
+        Args:
+            pkgs (str): Package names such as ``verr, ooo-dev-tools``.
+        """
+        if not (self._config.show_progress and self.show_progress):
             self._logger.debug("Progress Window is disabled")
+            yield
+            return
+        msg = self.resource_resolver.resolve_string("msg08")
+        if self._progress is None:
+            title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
+            self._progress = ProgressSession(title=title)
+        self._progress.step(f"{msg}: {pkgs}")
+        try:
+            yield
+        finally:
+            if self._progress_hold == 0:
+                self._close_progress()
+
+    def _close_progress(self) -> None:
+        progress = self._progress
+        self._progress = None
+        if progress is not None:
+            progress.close()
+
+    def _on_pip_line(self, line: str) -> None:
+        """Shows a line of pip output in the progress window."""
+        progress = self._progress
+        if progress is not None:
+            progress.line(line)
+
+    # endregion Progress
+
+    def _stream_pip(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Runs a pip command in a new process and reads its output line by line as pip writes it.
+
+        Each line is shown in the progress window.
+        Only the stdout lines that are used after the install, ``Successfully installed`` and wheel file names,
+        and the last lines of stderr are kept so memory does not grow with the amount of output.
 
-        process = subprocess.run(
+        When run in a ``CancellableThread`` that is killed, pip is terminated and ``ThreadCancelled`` is raised.
+        """
+        env = self._get_env()
+        # pip output is block buffered when writing to a pipe.
+        env["PYTHONUNBUFFERED"] = "1"
+        out_lines: List[str] = []
+        err_lines: Deque[str] = deque(maxlen=_PIP_ERR_LINES)
+        token = cancel_token.get_token()
+        with subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             encoding="utf-8",
             errors="replace",
             text=True,
-            env=self._get_env(),
+            bufsize=1,
+            env=env,
             startupinfo=STARTUP_INFO,
+        ) as proc, token.process(proc):
+            assert proc.stdout is not None and proc.stderr is not None
+            stderr = proc.stderr
+
+            def read_err() -> None:
+                for line in stderr:
+                    err_lines.append(line)
+
+            err_thread = threading.Thread(target=read_err, daemon=True)
+            err_thread.start()
+            for line in proc.stdout:
+                if _PIP_KEEP_LINE.search(line):
+                    out_lines.append(line)
+                self._on_pip_line(line)
+            err_thread.join()
+            returncode = proc.wait()
+        token.checkpoint()
+        return subprocess.CompletedProcess(
+            args=cmd, returncode=returncode, stdout="".join(out_lines), stderr="".join(err_lines)
         )
 
-        result = False
+    def _run_pip(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """Runs a pip command and captures its output."""
+        # the span duration is the wall time of the pip subprocess
+        with Tracer().span("pip", args=cmd[3:]) as span:
+            process = None
+            worker = PipWorker()
+            if worker.enabled and cmd[1:3] == ["-m", "pip"]:
+                process = worker.run(cmd[0], cmd[3:], self._get_env())
+                span.set("worker", process is not None)
+            if process is None:
+                process = self._stream_pip(cmd)
+            span.set("returncode", process.returncode)
+            if process.returncode != 0:
+                span.fail()
+        return process
+
+    def _run_install(self, cmd: List[str], pkg_cmds: List[str]) -> subprocess.CompletedProcess:
+        """
+        Runs a pip install command.
+
+        When the wheel cache has wheels for every package the command is run with ``--no-index``
+        so the install does not touch the network, if that fails the command is run again using the package index.
+        Otherwise the command is run once using the package index and the wheels that were missing are
+        downloaded to the cache after the install succeeds, for the next install.
+
+        Args:
+            cmd (List[str]): The full pip install command.
+            pkg_cmds (List[str]): The package requirements of the command such as ``verr>=1.1.2``.
+
+        Returns:
+            subprocess.CompletedProcess: The completed pip process.
+        """
+        self._invalidate_startup_fingerprint()
+        cache = self.wheel_cache
+        if cache is None:
+            process = self._run_pip(cmd)
+            if process.returncode == 0:
+                self._refresh_dist_index(cmd)
+            return process
+        missing: List[str] = []
+        try:
+            missing = self._get_wheel_cache_misses(pkg_cmds)
+            if not missing:
+                process = self._run_pip([*cmd, "--no-index"])
+                if process.returncode == 0:
+                    self._refresh_dist_index(cmd)
+                    cache.touch_from_output(process.stdout)
+                    cache.evict()
+                    return process
+                self._logger.warning("Install from wheel cache failed. Retrying using the package index.")
+        except Exception as e:
+            self._logger.error("Wheel cache error: %s", e, exc_info=True)
+        process = self._run_pip(cmd)
         if process.returncode == 0:
-            if not is_ignore:
-                self._delete_json_file(site_packages_dir, pkg)
-                after_dirs = self._get_directory_names(site_packages_dir)
-                after_files = self._get_file_names(site_packages_dir)
-                after_shared = self._get_pip_shared_files(pkg)
-                changes = {
-                    "before_files": before_files,
-                    "before_dirs": before_dirs,
-                    "before_shared": before_shared,
-                    "after_files": after_files,
-                    "after_dirs": after_dirs,
-                    "after_shared": after_shared,
-                }
-                self._save_changed(pkg=pkg, pth=site_packages_dir, changes=changes)
-            self._logger.info(msg)
-            result = True
-        else:
-            self._logger.error(err_msg)
+            self._refresh_dist_index(cmd)
             try:
-                self._logger.error(process.stderr)
-            except Exception as err:
-                self._logger.error("Error decoding stderr: %s", err)
+                cache.touch_from_output(process.stdout)
+                if missing and self._fill_wheel_cache(missing):
+                    cache.evict()
+            except Exception as e:
+                self._logger.error("Wheel cache error: %s", e, exc_info=True)
+        return process
 
-        if progress:
-            self._logger.debug("Ending Progress Window")
-            progress.kill()
+    def _get_wheel_cache_misses(self, pkg_cmds: List[str]) -> List[str]:
+        """
+        Gets the package requirements that the wheel cache has no supported wheel for.
 
-        return result
+        Args:
+            pkg_cmds (List[str]): The package requirements such as ``verr>=1.1.2``.
+
+        Returns:
+            List[str]: The missing requirements. A file or url can not be looked up in the cache
+            and is always missing.
+        """
+        cache = cast(WheelCache, self.wheel_cache)
+        missing: List[str] = []
+        for pkg_cmd in pkg_cmds:
+            match = _PIP_NAME_REQ.match(pkg_cmd)
+            if match is None or Path(pkg_cmd).exists() or not cache.find(match.group(1), match.group(2) or ""):
+                missing.append(pkg_cmd)
+        self._logger.info("Wheel cache hits: %i, misses: %i", cache.hits, cache.misses)
+        return missing
+
+    def _fill_wheel_cache(self, missing: List[str]) -> bool:
+        """
+        Downloads the wheels of package requirements to the wheel cache.
+
+        Args:
+            missing (List[str]): The package requirements such as ``verr>=1.1.2``.
+
+        Returns:
+            bool: True if the wheels were downloaded, False otherwise. Files and urls are not downloaded.
+        """
+        cache = cast(WheelCache, self.wheel_cache)
+        reqs = [pkg_cmd for pkg_cmd in missing if _PIP_NAME_REQ.match(pkg_cmd) and not Path(pkg_cmd).exists()]
+        if not reqs or not self.is_internet:
+            return False
+        cmd = self._cmd_pip("download", f"--dest={cache.root}", "--only-binary=:all:", *reqs)
+        self._logger.debug(f"Running command {cmd}")
+        process = self._run_pip(cmd)
+        if process.returncode != 0:
+            self._logger.debug("Unable to download wheels to cache for: %s", ", ".join(reqs))
+            return False
+        cache.sync()
+        return True
+
+    def _refresh_dist_index(self, cmd: List[str]) -> None:
+        # pip only reports where it installed through the --target argument, otherwise any changed sys.path entry is scanned
+        targets = [arg[len("--target=") :] for arg in cmd if arg.startswith("--target=")]
+        try:
+            DistributionIndex().refresh(*targets)
+        except Exception as e:
+            self._logger.error("Unable to refresh distribution index: %s", e)
+
+    def _invalidate_startup_fingerprint(self) -> None:
+        # the installed packages are about to change, the next startup must check the requirements again
+        try:
+            StartupFingerprint().invalidate()
+        except Exception as e:
+            self._logger.error("Unable to invalidate startup fingerprint: %s", e)
 
     def uninstall_pkg(self, pkg: str, target: str = "", remove_tracking_file: bool = False) -> bool:
         """
@@ -246,6 +542,8 @@ class InstallPkg:
             self.log.debug("%s is in the no install list. Not Uninstalling and continuing.", pkg)
             return True
 
+        self._invalidate_startup_fingerprint()
+
         def find_matching_files(directory: str, pattern: str) -> list:
             search_pattern = os.path.join(directory, pattern)
             return glob.glob(search_pattern)
@@ -253,7 +551,7 @@ class InstallPkg:
         success = True
         step = 1
         self.log.debug(
-            "Attempting to uninstalling package via json package info for %s: Step %i",
+            "Attempting to uninstalling package via tracking index for %s: Step %i",
             pkg,
             step,
         )
@@ -386,10 +684,12 @@ class InstallPkg:
                     step,
                 )
                 # this is not critical so we will continue
+        DistributionIndex().refresh(target)
+
         step = 6
         if remove_tracking_file:
             site_packages_dir = self._get_site_packages_dir(pkg)
-            self._delete_json_file(site_packages_dir, pkg)
+            self._delete_tracking(site_packages_dir, pkg)
             self.log.info("uninstall_package() Removed tracking file for %s", pkg)
             self.log.debug("uninstall_package() Removed tracking file for %s. Completed Step %i", pkg, step)
         else:
@@ -462,48 +762,58 @@ class InstallPkg:
             return False
 
         result = True
-        for name, ver in req.items():
-            valid, rules = self._is_valid_version(name, ver, force)
-            if force:
-                valid = 0
-            if valid == 1:
-                continue
-
-            if not self.is_internet:
-                self._logger.error("No internet connection!")
-                break
-
-            ver_lst: List[str] = [rule.get_versions_str() for rule in rules]
-            if self.config.uninstall_on_update:
-                pkg_ver = self.get_package_version(name)
-                if pkg_ver:
-                    self.log.debug(
-                        "Package %s %s already installed. Attempting to uninstall.",
-                        name,
-                        pkg_ver,
-                    )
-                    try:
-                        if not self.uninstall_pkg(name):
-                            return False
-                    except PermissionError as e:
-                        if self.config.install_on_no_uninstall_permission:
-                            self._logger.error("Unable to uninstall %s. %s", name, e)
-                            self._logger.info(
-                                "Permission error is usually because the package is installed as a system package that LibreOffice does not have permission to uninstall."
-                            )
-                            self._logger.info(
-                                "Continuing to install %s %s even though it is already installed. Probably because it is installed as a system package.",
-                                name,
-                                ver,
-                            )
-                        else:
-                            self._logger.error(
-                                "Unable to uninstall %s. %s\nThis is usually because the package is installed as a system package that LibreOffice does not have permission to uninstall.",
-                                name,
-                                e,
-                            )
-                            return False
-            result = result and self._install_pkg(name, ",".join(ver_lst), force)
+        # the progress window started by the first package stays up for the remaining packages.
+        with self._hold_progress():
+            is_batch = self.config.install_batch
+            # packages to install with a single pip call when is_batch is True
+            batch: Dict[str, str] = {}
+            for name, ver in req.items():
+                valid, rules = self._is_valid_version(name, ver, force)
+                if force:
+                    valid = 0
+                if valid == 1:
+                    continue
+
+                if not self.is_internet:
+                    self._logger.error("No internet connection!")
+                    break
+
+                ver_lst: List[str] = [rule.get_versions_str() for rule in rules]
+                if self.config.uninstall_on_update:
+                    pkg_ver = self.get_package_version(name)
+                    if pkg_ver:
+                        self.log.debug(
+                            "Package %s %s already installed. Attempting to uninstall.",
+                            name,
+                            pkg_ver,
+                        )
+                        try:
+                            if not self.uninstall_pkg(name):
+                                return False
+                        except PermissionError as e:
+                            if self.config.install_on_no_uninstall_permission:
+                                self._logger.error("Unable to uninstall %s. %s", name, e)
+                                self._logger.info(
+                                    "Permission error is usually because the package is installed as a system package that LibreOffice does not have permission to uninstall."
+                                )
+                                self._logger.info(
+                                    "Continuing to install %s %s even though it is already installed. Probably because it is installed as a system package.",
+                                    name,
+                                    ver,
+                                )
+                            else:
+                                self._logger.error(
+                                    "Unable to uninstall %s. %s\nThis is usually because the package is installed as a system package that LibreOffice does not have permission to uninstall.",
+                                    name,
+                                    e,
+                                )
+                                return False
+                if is_batch:
+                    batch[name] = ",".join(ver_lst)
+                else:
+                    result = result and self._install_pkg(name, ",".join(ver_lst), force)
+            if batch:
+                result = self._install_pkgs(batch, force)
         self._logger.info("Installing packages Done!")
         if is_ext_install:
             self.on_extension_install()
@@ -595,17 +905,14 @@ class InstallPkg:
         def convert_to_local(pth: Path) -> Path:
             return Path(target, pth.name)
 
-        try:
-            dist = importlib.metadata.distribution(pkg)
-            location = dist.locate_file("")
-            dist_info_folder = f"{pkg.replace('-', '_')}-{dist.version}.dist-info"
-            dist_info_path = Path(str(location), dist_info_folder)
-            dist_info_path = convert_to_local(dist_info_path)
-            if dist_info_path.exists():
-                return str(dist_info_path)
-            return ""
-        except importlib.metadata.PackageNotFoundError:
+        dist = DistributionIndex().get(pkg)
+        if dist is None:
             return ""
+        dist_info_folder = f"{pkg.replace('-', '_')}-{dist.version}.dist-info"
+        dist_info_path = convert_to_local(Path(dist_info_folder))
+        if dist_info_path.exists():
+            return str(dist_info_path)
+        return ""
 
     def get_package_installation_dir(self, pkg: str) -> str:
         """
@@ -625,50 +932,203 @@ class InstallPkg:
             self.log.debug("get_package_installation_dir() result: %s not found", result)
         return ""
 
-    # region Json directory methods
+    # region Tracking methods
     def _get_site_packages_dir(self, pkg: str) -> str:
         """Get the site-packages directory."""
         return self._target_path.get_package_target(pkg)
 
-    def _get_file_names(self, path: str | Path) -> List[str]:
-        # only get the file names in the specified path
+    def _get_installed_dists(self, pth: str, output: str) -> Dict[str, importlib.metadata.Distribution]:
+        """
+        Gets the distributions pip reported as installed.
 
-        pth = Path(path) if isinstance(path, str) else path
-        if not pth.exists():
-            return []
-        str_pth = str(pth)
-        return [name for name in os.listdir(str_pth) if os.path.isfile(os.path.join(str_pth, name))]
+        Only the ``Successfully installed`` line of the pip output is used,
+        so the cost is in proportion to what was installed and not to the size of ``site-packages``.
 
-    def _get_directory_names(self, path: str) -> List[str]:
-        """Get the directory names in the specified path."""
-        omits = {"bin", "lib", "include", "__pycache__"}
-        return [name for name in os.listdir(path) if name not in omits and os.path.isdir(os.path.join(path, name))]
+        Args:
+            pth (str): The directory the packages were installed into.
+            output (str): The stdout of the pip install command.
+
+        Returns:
+            Dict[str, Distribution]: Distributions keyed by normalized name in the order pip reported them.
+        """
+        results: Dict[str, importlib.metadata.Distribution] = {}
+        match = re.search(r"^Successfully installed (.+)$", output or "", re.MULTILINE)
+        if match is None:
+            return results
+        dist_infos: Dict[Tuple[str, str], Path] | None = None
+        for item in match.group(1).split():
+            name, _, ver = item.rpartition("-")
+            if not name:
+                continue
+            dist_info = Path(pth, f"{name.replace('-', '_')}-{ver}.dist-info")
+            if not dist_info.exists():
+                if dist_infos is None:
+                    # dist-info folder name does not follow the normalized form, look it up once.
+                    dist_infos = {}
+                    for d_name in os.listdir(pth) if os.path.isdir(pth) else []:
+                        if d_name.endswith(".dist-info"):
+                            d_pkg, _, d_ver = d_name[:-10].rpartition("-")
+                            dist_infos[(DistributionIndex.canonical_name(d_pkg), d_ver)] = Path(pth, d_name)
+                found = dist_infos.get((DistributionIndex.canonical_name(name), ver))
+                if found is None:
+                    self._logger.debug("_get_installed_dists() dist-info not found for %s in %s", item, pth)
+                    continue
+                dist_info = found
+            results[DistributionIndex.canonical_name(name)] = importlib.metadata.PathDistribution(dist_info)
+        return results
 
-    def _get_pip_shared_files(self, pkg: str) -> Dict[str, Set[str]]:
+    def _get_record_entries(self, pth: str, dist: importlib.metadata.Distribution) -> Dict[str, Any]:
         """
-        Retrieves shared files for a given package from specified pip shared directories.
-        This is the files that are in the directories outlined in ``pip_shared_dirs`` in the configuration.
+        Gets the top level directories and files of a distribution from its ``RECORD``.
+
+        Files in ``pip_shared_dirs`` are listed per shared directory.
+        A top level directory that is not a regular package and holds entries of other distributions,
+        such as a namespace package, is not included.
 
         Args:
-            pkg (str): The name of the package to retrieve shared files for.
+            pth (str): The directory the distribution is installed in.
+            dist (Distribution): The distribution.
 
         Returns:
-            Dict[str, List[str]]: A dictionary where the keys are pip shared directory names
-                and the values are lists of file names found in those directories.
+            Dict[str, Any]: Dictionary with ``dirs``, ``files`` and ``shared`` keys.
+        """
+        entries = self._new_entries()
+        shared = cast(Dict[str, Set[str]], entries["shared"])
+        sub_names: Dict[str, Set[str]] = {}
+        packages: Set[str] = set()
+        for file in dist.files or []:
+            parts = file.parts
+            if len(parts) == 4 and parts[:2] == ("..", ".."):
+                # --target installs record scripts relative to the lib folder of the temp prefix such as ../../bin/name
+                if parts[2] in shared:
+                    shared[parts[2]].add(parts[3])
+                continue
+            if not parts or parts[0] == ".." or parts[0] == "__pycache__":
+                continue
+            top = parts[0]
+            if len(parts) == 1:
+                entries["files"].add(top)
+                continue
+            if top in shared:
+                if len(parts) == 2:
+                    shared[top].add(parts[1])
+                continue
+            sub_names.setdefault(top, set()).add(parts[1])
+            if len(parts) == 2 and parts[1] == "__init__.py":
+                packages.add(top)
+
+        for top, names in sub_names.items():
+            if top in packages or top.endswith((".dist-info", ".data")):
+                entries["dirs"].add(top)
+                continue
+            dir_path = os.path.join(pth, top)
+            try:
+                other = set(os.listdir(dir_path)) - names - {"__pycache__"}
+            except OSError:
+                continue
+            if other:
+                self._logger.debug("_get_record_entries() %s is shared with other packages. Not tracking.", top)
+                continue
+            entries["dirs"].add(top)
+        return entries
+
+    def _get_dist_owners(
+        self,
+        pth: str,
+        pkgs: List[str],
+        dists: Dict[str, importlib.metadata.Distribution],
+    ) -> Dict[str, Dict[str, Any]]:
         """
+        Attributes the installed distributions to the requested packages.
 
-        site_packages_dir = self._get_site_packages_dir(pkg)
-        results: Dict[str, Set[str]] = {}
-        for pip_dir in self.config.pip_shared_dirs:
-            files = self._get_file_names(Path(site_packages_dir, pip_dir))
-            results[pip_dir] = set(files)
-        return results
+        Each package owns its own distribution, then the distributions of its dependencies
+        in the order the packages were requested.
+        Anything left over goes to the first tracked package,
+        the same as if that package had been installed on its own.
 
-    def _save_changed(self, pkg: str, pth: str, changes: dict) -> None:
-        """Save the new directory names to a JSON file."""
+        Args:
+            pth (str): The directory the packages were installed into.
+            pkgs (List[str]): The package names in the order they were requested.
+            dists (Dict[str, Distribution]): Installed distributions keyed by normalized name.
 
-        def _create_json() -> str:
-            """Create a JSON file with the file names."""
+        Returns:
+            Dict[str, Dict[str, Any]]: Keyed by package name, each value has ``dirs``, ``files`` and ``shared`` keys.
+        """
+        owners: Dict[str, Dict[str, Any]] = {pkg: self._new_entries() for pkg in pkgs}
+        unclaimed = dict(dists)
+
+        def get_requires(dist: importlib.metadata.Distribution) -> List[str]:
+            names = []
+            for req in dist.requires or []:
+                match = re.match(r"\s*([A-Za-z0-9][A-Za-z0-9._-]*)", req)
+                if match:
+                    names.append(DistributionIndex.canonical_name(match.group(1)))
+            return names
+
+        def claim(pkg: str, dist_name: str) -> None:
+            dist = unclaimed.pop(dist_name, None)
+            if dist is not None:
+                self._merge_entries(owners[pkg], self._get_record_entries(pth, dist))
+
+        for pkg in pkgs:
+            claim(pkg, DistributionIndex.canonical_name(pkg))
+
+        for pkg in pkgs:
+            dist = dists.get(DistributionIndex.canonical_name(pkg))
+            if dist is None:
+                continue
+            visited = {DistributionIndex.canonical_name(p) for p in pkgs}
+            pending = get_requires(dist)
+            while pending:
+                dist_name = pending.pop()
+                if dist_name in visited:
+                    continue
+                visited.add(dist_name)
+                if dist_name in dists:
+                    claim(pkg, dist_name)
+                    pending.extend(get_requires(dists[dist_name]))
+
+        tracked = [pkg for pkg in pkgs if pkg not in self.no_pip_remove]
+        if tracked:
+            for dist_name in list(unclaimed):
+                claim(tracked[0], dist_name)
+        return owners
+
+    def _new_entries(self) -> Dict[str, Any]:
+        return {"dirs": set(), "files": set(), "shared": {key: set() for key in self.config.pip_shared_dirs}}
+
+    def _merge_entries(self, entries: Dict[str, Any], other: Dict[str, Any]) -> None:
+        entries["dirs"].update(other["dirs"])
+        entries["files"].update(other["files"])
+        for key, files in other["shared"].items():
+            entries["shared"].setdefault(key, set()).update(files)
+
+    def _track_installed(self, pkg: str, pth: str, output: str) -> None:
+        """
+        Writes the tracking file for a package using the ``RECORD`` of every distribution pip installed with it.
+
+        Args:
+            pkg (str): The name of the package.
+            pth (str): The directory the package was installed into.
+            output (str): The stdout of the pip install command.
+        """
+        dists = self._get_installed_dists(pth, output)
+        owners = self._get_dist_owners(pth, [pkg], dists)
+        self._save_tracking(pkg=pkg, pth=pth, entries=owners[pkg])
+
+    def _save_tracking(self, pkg: str, pth: str, entries: Dict[str, Any]) -> None:
+        """Saves the tracking file for a package from its ``dirs``, ``files`` and ``shared`` entries."""
+        changes = {
+            "before_shared": {key: set() for key in entries["shared"]},
+            "after_files": sorted(entries["files"]),
+            "after_dirs": sorted(entries["dirs"]),
+            "after_shared": entries["shared"],
+        }
+        self._save_changed(pkg=pkg, pth=pth, changes=changes)
+
+    def _save_changed(self, pkg: str, pth: str, changes: dict) -> None:
+        """Save the new directory and file names to the tracking index, replacing any saved before."""
+        try:
             after_dirs: List[str] = changes.get("after_dirs", [])
             before_dirs: List[str] = changes.get("before_dirs", [])
 
@@ -695,50 +1155,26 @@ class InstallPkg:
                 new_shared_files = list(after - before)
                 data[f"new_{key}_files"] = new_shared_files
 
-            json_data = {
-                "id": f"{self._config.oxt_name}_pip_pkg",
-                "type_id": "pkg_tracker",
-                "package": pkg,
-                "package_version": pkg_version,
-                "version": self._config.extension_version,
-                "data": data,
-            }
-            return json.dumps(json_data, indent=4)
-
-        try:
-            json_str = _create_json()
-            json_path = os.path.join(pth, f"{self._config.lo_implementation_name}_{pkg}.json")
-            with open(json_path, "w") as f:
-                f.write(json_str)
-            self._saved_json_files.add(json_path)
-            self._logger.info("New directories and files saved to %s", json_path)
+            TrackingIndex().save(pkg=pkg, target=pth, data=data, package_version=pkg_version)
+            self._saved_packages.add(pkg)
+            self._logger.info("New directories and files of %s saved to tracking index", pkg)
         except Exception as e:
             self._logger.exception("Error saving new directories and files: %s", e)
 
-    def _delete_json_file(self, path: str, pkg: str) -> None:
-        """Delete the JSON file if it exists."""
-        json_path = os.path.join(path, f"{self._config.lo_implementation_name}_{pkg}.json")
-        if os.path.exists(json_path):
-            self.on_removing_tracker_file(Path(json_path))
-            os.remove(json_path)
-            self._logger.info(f"Deleted {json_path}")
-
-    # get the json data from the file if it exists
-    def _get_json_data(self, path: str, pkg: str) -> Dict[str, Any]:
-        """Get the JSON data from the file if it exists."""
-        json_path = os.path.join(path, f"{self._config.lo_implementation_name}_{pkg}.json")
-        j_contents = {}
-        if os.path.exists(json_path):
-            with open(json_path, "r") as f:
-                j_contents = json.load(f)
-                data = j_contents.get("data", {})
-
-                for pip_dir in self.config.pip_shared_dirs:
-                    key = f"new_{pip_dir}_files"
-                    if key not in data:
-                        data[key] = []
-
-        return j_contents
+    def _delete_tracking(self, path: str, pkg: str) -> None:
+        """Delete the tracked directories and files of a package from the tracking index."""
+        if TrackingIndex().remove(pkg=pkg, target=path):
+            self._logger.info("Deleted tracking of %s in %s", pkg, path)
+
+    def _get_tracking_data(self, path: str, pkg: str) -> Dict[str, Any]:
+        """Get the tracked data of a package, with a ``data`` key, if it is tracked."""
+        record = TrackingIndex().get(pkg=pkg, target=path)
+        if record is None:
+            return {}
+        data = dict(record.data)
+        for pip_dir in self.config.pip_shared_dirs:
+            data.setdefault(f"new_{pip_dir}_files", [])
+        return {"package": record.package, "package_version": record.package_version, "data": data}
 
     def on_removing_dir(self, dir_path: Path, pkg_name: str) -> None:
         """Remove the directory."""
@@ -748,15 +1184,11 @@ class InstallPkg:
         """Remove the file."""
         pass
 
-    def on_removing_tracker_file(self, file_path: Path) -> None:
-        """Remove the tracker file."""
-        pass
-
-    # check and see if there are any directories and files that need to be removed. Us the Json file to get the data
+    # check and see if there are any directories and files that need to be removed. Use the tracking index to get the data
     def _remove_changed(self, pth: str, pkg: str) -> None:
         """Remove the new directories and files."""
         self._logger.debug("_remove_changed() Removing new directories and files. Package: %s, Path: %s", pkg, pth)
-        data_dict = self._get_json_data(pth, pkg)
+        data_dict = self._get_tracking_data(pth, pkg)
         data: Dict[str, str] = data_dict.get("data", {})
         new_dirs = set(data.get("new_dirs", []))
         for pip_dir in self.config.pip_shared_dirs:
@@ -805,7 +1237,7 @@ class InstallPkg:
 
         self._logger.info("_remove_changed() Removed new directories and files.")
 
-    # endregion Json directory methods
+    # endregion Tracking methods
 
     @property
     def config(self) -> Config:
@@ -820,6 +1252,21 @@ class InstallPkg:
             self._is_internet = Download().is_internet
             return self._is_internet
 
+    @property
+    def wheel_cache(self) -> WheelCache | None:
+        """Gets the wheel cache or ``None`` if the wheel cache is disabled."""
+        try:
+            return self._wheel_cache
+        except AttributeError:
+            self._wheel_cache = None
+            cache_dir = self.config.wheel_cache_dir
+            if cache_dir:
+                try:
+                    self._wheel_cache = WheelCache(cache_dir, self.config.wheel_cache_max_size)
+                except OSError as e:
+                    self._logger.error("Unable to use wheel cache %s: %s", cache_dir, e)
+            return self._wheel_cache
+
     @property
     def python_path(self) -> Path:
         return self._path_python
@@ -866,5 +1313,6 @@ class InstallPkg:
         return self._target_path
 
     @property
-    def saved_json_files(self) -> Set[str]:
-        return self._saved_json_files
+    def saved_packages(self) -> Set[str]:
+        """Gets the names of the packages tracked by this installer."""
+        return self._saved_packages
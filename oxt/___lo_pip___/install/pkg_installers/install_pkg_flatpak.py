@@ -1,12 +1,10 @@
 from __future__ import annotations
-import subprocess
 from pathlib import Path
+from typing import Dict, List
 
 # import pkg_resources
 from ...oxt_logger import OxtLogger
 from .install_pkg import InstallPkg
-from ..progress import Progress
-from .install_pkg import STARTUP_INFO
 
 
 class InstallPkgFlatpak(InstallPkg):
@@ -15,6 +13,18 @@ class InstallPkgFlatpak(InstallPkg):
     def _get_logger(self) -> OxtLogger:
         return OxtLogger(log_name=__name__)
 
+    def _get_target_args(self, pkg: str) -> List[str]:
+        """Flatpak always installs into the configured site-packages directory."""
+        return [f"--target={self.config.site_packages}"]
+
+    def _install_pkgs(self, pkgs: Dict[str, str], force: bool) -> bool:
+        if not self.config.site_packages:
+            self._logger.error(
+                "No site-packages directory set in configuration. site_packages value should be set in lo_pip.config.py"
+            )
+            return False
+        return super()._install_pkgs(pkgs, force)
+
     def _install_pkg(self, pkg: str, ver: str, force: bool) -> bool:
         """
         Install a package.
@@ -56,57 +66,14 @@ class InstallPkgFlatpak(InstallPkg):
             err_msg = f"Pip Install failed for: {pkg_cmd}"
 
         site_packages_dir = self._get_site_packages_dir(pkg)
-        if pkg in self.no_pip_remove:  # ignore pip
-            is_ignore = True
-            before_dirs = []
-            before_files = []
-            before_shared = {}
-        else:
-            is_ignore = False
-            before_dirs = self._get_directory_names(site_packages_dir)
-            before_files = self._get_file_names(site_packages_dir)
-            before_shared = self._get_pip_shared_files(pkg)
-
-        progress: Progress | None = None
-        if self._config.show_progress and self.show_progress:
-            # display a terminal window to show progress
-            msg = self.resource_resolver.resolve_string("msg08")
-            title = self.resource_resolver.resolve_string("title01") or self.config.lo_implementation_name
-            self._logger.debug("Starting Progress Window")
-            progress = Progress(start_msg=f"{msg}: {pkg}", title=title)
-            progress.start()
-        else:
-            self._logger.debug("Progress Window is disabled")
+        is_ignore = pkg in self.no_pip_remove  # ignore pip
 
-        process = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            encoding="utf-8",
-            errors="replace",
-            text=True,
-            env=self._get_env(),
-            startupinfo=STARTUP_INFO,
-        )
+        with self._show_progress_step(pkg):
+            process = self._run_install(cmd, [pkg_cmd])
 
-        if progress:
-            self._logger.debug("Ending Progress Window")
-            progress.kill()
         if process.returncode == 0:
             if not is_ignore:
-                self._delete_json_file(site_packages_dir, pkg)
-                after_dirs = self._get_directory_names(site_packages_dir)
-                after_files = self._get_file_names(site_packages_dir)
-                after_shared = self._get_pip_shared_files(pkg)
-                changes = {
-                    "before_files": before_files,
-                    "before_dirs": before_dirs,
-                    "before_shared": before_shared,
-                    "after_files": after_files,
-                    "after_dirs": after_dirs,
-                    "after_shared": after_shared,
-                }
-                self._save_changed(pkg=pkg, pth=site_packages_dir, changes=changes)
+                self._track_installed(pkg=pkg, pth=site_packages_dir, output=process.stdout)
             self._logger.info(msg)
             return True
         else:
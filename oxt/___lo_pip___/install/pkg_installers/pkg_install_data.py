@@ -13,6 +13,8 @@ class PkgInstallData:
         self._package_version = kwargs.get("package_version", "")
         self._version = kwargs.get("version", "")
         self._data = kwargs.get("data", {})
+        self._target = kwargs.get("target", "")
+        self._updated = float(kwargs.get("updated", 0.0))
 
     def save(self, path: Path) -> None:
         with path.open("w") as f:
@@ -50,6 +52,16 @@ class PkgInstallData:
     def version(self) -> str:
         return self._version
 
+    @property
+    def target(self) -> str:
+        """Path the package is installed into."""
+        return self._target
+
+    @property
+    def updated(self) -> float:
+        """Time the package was tracked such as ``time.time()``."""
+        return self._updated
+
     @property
     def data(self) -> dict:
         return self._data
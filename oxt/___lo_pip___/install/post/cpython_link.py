@@ -6,15 +6,21 @@ This class creates symlinks for all .so files in site-packages that match the cu
 
 For example a file named ``indexers.cpython-38-x86_64-linux-gnu.so`` would be symlinked to ``indexers.cpython-3.8.so``.
 This renaming allows the python interpreter to find the import.
+
+Site-packages is walked once with ``os.scandir`` to find both the installed suffix and the files to link.
+When the paths of the packages installed in this run are known from the tracking index, see ``get_tracked_paths()``,
+only those paths are walked. Links that already point to the right file are left as they are.
 """
 
 from __future__ import annotations
-from typing import List
+from typing import Dict, Iterable, List
 from pathlib import Path
 from importlib import machinery
 import logging
+import os
 from ...config import Config
 from ...oxt_logger import OxtLogger
+from ..tracking_index import TrackingIndex
 
 
 class CPythonLink:
@@ -32,10 +38,10 @@ class CPythonLink:
         # self._suffix = self._get_current_suffix()
         self._config = Config()
         self._site_packages: Path | None = None
-        self._file_suffix = ""
+        # suffix -> files, found by _scan(). None until site-packages or the tracked paths are scanned.
+        self._found: Dict[str, List[Path]] | None = None
         if self._config.site_packages:
             self._site_packages = Path(self._config.site_packages)
-            self._file_suffix = self._find_current_installed_suffix(self._site_packages)
         self._logger.debug("CPythonLink.__init__ done")
 
     def _get_current_suffix(self) -> str:
@@ -58,12 +64,67 @@ class CPythonLink:
         count = suffix.count("-")
         return count <= 1
 
+    def _scan(self, paths: Iterable[Path]) -> Dict[str, List[Path]]:
+        """
+        Walks paths once and gets the ``.cpython-*.so`` files that are not symlinks.
+
+        Args:
+            paths (Iterable[Path]): Directories or files to scan. Usually site-packages.
+
+        Returns:
+            Dict[str, List[Path]]: Files keyed by suffix such as ``cpython-38-x86_64-linux-gnu``
+            in the order the suffixes are found.
+        """
+        found: Dict[str, List[Path]] = {}
+
+        def add(name: str, pth: str) -> None:
+            if not name.endswith(".so") or ".cpython-" not in name:
+                return
+            parts = name.rsplit(".", 2)
+            if len(parts) == 3 and parts[1].startswith("cpython-"):
+                found.setdefault(parts[1], []).append(Path(pth))
+
+        stack: List[str] = []
+        for pth in paths:
+            if pth.is_symlink():
+                continue
+            if pth.is_dir():
+                stack.append(str(pth))
+            elif pth.is_file():
+                add(pth.name, str(pth))
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_symlink():
+                            continue
+                        if entry.is_dir():
+                            stack.append(entry.path)
+                        elif entry.is_file():
+                            add(entry.name, entry.path)
+            except OSError as e:
+                self._logger.debug(f"Unable to scan {e.filename}: {e}")
+        return found
+
+    def _get_found(self) -> Dict[str, List[Path]]:
+        if self._found is None:
+            self._found = self._scan([self._site_packages]) if self._site_packages else {}
+        return self._found
+
+    def _get_scan(self, path: Path) -> Dict[str, List[Path]]:
+        return self._get_found() if path == self._site_packages else self._scan([path])
+
     def _get_all_files(self, path: Path) -> List[Path]:
-        return [p for p in path.glob(f"**/*{self._file_suffix}.so") if p.is_file()]
+        found = self._get_scan(path)
+        return found.get(next(iter(found), ""), [])
 
-    def _create_symlink(self, src: Path, dst: Path) -> None:
+    def _create_symlink(self, src: Path, dst: Path) -> bool:
         log = self._config.log_level <= logging.DEBUG
         if dst.is_symlink():
+            if os.readlink(dst) == str(src):
+                if log:
+                    self._logger.debug(f"Symlink is up to date {dst}")
+                return False
             if self._overwrite:
                 if log:
                     self._logger.debug(f"Removing existing symlink {dst}")
@@ -71,10 +132,11 @@ class CPythonLink:
             else:
                 if log:
                     self._logger.debug(f"Symlink already exists {dst}")
-                return
+                return False
         dst.symlink_to(src)
         if log:
             self._logger.debug(f"Created symlink {dst} -> {src}")
+        return True
 
     def _find_current_installed_suffix(self, path: Path) -> str:
         """
@@ -86,45 +148,67 @@ class CPythonLink:
         Returns:
             str: suffix if found, otherwise empty string.
         """
-        return next(
-            (str(p).rsplit(".", 2)[1] for p in path.glob("**/*.cpython-*.so") if not p.is_symlink()),
-            "",
-        )
+        return next(iter(self._get_scan(path)), "")
 
-    def link(self) -> None:
+    def get_tracked_paths(self, since: float) -> List[Path]:
+        """
+        Gets the paths of the packages installed in site-packages since a time from the tracking index.
+
+        Args:
+            since (float): Time such as ``time.time()`` when the install started.
+
+        Returns:
+            List[Path]: The new top level directories and files of the packages.
+            Empty if no packages were tracked since the time.
+        """
+        if not self._site_packages or not self._site_packages.exists():
+            return []
+        paths: Dict[str, Path] = {}
+        for record in TrackingIndex().get_packages(str(self._site_packages), since=since):
+            for name in record.new_dirs + record.new_files:
+                paths.setdefault(name, self._site_packages / name)
+        return list(paths.values())
+
+    def link(self, paths: Iterable[Path] | None = None) -> None:
         """
         Creates symlinks for all .so files in site-packages that match the current suffix.
+
+        Args:
+            paths (Iterable[Path], optional): Only link files in these paths such as the result of ``get_tracked_paths()``.
+                Defaults to all of site-packages.
         """
         self._logger.debug("CPythonLink.link starting")
         if not self._site_packages:
             self._logger.debug("No site-packages found")
             return
-        if not self._file_suffix:
-            self._logger.debug("No current file suffix found")
-            return
         if not self._site_packages.exists():
             self._logger.debug(f"Site-packages does not exist {self._site_packages}")
             return
-        self._logger.debug(f"Python current suffix: {self._current_suffix}")
-        self._logger.debug(f"Found file suffix: {self._file_suffix}")
-        files = self._get_all_files(self._site_packages)
-        if not files:
-            self._logger.debug(f"No files found in {self._site_packages}")
+        if paths is not None:
+            self._found = self._scan(paths)
+            self._logger.debug(f"Incremental link of {len(self._found)} suffix(es) in tracked paths")
+        if not self.file_suffix:
+            self._logger.debug("No current file suffix found")
             return
-        cp_old = self._file_suffix
+        self._logger.debug(f"Python current suffix: {self._current_suffix}")
+        self._logger.debug(f"Found file suffix: {self.file_suffix}")
+        cp_old = self.file_suffix
+        files = self._get_found()[cp_old]
         cp_new = self._current_suffix
         if cp_old == cp_new:
             self._logger.debug(f"Suffixes match, no need to link: {cp_old} == {cp_new}")
             return
 
+        created = 0
         for file in files:
             ln_name = file.name.replace(cp_old, cp_new)
             src = file
             if not src.is_absolute():
                 src = file.resolve()
             dst = src.parent / ln_name
-            self._create_symlink(src, dst)
-        self._logger.debug("CPythonLink.link done")
+            if self._create_symlink(src, dst):
+                created += 1
+        self._logger.debug(f"CPythonLink.link done. Created {created} of {len(files)} symlinks")
 
     # region Properties
     @property
@@ -153,6 +237,6 @@ class CPythonLink:
     @property
     def file_suffix(self) -> str:
         """Current Suffix such as ``cpython-38-x86_64-linux-gnu``"""
-        return self._file_suffix
+        return next(iter(self._get_found()), "")
 
     # endregion Properties
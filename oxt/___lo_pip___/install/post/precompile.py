@@ -0,0 +1,163 @@
+"""
+Compiles the packages installed in this run to bytecode in the background.
+
+The first import of a package that has no ``__pycache__`` compiles every module it imports,
+for large packages that is thousands of files and LibreOffice's python may not be able to write the cache at that time.
+After an install the paths recorded in the tracking index for the packages installed since the install started,
+see ``get_tracked_paths()``, are compiled with ``python -m compileall -j 0``.
+``compileall`` runs on LibreOffice's interpreter, ``Config().python_path``, so the cache matches the python that imports
+the packages, and compiles directories with a process pool of one process per CPU.
+The process runs with a lower priority in a ``CancellableThread`` so starting LibreOffice is not held up.
+"""
+
+from __future__ import annotations
+from typing import Dict, Iterable, List
+from pathlib import Path
+import os
+import subprocess
+import time
+
+from ...config import Config
+from ...oxt_logger import OxtLogger
+from ...thread.cancel_token import get_token
+from ...thread.cancellable_thread import CancellableThread
+from ..tracking_index import TrackingIndex
+
+if os.name == "nt":
+    STARTUP_INFO = subprocess.STARTUPINFO()  # type: ignore
+    STARTUP_INFO.dwFlags |= subprocess.STARTF_USESHOWWINDOW  # type: ignore
+    _CREATION_FLAGS = subprocess.BELOW_NORMAL_PRIORITY_CLASS  # type: ignore
+else:
+    STARTUP_INFO = None
+    _CREATION_FLAGS = 0
+
+# lowers the priority of the process and its pool workers then runs compileall as ``python -m compileall``.
+# os.nice() is called here and not in preexec_fn because preexec_fn is not safe in a process with threads.
+_RUN_COMPILEALL = (
+    "import os, runpy\n"
+    "if hasattr(os, 'nice'):\n"
+    "    os.nice(10)\n"
+    "runpy.run_module('compileall', run_name='__main__', alter_sys=True)\n"
+)
+
+
+class Precompile:
+    """Compiles the files of installed packages to bytecode."""
+
+    def __init__(self) -> None:
+        self._config = Config()
+        self._logger = OxtLogger(log_name=self.__class__.__name__)
+        self._thread: CancellableThread | None = None
+
+    # region Methods
+    def get_tracked_paths(self, since: float) -> List[Path]:
+        """
+        Gets the paths of the packages installed since a time from the tracking index.
+
+        Args:
+            since (float): Time such as ``time.time()`` when the install started.
+
+        Returns:
+            List[Path]: The new top level directories and ``.py`` files of the packages.
+            Empty if no packages were tracked since the time.
+        """
+        paths: Dict[str, Path] = {}
+        for record in TrackingIndex().get_packages(since=since):
+            if not record.target:
+                continue
+            target = Path(record.target)
+            for name in record.new_dirs:
+                pth = target / name
+                paths.setdefault(str(pth), pth)
+            for name in record.new_files:
+                if name.endswith(".py"):
+                    pth = target / name
+                    paths.setdefault(str(pth), pth)
+        return [pth for pth in paths.values() if pth.exists()]
+
+    def get_cmd(self) -> List[str]:
+        """
+        Gets the command that compiles the paths it reads from stdin, one per line.
+
+        Returns:
+            List[str]: Command to run.
+        """
+        return [str(self._config.python_path), "-c", _RUN_COMPILEALL, "-q", "-j", "0", "-i", "-"]
+
+    def compile(self, paths: Iterable[Path]) -> bool:
+        """
+        Compiles paths and waits for the compile to finish.
+
+        If called in a ``CancellableThread`` then killing the thread ends the compile.
+
+        Args:
+            paths (Iterable[Path]): Directories and files to compile such as the result of ``get_tracked_paths()``.
+
+        Returns:
+            bool: ``True`` if all files compiled; Otherwise, ``False``.
+        """
+        items = [str(pth) for pth in paths]
+        if not items:
+            self._logger.debug("compile() Nothing to compile.")
+            return True
+
+        token = get_token()
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            self.get_cmd(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            startupinfo=STARTUP_INFO,
+            creationflags=_CREATION_FLAGS,
+        )
+        with token.process(proc):
+            stdout, _ = proc.communicate("\n".join(items) + "\n")
+        token.checkpoint()
+        elapsed = time.perf_counter() - start
+        if proc.returncode == 0:
+            self._logger.info("Precompiled %i installed paths in %.3f seconds", len(items), elapsed)
+            return True
+        # packages often ship files that are not valid for this python, such as templates or tests.
+        self._logger.debug("compile() compileall output:\n%s", stdout)
+        self._logger.info(
+            "Precompiled %i installed paths in %.3f seconds, some files could not be compiled", len(items), elapsed
+        )
+        return False
+
+    def start(self, since: float) -> CancellableThread | None:
+        """
+        Compiles the packages installed since a time in a background thread.
+
+        Args:
+            since (float): Time such as ``time.time()`` when the install started.
+
+        Returns:
+            CancellableThread | None: Thread that is compiling, or ``None`` if nothing was installed since the time.
+        """
+        paths = self.get_tracked_paths(since)
+        if not paths:
+            self._logger.debug("start() No tracked paths installed since %s", since)
+            return None
+        self._logger.debug("start() Precompiling %i tracked paths in the background", len(paths))
+        self._thread = CancellableThread(target=self.compile, args=(paths,), name="precompile", daemon=True)
+        self._thread.start()
+        return self._thread
+
+    def stop(self) -> None:
+        """Ends the background compile if it is running."""
+        if self._thread is not None and self._thread.is_alive():
+            self._logger.debug("stop() Stopping precompile")
+            self._thread.kill()
+        self._thread = None
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def is_running(self) -> bool:
+        """Gets if the background compile is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    # endregion Properties
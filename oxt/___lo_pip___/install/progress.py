@@ -1,8 +1,9 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
 import subprocess
 import os
 import signal
+import threading
 
 from ..oxt_logger import OxtLogger
 from .progress_window.progress_rules import ProgressRules
@@ -17,6 +18,8 @@ class Progress:
         self._logger = OxtLogger(log_name=__name__)
         rules = ProgressRules()
         self._progress_obj = rules.get_progress()
+        # update() is optional, progress objects of rules registered before it was added do not have it.
+        self._update = getattr(self._progress_obj, "update", None)
 
     def start(self) -> None:
         """Start the progress indicator as a terminal window."""
@@ -25,6 +28,17 @@ class Progress:
             return
         self._progress_obj.start(msg=self._start_msg, title=self._title)
 
+    def update(self, msg: str) -> None:
+        """Updates the message of the progress indicator, if the indicator can show updates."""
+        if self._update is None:
+            return
+        try:
+            self._update(msg)
+        except Exception as err:
+            # the install goes on without updates.
+            self._logger.error(f"Error updating progress indicator, updates are disabled: {err}")
+            self._update = None
+
     def kill(self) -> None:
         if self._progress_obj:
             self._progress_obj.stop()
@@ -42,3 +56,72 @@ class Progress:
         except Exception as err:
             self._logger.error(f"Error killing progress indicator: {err}")
             self._proc = None
+
+
+class ProgressSession:
+    """
+    One progress indicator for several steps, such as installing each package of a requirements list.
+
+    The indicator is started by the first step and stays up until ``close()`` is called,
+    so a window is not started and stopped for each package.
+    Output lines such as the output of pip are shown under the message of the current step.
+    """
+
+    def __init__(self, title: str = "Terminal") -> None:
+        self._title = title
+        self._logger = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._progress: Progress | None = None
+        self._msg = ""
+        self._steps = 0
+
+    def step(self, msg: str) -> None:
+        """
+        Shows the message of a new step, starting the progress indicator on the first step.
+
+        Args:
+            msg (str): Message such as ``Installing: verr``.
+        """
+        with self._lock:
+            self._msg = msg
+            self._steps += 1
+            progress = self._progress
+            if progress is None:
+                self._logger.debug("Starting Progress Window")
+                self._progress = Progress(start_msg=msg, title=self._title)
+                self._progress.start()
+                return
+        progress.update(msg)
+
+    def line(self, text: str) -> None:
+        """
+        Shows a line of output under the message of the current step.
+
+        Args:
+            text (str): Line of output such as ``Downloading verr-1.1.2-py3-none-any.whl``.
+        """
+        text = text.strip()
+        progress = self._progress
+        if not text or progress is None:
+            return
+        progress.update(f"{self._msg}\n{text}")
+
+    def close(self) -> None:
+        """Stops the progress indicator."""
+        with self._lock:
+            progress = self._progress
+            self._progress = None
+        if progress is not None:
+            self._logger.debug("Ending Progress Window after %i step(s)", self._steps)
+            progress.kill()
+
+    def __enter__(self) -> ProgressSession:
+        return self
+
+    def __exit__(self, *args: Any) -> None:  # noqa: ANN401
+        self.close()
+
+    @property
+    def is_active(self) -> bool:
+        """Gets if the progress indicator is started."""
+        return self._progress is not None
@@ -1,12 +1,15 @@
 from __future__ import annotations
-import time
 import threading
+import time
 import uno
 
 from ...dialog.infinite_progress import InfiniteProgressDialog
 from ...thread.runners import run_in_thread
 from ...events.startup.startup_monitor import StartupMonitor
 
+# seconds between redraws when the message changes, about 10 redraws a second.
+_MIN_REDRAW_INTERVAL = 0.1
+
 
 class ProgressDialog:
     """A progress dialog rule."""
@@ -15,6 +18,9 @@ class ProgressDialog:
         """Initialize the progress dialog object."""
         self._is_stopped = False
         self._lock = threading.Lock()
+        # set when the message changes or the dialog is stopped so the dialog is redrawn without waiting.
+        self._changed = threading.Event()
+        self._msg = ""
         self._startup_monitor = StartupMonitor()
 
     def get_is_match(self) -> bool:
@@ -24,26 +30,44 @@ class ProgressDialog:
 
     def start(self, msg: str, title: str = "Progress") -> None:
         """Start the terminal."""
+        self._msg = msg
 
         @run_in_thread
-        def show_some_progress(ctx, s_title: str, s_msg: str) -> None:
+        def show_some_progress(ctx, s_title: str) -> None:
             # from ___lo_pip___.dialog.infinite_progress import InfiniteProgress
-            ellipsis = 0
-            in_progress = InfiniteProgressDialog(ctx, title=s_title, msg=s_msg)
+            ellipsis = 1
+            in_progress = InfiniteProgressDialog(ctx, title=s_title, msg=self._msg)
             while True:
+                self._changed.clear()
                 with self._lock:
                     if self._is_stopped:
                         break
-                ellipsis += 1
+                    s_msg = self._msg
                 in_progress.dialog.setVisible(True)
-                in_progress.update(f"{s_msg} {'.' * ellipsis}")
-                if ellipsis == 300:
-                    ellipsis = 0
-                time.sleep(1)
+                # the ellipsis is on the first line, output lines are below it.
+                first, sep, rest = s_msg.partition("\n")
+                in_progress.update(f"{first} {'.' * ellipsis}{sep}{rest}")
+                drawn = time.monotonic()
+                if self._changed.wait(1):
+                    # message changed, redraw it but not more often than the interval.
+                    remaining = _MIN_REDRAW_INTERVAL - (time.monotonic() - drawn)
+                    if remaining > 0:
+                        time.sleep(remaining)
+                else:
+                    # the ellipsis grows once a second.
+                    ellipsis = ellipsis % 300 + 1
             in_progress.dialog.dispose()
 
-        show_some_progress(uno.getComponentContext(), title, msg)
+        show_some_progress(uno.getComponentContext(), title)
+
+    def update(self, msg: str) -> None:
+        """Update the message of the dialog."""
+        with self._lock:
+            self._msg = msg
+        self._changed.set()
 
     def stop(self) -> None:
         """Stop the terminal."""
-        self._is_stopped = True
+        with self._lock:
+            self._is_stopped = True
+        self._changed.set()
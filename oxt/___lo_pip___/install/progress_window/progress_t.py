@@ -17,6 +17,14 @@ class ProgressT(Protocol):
         """Start the progress window."""
         ...
 
+    def update(self, msg: str) -> None:
+        """
+        Update the message of the progress window.
+
+        Optional, a progress object without ``update()`` is started and stopped but its message is not updated.
+        """
+        ...
+
     def stop(self) -> None:
         """Stop the progress window."""
         ...
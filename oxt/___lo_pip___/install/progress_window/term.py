@@ -21,6 +21,10 @@ while True:
 """
         return code.strip()
 
+    def update(self, msg: str) -> None:
+        """The terminal shows the start message only, updates are ignored."""
+        pass
+
     @property
     def config(self) -> Config:
         """Get the config."""
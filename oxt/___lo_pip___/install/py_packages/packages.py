@@ -4,6 +4,7 @@ import sys
 
 from .py_package import PyPackage
 from .package_config import PackageConfig
+from .requirement_table import RequirementTable, get_release_key, is_python_version_valid
 from ...config import Config
 from ...oxt_logger import OxtLogger
 from ...ver.req_version import ReqVersion
@@ -28,10 +29,44 @@ class Packages:
         # This is here for easier testing. It can be mocked in tests.
         return f"{sys.version_info[0]}.{sys.version_info[1]}.{sys.version_info[2]}"
 
+    def _get_platform(self) -> str:
+        if self._config.is_win:
+            return "win"
+        if self._config.is_mac:
+            return "mac"
+        if self._config.is_flatpak:
+            return "flatpak"
+        if self._config.is_snap:
+            return "snap"
+        return "linux"
+
+    def _load_packages_from_table(self) -> bool:
+        """
+        Load rules from the requirement table that was built with the extension.
+
+        Returns:
+            bool: ``False`` if there is no requirement table; Otherwise, ``True``.
+        """
+        platform = self._get_platform()
+        table_pkgs = RequirementTable(self._config.requirement_table).get_packages(platform)
+        if table_pkgs is None:
+            return False
+        py_key = get_release_key(self._py_ver)
+        for rule in table_pkgs:
+            gi = PyPackage.from_dict(**rule)
+            if is_python_version_valid(rule.get("python_constraints", []), py_key):
+                self._log.debug("Adding rule: %s}", gi)
+                self.add_pkg(gi)
+            else:
+                self._log.debug("Ignoring rule: %s}", gi)
+        return True
+
     def _load_packages(self) -> None:
         """
         Load rules from config
         """
+        if self._load_packages_from_table():
+            return
         ver_rules = VerRules()
 
         def check_version_constraints(rule: PyPackage) -> bool:
@@ -80,16 +115,7 @@ class Packages:
                 )
                 return False
 
-            if self._config.is_win:
-                platform = "win"
-            elif self._config.is_mac:
-                platform = "mac"
-            elif self._config.is_flatpak:
-                platform = "flatpak"
-            elif self._config.is_snap:
-                platform = "snap"
-            else:
-                platform = "linux"
+            platform = self._get_platform()
             if rule.is_ignored_platform(platform):
                 self._log.debug(
                     "is_valid() Package %s not valid for platform %s. Ignored platform", rule.name, platform
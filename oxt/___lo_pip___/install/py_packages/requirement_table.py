@@ -0,0 +1,179 @@
+"""
+Requirement table that is built when the extension is built and saved in ``config.json``.
+
+The table holds every version spec of ``tool.oxt.requirements`` and ``tool.oxt.py_packages`` already compiled
+into an interval and the pip specifier string, along with the ``py_packages`` that apply to each platform.
+At runtime the specs are looked up by their string so no version rules need to be matched on startup.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Tuple
+
+from ...ver.req_version import ReqVersion
+from ...ver.rules.ver_rules import VerRules
+from ...ver.rules.ver_spec import VerSpec
+from .py_package import PyPackage
+
+PLATFORMS = ("win", "mac", "linux", "flatpak", "snap")
+
+
+def get_release_key(ver: str) -> Tuple[int, ...]:
+    """
+    Gets the release of a version such as ``3.9.0`` as a tuple that compares the same as the version.
+
+    Args:
+        ver (str): Release version such as ``3.9`` or ``3.9.0``.
+
+    Returns:
+        Tuple[int, ...]: Release with trailing zeros removed such as ``(3, 9)``.
+    """
+    parts = [int(part) for part in ver.split(".")]
+    while parts and parts[-1] == 0:
+        parts.pop()
+    return tuple(parts)
+
+
+def is_python_version_valid(constraints: Iterable[List[Any]], py_key: Tuple[int, ...]) -> bool:
+    """
+    Checks the python version against the ``python_versions`` of a package, compiled by ``build_requirement_table()``.
+
+    The checks are the same as ``Packages`` does when the table is not available.
+
+    Args:
+        constraints (Iterable[List[Any]]): Constraints such as ``[[">=", [3, 9]]]``.
+        py_key (Tuple[int, ...]): Current python version from ``get_release_key()``.
+
+    Returns:
+        bool: ``True`` if the python version meets all constraints; Otherwise, ``False``.
+    """
+    for prefix, release in constraints:
+        key = tuple(release)
+        if prefix == ">":
+            if py_key >= key:
+                return False
+        elif prefix == ">=":
+            if py_key < key:
+                return False
+        elif prefix == "<":
+            if py_key >= key:
+                return False
+        elif prefix == "<=":
+            if py_key > key:
+                return False
+        elif prefix == "!=":
+            if key == py_key:
+                return False
+        elif prefix == "==":
+            if key != py_key:
+                return False
+        else:
+            raise ValueError(f"Unsupported operator: {prefix}")
+    return True
+
+
+def build_requirement_table(requirements: Dict[str, str], py_packages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Builds the requirement table.
+
+    Args:
+        requirements (Dict[str, str]): Requirements such as ``{"verr": ">=1.1.2"}``.
+        py_packages (List[Dict[str, Any]]): Packages from ``tool.oxt.py_packages``.
+
+    Returns:
+        Dict[str, Any]: Table with ``specs`` keyed by version spec and ``py_packages`` keyed by platform.
+    """
+    ver_rules = VerRules()
+    specs: Dict[str, Dict[str, Any]] = {}
+
+    def add_spec(vstr: str) -> None:
+        if vstr in specs:
+            return
+        rules = ver_rules.get_matched_rules(vstr)
+        specs[vstr] = {
+            "pip": ",".join(rule.get_versions_str() for rule in rules),
+            "bounds": ver_rules.compile_rules(rules).to_dict(),
+        }
+
+    add_spec("==*")
+    for vstr in requirements.values():
+        add_spec(vstr or "==*")
+
+    platforms: Dict[str, List[Dict[str, Any]]] = {platform: [] for platform in PLATFORMS}
+    for item in py_packages:
+        pkg = PyPackage.from_dict(**item)
+        add_spec(pkg.name_version[1])
+        entry = pkg.to_dict()
+        entry["pkg_type"] = "py_packages"
+        entry["python_constraints"] = []
+        for py_ver in sorted(pkg.python_versions):
+            ver = ReqVersion(py_ver)
+            entry["python_constraints"].append([ver.prefix, list(get_release_key(ver.base_version))])
+        for platform in PLATFORMS:
+            if not pkg.is_ignored_platform(platform) and pkg.is_platform(platform):
+                platforms[platform].append(entry)
+    return {"specs": specs, "py_packages": platforms}
+
+
+class RequirementTable:
+    """Read only access to the requirement table of ``config.json``."""
+
+    def __init__(self, table: Any) -> None:  # noqa: ANN401
+        """
+        Constructor
+
+        Args:
+            table (Any): The ``requirement_table`` value of ``config.json``. Anything that is not a dictionary is treated as no table.
+        """
+        self._table = table if isinstance(table, dict) else {}
+        self._specs = self._table.get("specs", {})
+        self._compiled: Dict[str, VerSpec] = {}
+
+    def get_spec(self, vstr: str) -> VerSpec | None:
+        """
+        Gets a compiled spec.
+
+        Args:
+            vstr (str): Version spec such as ``>=1.1.2``.
+
+        Returns:
+            VerSpec | None: The spec if it is in the table; Otherwise, ``None``.
+        """
+        spec = self._compiled.get(vstr)
+        if spec is None:
+            data = self._specs.get(vstr)
+            if data is None:
+                return None
+            spec = VerSpec.from_dict(data["bounds"])
+            self._compiled[vstr] = spec
+        return spec
+
+    def get_pip_spec(self, vstr: str) -> str | None:
+        """
+        Gets the pip specifier such as ``>=1.2.0, <2.0.0`` for ``^1.2``.
+
+        Args:
+            vstr (str): Version spec.
+
+        Returns:
+            str | None: The pip specifier if the spec is in the table; Otherwise, ``None``.
+        """
+        data = self._specs.get(vstr)
+        return None if data is None else str(data["pip"])
+
+    def get_packages(self, platform: str) -> List[Dict[str, Any]] | None:
+        """
+        Gets the ``py_packages`` that apply to a platform.
+
+        Args:
+            platform (str): Platform such as ``win``, ``mac``, ``linux``, ``flatpak`` or ``snap``.
+
+        Returns:
+            List[Dict[str, Any]] | None: Packages if the table is available; Otherwise, ``None``.
+        """
+        packages = self._table.get("py_packages")
+        if not isinstance(packages, dict):
+            return None
+        return packages.get(platform)
+
+    def __bool__(self) -> bool:
+        return bool(self._table)
@@ -0,0 +1,212 @@
+"""
+Read members of a zip file on a web server without downloading the whole file.
+
+A zip file keeps its table of contents, the central directory, at the end of the file.
+``RemoteZip`` gives ``zipfile.ZipFile`` a file object that reads with HTTP ``Range`` requests,
+so opening the zip fetches only the end of the file and extracting a member fetches only that member.
+This works for any zip such as the embedded python zip or a wheel.
+"""
+
+from __future__ import annotations
+from typing import Any, List
+import io
+import re
+import shutil
+import ssl
+import zipfile
+from pathlib import Path
+from urllib.request import Request, urlopen
+
+from ..oxt_logger import OxtLogger
+
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(\d+)")
+
+# end of central directory record is 22 bytes followed by a comment of up to 65535 bytes
+_TAIL_SIZE = 22 + 65535
+
+
+class RemoteZipError(Exception):
+    """Raised when a remote zip can not be read with range requests."""
+
+    pass
+
+
+class _HttpRangeFile(io.RawIOBase):
+    """Read only seekable file object that reads from a url with HTTP Range requests."""
+
+    def __init__(self, url: str, verify: bool, timeout: float, block_size: int) -> None:
+        super().__init__()
+        self._url = url
+        self._verify = verify
+        self._timeout = timeout
+        self._block_size = block_size
+        self._pos = 0
+        self._buf_start = 0
+        self._buf = b""
+        self.request_count = 0
+        # the first request gets the end of the file and the file size.
+        self._buf, self._buf_start, self._size = self._fetch(f"bytes=-{_TAIL_SIZE}")
+
+    def _fetch(self, rng: str) -> tuple:
+        req = Request(self._url, headers={"Range": rng})
+        self.request_count += 1
+        try:
+            if self._verify:
+                response = urlopen(req, timeout=self._timeout)
+            else:
+                response = urlopen(req, timeout=self._timeout, context=ssl._create_unverified_context())
+        except Exception as e:
+            raise RemoteZipError(f"Unable to read {self._url}: {e}") from e
+        with response:
+            if getattr(response, "status", 200) != 206:
+                raise RemoteZipError(f"Server does not support range requests: {self._url}")
+            match = _CONTENT_RANGE.match(response.headers.get("Content-Range", ""))
+            if match is None:
+                raise RemoteZipError(f"Invalid Content-Range from {self._url}")
+            data = response.read()
+        start, end, size = (int(g) for g in match.groups())
+        if len(data) != end - start + 1:
+            raise RemoteZipError(f"Incomplete range from {self._url}")
+        return data, start, size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        self._pos = max(0, self._pos)
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            size = self._size - self._pos
+        size = min(size, self._size - self._pos)
+        if size <= 0:
+            return b""
+        offset = self._pos - self._buf_start
+        if offset < 0 or offset + size > len(self._buf):
+            # read ahead so small reads such as zip headers do not each need a request
+            end = min(self._size, self._pos + max(size, self._block_size)) - 1
+            self._buf, self._buf_start, _ = self._fetch(f"bytes={self._pos}-{end}")
+            offset = 0
+        data = self._buf[offset : offset + size]
+        self._pos += len(data)
+        return data
+
+    def readinto(self, b: Any) -> int:  # noqa: ANN401
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    @property
+    def size(self) -> int:
+        """Gets the size of the remote file."""
+        return self._size
+
+
+class RemoteZip:
+    """Reads members of a zip file on a web server using HTTP Range requests."""
+
+    def __init__(self, url: str, verify: bool = True, timeout: float = 30.0, block_size: int = 256 * 1024) -> None:
+        """
+        Constructor
+
+        Reads the central directory of the remote zip.
+
+        Args:
+            url (str): Url of the zip file.
+            verify (bool, optional): Verify ssl. Defaults to True.
+            timeout (float, optional): Timeout in seconds of each request. Defaults to 30.
+            block_size (int, optional): Min bytes read by each request. Defaults to 256 KiB.
+
+        Raises:
+            RemoteZipError: If the server does not support range requests or the file is not a zip file.
+        """
+        self._logger = OxtLogger(log_name=__name__)
+        self._url = url
+        self._file = _HttpRangeFile(url=url, verify=verify, timeout=timeout, block_size=block_size)
+        try:
+            self._zip = zipfile.ZipFile(self._file)  # type: ignore[arg-type]
+        except zipfile.BadZipFile as e:
+            raise RemoteZipError(f"Not a zip file: {url}") from e
+
+    def __enter__(self) -> RemoteZip:
+        return self
+
+    def __exit__(self, *args: Any) -> None:  # noqa: ANN401
+        self.close()
+
+    def close(self) -> None:
+        """Closes the zip."""
+        self._zip.close()
+
+    def namelist(self) -> List[str]:
+        """Gets the names of the zip members."""
+        return self._zip.namelist()
+
+    def read(self, member: str) -> bytes:
+        """
+        Reads a member.
+
+        Args:
+            member (str): Member name such as ``_bz2.pyd``.
+
+        Raises:
+            KeyError: If the member is not in the zip.
+            RemoteZipError: If the member can not be read.
+
+        Returns:
+            bytes: Member data. The CRC of the data is checked by ``zipfile``.
+        """
+        try:
+            return self._zip.read(member)
+        except zipfile.BadZipFile as e:
+            raise RemoteZipError(f"Unable to read {member} from {self._url}: {e}") from e
+
+    def extract(self, member: str, dst: str | Path) -> Path:
+        """
+        Extracts a member to a file.
+
+        Args:
+            member (str): Member name such as ``_bz2.pyd``.
+            dst (str | Path): File to write.
+
+        Raises:
+            KeyError: If the member is not in the zip.
+            RemoteZipError: If the member can not be read.
+
+        Returns:
+            Path: ``dst``.
+        """
+        dst = Path(dst)
+        part = dst.with_name(f"{dst.name}.part")
+        try:
+            with self._zip.open(member) as src, open(part, "wb") as f:
+                shutil.copyfileobj(src, f)
+            part.replace(dst)
+        except zipfile.BadZipFile as e:
+            raise RemoteZipError(f"Unable to read {member} from {self._url}: {e}") from e
+        finally:
+            part.unlink(missing_ok=True)
+        self._logger.debug(
+            "extract() %s extracted with %i requests, %i byte zip", member, self._file.request_count, self._file.size
+        )
+        return dst
+
+    @property
+    def request_count(self) -> int:
+        """Gets the number of range requests made so far."""
+        return self._file.request_count
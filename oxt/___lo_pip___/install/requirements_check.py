@@ -7,14 +7,16 @@ No Internet needed.
 from __future__ import annotations
 
 import importlib.util
-from importlib.metadata import PackageNotFoundError, version
 
 from ..config import Config
 from ..ver.rules.ver_rules import VerRules
+from ..ver.rules.ver_spec import VerSpec
 from ..oxt_logger import OxtLogger
 from ..meta.singleton import Singleton
+from .distribution_index import DistributionIndex
 from .py_packages.packages import Packages
 from .py_packages.py_package import PyPackage
+from .py_packages.requirement_table import RequirementTable
 from ..settings.install_settings import InstallSettings
 
 
@@ -25,6 +27,7 @@ class RequirementsCheck(metaclass=Singleton):
         self._log = OxtLogger(log_name=__name__)
         self._config = Config()
         self._ver_rules = VerRules()
+        self._req_table = RequirementTable(self._config.requirement_table)
 
     def run_imports_ready(self, *other_mods: str) -> bool:
         """
@@ -90,10 +93,8 @@ class RequirementsCheck(metaclass=Singleton):
             self._log.error("Requirements not met. Tested config requirements.")
             return False
 
-        ver_rules = VerRules()
-
         def check_installed_valid(pkg: PyPackage) -> bool:
-            nonlocal ver_rules, install_settings
+            nonlocal install_settings
             if pkg.name in install_settings.no_install_packages:
                 self._log.debug("Package %s is in the no install list. Not checking and continuing.", pkg.name)
                 return True
@@ -103,7 +104,7 @@ class RequirementsCheck(metaclass=Singleton):
                 return False
             try:
                 _, pkg_ver = pkg.name_version
-                return ver_rules.get_installed_is_valid(vstr=pkg_ver, check_version=ver_str)
+                return self._get_spec(pkg_ver).is_valid(ver_str)
             except Exception as e:
                 self._log.error(e)
             return False
@@ -116,6 +117,24 @@ class RequirementsCheck(metaclass=Singleton):
         self._log.info("Requirements are met")
         return True
 
+    def _get_spec(self, vstr: str) -> VerSpec:
+        """
+        Gets the compiled spec for a version spec.
+
+        The spec is read from the requirement table built with the extension when it is there;
+        Otherwise, it is compiled from the version rules.
+
+        Args:
+            vstr (str): Version spec such as ``>=1.0.0``
+
+        Returns:
+            VerSpec: Compiled spec.
+        """
+        spec = self._req_table.get_spec(vstr)
+        if spec is None:
+            spec = self._ver_rules.compile(vstr)
+        return spec
+
     def _get_package_version(self, package_name: str) -> str:
         """
         Get the version of an installed package.
@@ -126,10 +145,7 @@ class RequirementsCheck(metaclass=Singleton):
         Returns:
             str: The version of the package or an empty string if the package is not installed.
         """
-        try:
-            return version(package_name)
-        except PackageNotFoundError:
-            return ""
+        return DistributionIndex().get_version(package_name)
 
     def _is_valid_version(self, name: str, ver: str) -> int:
         """
@@ -150,17 +166,16 @@ class RequirementsCheck(metaclass=Singleton):
         if not ver:
             # set default version to >=0.0.0
             ver = "==*"
-        rules = self._ver_rules.get_matched_rules(ver)
+        spec = self._get_spec(ver)
         self._log.debug("Found Package %s %s already installed ...", name, pkg_ver)
-        if not rules:
+        if not spec:
             if pkg_ver:
                 self._log.info("Package %s %s already installed, no rules", name, pkg_ver)
             else:
                 self._log.error("Unable to find rules for %s %s", name, ver)
             return -1
 
-        rules_pass = self._ver_rules.get_installed_is_valid_by_rules(rules=rules, check_version=pkg_ver)
-        if rules_pass is False:
+        if not spec.is_valid(pkg_ver):
             self._log.info(
                 "Package %s %s already installed. It does not meet requirements specified by: %s",
                 name,
@@ -0,0 +1,169 @@
+"""
+Persisted fingerprint of a startup where all requirements were met.
+
+When LibreOffice starts again and nothing that could change the requirements check has changed,
+the requirements check can be skipped. The fingerprint holds a hash of ``config.json``, the python version
+and the modification times of the directories that hold the installed requirements.
+Installing or removing a distribution changes the modification time of the directory it lives in,
+so comparing modification times is enough to know the last check is still valid.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Set
+from pathlib import Path
+import hashlib
+import importlib.metadata
+import json
+import os
+import sys
+import tempfile
+
+from ..config import Config
+from ..input_output import file_util
+from ..lo_util.target_path import TargetPath
+from ..meta.singleton import Singleton
+from ..oxt_logger import OxtLogger
+from .py_packages.packages import Packages
+
+
+class StartupFingerprint(metaclass=Singleton):
+    """Manages the startup fingerprint file in the LibreOffice user profile."""
+
+    def __init__(self) -> None:
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._config = Config()
+        self._config_file = Path(__file__).parent.parent / "config.json"
+        self._fingerprint_file = Path(
+            file_util.get_user_profile_path(True),
+            f"{self._config.lo_implementation_name}_startup.json",
+        )
+
+    # region Methods
+    def _get_mtime(self, pth: str) -> int:
+        try:
+            return os.stat(pth).st_mtime_ns
+        except OSError:
+            return -1
+
+    def _get_config_stat(self) -> List[int]:
+        try:
+            st = os.stat(self._config_file)
+            return [st.st_mtime_ns, st.st_size]
+        except OSError:
+            return [-1, -1]
+
+    def _get_config_hash(self) -> str:
+        try:
+            with open(self._config_file, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return ""
+
+    def _get_requirement_names(self) -> List[str]:
+        names = list(self._config.requirements.keys())
+        names.extend(pkg.name for pkg in Packages().packages)
+        return names
+
+    def _get_watch_paths(self, names: Iterable[str]) -> Set[str]:
+        """
+        Gets the directories to watch for the distributions.
+
+        Args:
+            names (Iterable[str]): Distribution names such as ``verr``.
+
+        Returns:
+            Set[str]: The target directories, the directory of each distribution and each distribution dist-info folder.
+        """
+        paths = {pth for pth in TargetPath().get_targets() if pth}
+        for name in names:
+            try:
+                dist = importlib.metadata.distribution(name)
+            except importlib.metadata.PackageNotFoundError:
+                continue
+            location = str(dist.locate_file(""))
+            if os.path.isdir(location):
+                paths.add(location)
+            dist_path = getattr(dist, "_path", None)
+            if dist_path is not None and os.path.isdir(str(dist_path)):
+                paths.add(str(dist_path))
+        return paths
+
+    def _get_saved_paths(self, value: Any) -> Dict[str, int]:  # noqa: ANN401
+        if not isinstance(value, dict):
+            return {}
+        return {str(k): v for k, v in value.items() if isinstance(v, int)}
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self._fingerprint_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def is_match(self) -> bool:
+        """
+        Gets if the saved fingerprint matches the current state.
+
+        Returns:
+            bool: ``True`` if the last requirements check is still valid; Otherwise, ``False``.
+        """
+        data = self._read()
+        if not data:
+            self._log.debug("is_match() No startup fingerprint.")
+            return False
+        if data.get("python") != sys.version:
+            self._log.debug("is_match() Python version changed.")
+            return False
+        if data.get("config_stat") != self._get_config_stat() and data.get("config_hash") != self._get_config_hash():
+            self._log.debug("is_match() config.json changed.")
+            return False
+        paths = self._get_saved_paths(data.get("paths"))
+        if not paths:
+            return False
+        for pth, mtime in paths.items():
+            if self._get_mtime(pth) != mtime:
+                self._log.debug("is_match() Path changed: %s", pth)
+                return False
+        return True
+
+    def save(self) -> None:
+        """
+        Saves the fingerprint of the current state.
+
+        Should only be called after the requirements check has passed.
+        """
+        try:
+            paths = self._get_watch_paths(self._get_requirement_names())
+            data = {
+                "python": sys.version,
+                "config_hash": self._get_config_hash(),
+                "config_stat": self._get_config_stat(),
+                "paths": {pth: self._get_mtime(pth) for pth in sorted(paths)},
+            }
+            fd, tmp_name = tempfile.mkstemp(dir=str(self._fingerprint_file.parent), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=4)
+            os.replace(tmp_name, self._fingerprint_file)
+            self._log.debug("save() Startup fingerprint saved to %s", self._fingerprint_file)
+        except Exception as e:
+            self._log.error("save() Unable to save startup fingerprint: %s", e)
+
+    def invalidate(self) -> None:
+        """Removes the fingerprint so the next startup runs the full requirements check."""
+        try:
+            if self._fingerprint_file.exists():
+                self._fingerprint_file.unlink()
+                self._log.debug("invalidate() Startup fingerprint removed.")
+        except OSError as e:
+            self._log.error("invalidate() Unable to remove startup fingerprint: %s", e)
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def fingerprint_file(self) -> Path:
+        """Gets the fingerprint file path."""
+        return self._fingerprint_file
+
+    # endregion Properties
@@ -0,0 +1,388 @@
+"""
+Index of the directories and files installed for each package.
+
+One store in the LibreOffice user profile replaces the ``{lo_implementation_name}_{pkg}.json`` tracking file
+that was written into each target path for each package. Saving or removing a package only changes the rows
+of that package, and the packages of all targets are listed with one query.
+
+The store is a ``sqlite3`` database. The python that comes with LibreOffice on some systems is built without
+``sqlite3``, in that case the same records are kept in a single json file.
+
+Tracking files written by earlier versions are imported the first time a target path is used and then removed.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from pathlib import Path
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+from ..config import Config
+from ..input_output import file_util
+from ..meta.singleton import Singleton
+from ..oxt_logger import OxtLogger
+from .pkg_installers.pkg_install_data import PkgInstallData
+
+TYPE_ID = "pkg_tracker"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS packages (
+    id INTEGER PRIMARY KEY,
+    target TEXT NOT NULL,
+    name TEXT NOT NULL,
+    package_version TEXT NOT NULL DEFAULT '',
+    version TEXT NOT NULL DEFAULT '',
+    updated REAL NOT NULL DEFAULT 0,
+    UNIQUE (target, name)
+);
+CREATE TABLE IF NOT EXISTS entries (
+    package_id INTEGER NOT NULL REFERENCES packages (id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    path TEXT NOT NULL,
+    PRIMARY KEY (package_id, kind, path)
+);
+CREATE INDEX IF NOT EXISTS packages_updated ON packages (updated);
+CREATE TABLE IF NOT EXISTS migrated (target TEXT PRIMARY KEY);
+"""
+
+
+class _SqliteStore:
+    """Records in a sqlite3 database. ``kind`` of an entry is the data key such as ``new_dirs``."""
+
+    def __init__(self, db_file: Path) -> None:
+        self._db_file = db_file
+        self._conn: Any = None
+
+    def _get_conn(self) -> Any:  # noqa: ANN401
+        if self._conn is None:
+            self._db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._db_file), timeout=30.0, check_same_thread=False)  # type: ignore
+            conn.execute("PRAGMA foreign_keys = ON")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def save(self, record: PkgInstallData) -> None:
+        conn = self._get_conn()
+        with conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO packages (target, name) VALUES (?, ?)", (record.target, record.package)
+            )
+            conn.execute(
+                "UPDATE packages SET package_version = ?, version = ?, updated = ? WHERE target = ? AND name = ?",
+                (record.package_version, record.version, record.updated, record.target, record.package),
+            )
+            (pkg_id,) = conn.execute(
+                "SELECT id FROM packages WHERE target = ? AND name = ?", (record.target, record.package)
+            ).fetchone()
+            conn.execute("DELETE FROM entries WHERE package_id = ?", (pkg_id,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO entries (package_id, kind, path) VALUES (?, ?, ?)",
+                [(pkg_id, kind, pth) for kind, paths in record.data.items() for pth in paths],
+            )
+
+    def remove(self, target: str, name: str) -> bool:
+        conn = self._get_conn()
+        with conn:
+            cursor = conn.execute("DELETE FROM packages WHERE target = ? AND name = ?", (target, name))
+        return cursor.rowcount > 0
+
+    def find(self, targets: Iterable[str], names: Iterable[str], since: float) -> List[PkgInstallData]:
+        sql = (
+            "SELECT p.id, p.target, p.name, p.package_version, p.version, p.updated, e.kind, e.path "
+            "FROM packages p LEFT JOIN entries e ON e.package_id = p.id WHERE p.updated >= ?"
+        )
+        params: List[Any] = [since]
+        for column, values in (("p.target", list(targets)), ("p.name", list(names))):
+            if values:
+                sql += f" AND {column} IN ({', '.join('?' * len(values))})"
+                params.extend(values)
+        sql += " ORDER BY p.target, p.name, e.kind, e.path"
+
+        records: Dict[int, Dict[str, Any]] = {}
+        for pkg_id, target, name, pkg_ver, ver, updated, kind, pth in self._get_conn().execute(sql, params):
+            rec = records.get(pkg_id)
+            if rec is None:
+                rec = {
+                    "package": name,
+                    "target": target,
+                    "package_version": pkg_ver,
+                    "version": ver,
+                    "updated": updated,
+                    "data": {},
+                }
+                records[pkg_id] = rec
+            if kind is not None:
+                rec["data"].setdefault(kind, []).append(pth)
+        return [PkgInstallData(type_id=TYPE_ID, **rec) for rec in records.values()]
+
+    def get_migrated(self) -> Set[str]:
+        return {row[0] for row in self._get_conn().execute("SELECT target FROM migrated")}
+
+    def set_migrated(self, target: str, records: List[PkgInstallData]) -> None:
+        for record in records:
+            self.save(record)
+        conn = self._get_conn()
+        with conn:
+            conn.execute("INSERT OR IGNORE INTO migrated (target) VALUES (?)", (target,))
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class _JsonStore:
+    """Records in a single json file, used when ``sqlite3`` can not be imported."""
+
+    def __init__(self, json_file: Path) -> None:
+        self._json_file = json_file
+        self._data: Dict[str, Any] | None = None
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is None:
+            try:
+                with open(self._json_file, "r", encoding="utf-8") as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError):
+                self._data = {}
+            self._data.setdefault("packages", {})
+            self._data.setdefault("migrated", [])
+        return self._data
+
+    def _write(self) -> None:
+        self._json_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self._json_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(self._load(), f)
+        os.replace(tmp, self._json_file)
+
+    def _set(self, record: PkgInstallData) -> None:
+        packages = self._load()["packages"]
+        packages.setdefault(record.target, {})[record.package] = {
+            "package_version": record.package_version,
+            "version": record.version,
+            "updated": record.updated,
+            "data": record.data,
+        }
+
+    def save(self, record: PkgInstallData) -> None:
+        self._set(record)
+        self._write()
+
+    def remove(self, target: str, name: str) -> bool:
+        packages = self._load()["packages"].get(target, {})
+        if packages.pop(name, None) is None:
+            return False
+        self._write()
+        return True
+
+    def find(self, targets: Iterable[str], names: Iterable[str], since: float) -> List[PkgInstallData]:
+        target_set = set(targets)
+        name_set = set(names)
+        results: List[PkgInstallData] = []
+        for target, packages in sorted(self._load()["packages"].items()):
+            if target_set and target not in target_set:
+                continue
+            for name, rec in sorted(packages.items()):
+                if (name_set and name not in name_set) or rec.get("updated", 0) < since:
+                    continue
+                results.append(PkgInstallData(type_id=TYPE_ID, package=name, target=target, **rec))
+        return results
+
+    def get_migrated(self) -> Set[str]:
+        return set(self._load()["migrated"])
+
+    def set_migrated(self, target: str, records: List[PkgInstallData]) -> None:
+        for record in records:
+            self._set(record)
+        self._load()["migrated"].append(target)
+        self._write()
+
+    def close(self) -> None:
+        self._data = None
+
+
+class TrackingIndex(metaclass=Singleton):
+    """Singleton Class. Directories and files installed for each package, in each target path."""
+
+    def __init__(self, store_file: str | Path = "") -> None:
+        """
+        Constructor
+
+        Args:
+            store_file (str, Path, optional): Database file. Defaults to ``{lo_implementation_name}_tracking.sqlite``
+                in the user profile. When ``sqlite3`` is not available the suffix is changed to ``.json``.
+        """
+        self._config = Config()
+        self._log = OxtLogger(log_name=self.__class__.__name__)
+        self._lock = threading.RLock()
+        if store_file:
+            pth = Path(store_file)
+        else:
+            pth = Path(
+                file_util.get_user_profile_path(True),
+                f"{self._config.lo_implementation_name}_tracking.sqlite",
+            )
+        if sqlite3 is None:
+            self._log.debug("sqlite3 is not available, tracking index is stored as json.")
+            self._store_file = pth.with_suffix(".json")
+            self._store: _SqliteStore | _JsonStore = _JsonStore(self._store_file)
+        else:
+            self._store_file = pth
+            self._store = _SqliteStore(pth)
+        self._migrated: Set[str] | None = None
+
+    # region Migration
+    def _read_json_files(self, target: str) -> List[Tuple[Path, PkgInstallData]]:
+        results: List[Tuple[Path, PkgInstallData]] = []
+        prefix = f"{self._config.lo_implementation_name}_"
+        try:
+            it = os.scandir(target)
+        except OSError:
+            return results
+        with it:
+            for entry in it:
+                if not (entry.name.startswith(prefix) and entry.name.endswith(".json") and entry.is_file()):
+                    continue
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as f:
+                        json_data = json.load(f)
+                    updated = entry.stat().st_mtime
+                except (OSError, ValueError) as e:
+                    self._log.debug("_read_json_files() Unable to read %s: %s", entry.path, e)
+                    continue
+                if not isinstance(json_data, dict) or json_data.get("type_id") != TYPE_ID:
+                    continue
+                if not json_data.get("package"):
+                    continue
+                json_data["target"] = target
+                json_data["updated"] = updated
+                results.append((Path(entry.path), PkgInstallData(**json_data)))
+        return results
+
+    def migrate(self, *targets: str) -> int:
+        """
+        Imports the tracking json files of target paths that have not been imported before.
+
+        Args:
+            targets (str): Target paths such as site-packages.
+
+        Returns:
+            int: Number of packages imported.
+        """
+        count = 0
+        with self._lock:
+            if self._migrated is None:
+                self._migrated = self._store.get_migrated()
+            for target in targets:
+                if not target or target in self._migrated:
+                    continue
+                found = self._read_json_files(target)
+                self._store.set_migrated(target, [record for _, record in found])
+                self._migrated.add(target)
+                for json_file, _ in found:
+                    try:
+                        json_file.unlink()
+                    except OSError as e:
+                        self._log.warning("migrate() Unable to remove %s: %s", json_file, e)
+                if found:
+                    self._log.info("migrate() Imported %i tracking files from %s", len(found), target)
+                count += len(found)
+        return count
+
+    # endregion Migration
+
+    # region Methods
+    def save(self, pkg: str, target: str, data: Dict[str, List[str]], package_version: str = "") -> None:
+        """
+        Saves the directories and files installed for a package, replacing any that were saved before.
+
+        Args:
+            pkg (str): Package name.
+            target (str): Path the package is installed into.
+            data (Dict[str, List[str]]): Keyed by ``new_dirs``, ``new_files`` and ``new_{shared_dir}_files``.
+            package_version (str, optional): Installed version of the package. Defaults to "".
+        """
+        record = PkgInstallData(
+            id=f"{self._config.oxt_name}_pip_pkg",
+            type_id=TYPE_ID,
+            package=pkg,
+            package_version=package_version,
+            version=self._config.extension_version,
+            target=target,
+            updated=time.time(),
+            data={key: sorted(values) for key, values in data.items()},
+        )
+        with self._lock:
+            self.migrate(target)
+            self._store.save(record)
+
+    def get(self, pkg: str, target: str) -> PkgInstallData | None:
+        """
+        Gets the directories and files installed for a package.
+
+        Args:
+            pkg (str): Package name.
+            target (str): Path the package is installed into.
+
+        Returns:
+            PkgInstallData | None: Tracked data if the package is tracked; Otherwise, ``None``.
+        """
+        records = self.get_packages(target, names=[pkg])
+        return records[0] if records else None
+
+    def get_packages(self, *targets: str, names: Iterable[str] = (), since: float = 0.0) -> List[PkgInstallData]:
+        """
+        Gets tracked packages with one query.
+
+        Args:
+            targets (str): Target paths. Defaults to all target paths.
+            names (Iterable[str], optional): Package names. Defaults to all packages.
+            since (float, optional): Only packages saved at or after this time such as ``time.time()``. Defaults to 0.0.
+
+        Returns:
+            List[PkgInstallData]: Tracked packages ordered by target and name.
+        """
+        with self._lock:
+            self.migrate(*targets)
+            return self._store.find(targets, names, since)
+
+    def remove(self, pkg: str, target: str) -> bool:
+        """
+        Removes the tracked data of a package.
+
+        Args:
+            pkg (str): Package name.
+            target (str): Path the package is installed into.
+
+        Returns:
+            bool: ``True`` if the package was tracked; Otherwise, ``False``.
+        """
+        with self._lock:
+            self.migrate(target)
+            return self._store.remove(target, pkg)
+
+    def close(self) -> None:
+        """Closes the store, it is opened again when next used."""
+        with self._lock:
+            self._store.close()
+            self._migrated = None
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def store_file(self) -> Path:
+        """Gets the file the index is stored in."""
+        return self._store_file
+
+    # endregion Properties
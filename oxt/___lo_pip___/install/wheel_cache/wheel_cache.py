@@ -0,0 +1,274 @@
+"""
+Local wheel store shared by every LibreOffice profile that points to the same cache directory.
+
+Wheels are kept in a single flat directory so the directory can be handed to pip via ``--find-links``.
+Each wheel is keyed by its file name, which holds the distribution name, version and the python, abi and platform tags.
+An ``index.json`` file in the same directory records the size, sha256 and last use time of each wheel.
+When the total size of the cache is over its budget the least recently used wheels are removed first.
+A cache directory can be shared by interpreters of other versions or platforms, ``find()`` only returns wheels
+whose tags are supported by the interpreter that installs, by default the running one.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, Iterable, List, Tuple
+from pathlib import Path
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+
+from packaging.tags import Tag, parse_tag, sys_tags
+
+from ...ver.rules.ver_rules import VerRules
+from ..distribution_index import DistributionIndex
+
+
+class WheelCache:
+    """Content addressed local wheel store with least recently used eviction."""
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, root: str | Path, max_size: int, supported_tags: Iterable[Tag] | None = None) -> None:
+        """
+        Constructor
+
+        Args:
+            root (str | Path): Directory the wheels are stored in. Created if it does not exist.
+            max_size (int): Size budget of the cache in bytes.
+            supported_tags (Iterable[Tag], optional): Tags of the interpreter that installs.
+                Defaults to ``packaging.tags.sys_tags()`` of the running interpreter.
+        """
+        self._root = Path(root)
+        self._max_size = max_size
+        self._supported_tags: FrozenSet[Tag] | None = None if supported_tags is None else frozenset(supported_tags)
+        self._ver_rules = VerRules()
+        self._hits = 0
+        self._misses = 0
+        self._root.mkdir(parents=True, exist_ok=True)
+
+    # region Static Methods
+    @staticmethod
+    def parse_wheel_name(file_name: str) -> Tuple[str, str, str]:
+        """
+        Splits a wheel file name into its parts.
+
+        Args:
+            file_name (str): File name such as ``verr-1.1.2-py3-none-any.whl``.
+
+        Returns:
+            Tuple[str, str, str]: Normalized name, version and tag such as ``("verr", "1.1.2", "py3-none-any")``.
+            Empty strings are returned if the file name is not a valid wheel name.
+        """
+        if not file_name.endswith(".whl"):
+            return "", "", ""
+        parts = file_name[:-4].split("-")
+        # name-version(-build)?-python-abi-platform
+        if len(parts) not in (5, 6):
+            return "", "", ""
+        return DistributionIndex.canonical_name(parts[0]), parts[1], "-".join(parts[-3:])
+
+    # endregion Static Methods
+
+    # region Index
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        index_path = self._root / self.INDEX_NAME
+        if not index_path.exists():
+            return {}
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            # a damaged index is rebuilt by sync()
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def _write_index(self, index: Dict[str, Dict[str, Any]]) -> None:
+        # write to a temp file first so other profiles never read a partial index
+        fd, tmp_name = tempfile.mkstemp(dir=str(self._root), prefix=".index-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(index, f, indent=4)
+            os.replace(tmp_name, self._root / self.INDEX_NAME)
+        except Exception:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+            raise
+
+    def _get_sha256(self, pth: Path) -> str:
+        sha = hashlib.sha256()
+        with open(pth, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                sha.update(chunk)
+        return sha.hexdigest()
+
+    def sync(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Brings the index in line with the wheels in the cache directory.
+
+        New wheels, such as the ones written by ``pip download``, are added and entries for missing wheels are dropped.
+        A wheel whose size changed since it was indexed is hashed again.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The updated index keyed by wheel file name.
+        """
+        index = self._read_index()
+        now = time.time()
+        found: Dict[str, Dict[str, Any]] = {}
+        with os.scandir(self._root) as it:
+            for entry in it:
+                if not entry.is_file() or not entry.name.endswith(".whl"):
+                    continue
+                size = entry.stat().st_size
+                item = index.get(entry.name)
+                if item is None or item.get("size") != size:
+                    item = {"size": size, "sha256": self._get_sha256(Path(entry.path)), "last_used": now}
+                found[entry.name] = item
+        if found != index:
+            self._write_index(found)
+        return found
+
+    # endregion Index
+
+    def is_supported(self, tag: str) -> bool:
+        """
+        Gets if a wheel tag can be installed by the interpreter of this cache.
+
+        Args:
+            tag (str): Wheel tag such as ``py3-none-any`` or ``cp311-cp311-win_amd64``.
+
+        Returns:
+            bool: ``True`` if any of the tags is supported; Otherwise, ``False``.
+        """
+        if self._supported_tags is None:
+            self._supported_tags = frozenset(sys_tags())
+        try:
+            return not self._supported_tags.isdisjoint(parse_tag(tag))
+        except ValueError:
+            return False
+
+    def find(self, name: str, vstr: str = "") -> List[Path]:
+        """
+        Finds cached wheels for a distribution that meet a version constraint and are supported by the interpreter.
+
+        Each call counts as a cache hit when a wheel is found; otherwise, as a cache miss.
+
+        Args:
+            name (str): Distribution name such as ``verr``.
+            vstr (str, optional): Version constraint such as ``>=1.1.2`` or ``>=1.0.0, <2.0.0``.
+                If omitted any version matches. Defaults to "".
+
+        Returns:
+            List[Path]: Matching wheel paths. Empty if there is no match.
+        """
+        c_name = DistributionIndex.canonical_name(name)
+        rules = self._ver_rules.get_matched_rules(vstr) if vstr else []
+        results: List[Path] = []
+        with os.scandir(self._root) as it:
+            for entry in it:
+                w_name, w_ver, w_tag = self.parse_wheel_name(entry.name)
+                if w_name != c_name or not self.is_supported(w_tag):
+                    continue
+                if rules:
+                    try:
+                        if not self._ver_rules.get_installed_is_valid_by_rules(rules, w_ver):
+                            continue
+                    except Exception:
+                        # version that can not be compared, such as a local version label
+                        continue
+                results.append(Path(entry.path))
+        if results:
+            self._hits += 1
+        else:
+            self._misses += 1
+        return results
+
+    def touch(self, file_names: Iterable[str]) -> None:
+        """
+        Marks wheels as used now so they are the last to be evicted.
+
+        Args:
+            file_names (Iterable[str]): Wheel file names such as ``verr-1.1.2-py3-none-any.whl``.
+        """
+        names = set(file_names)
+        if not names:
+            return
+        index = self.sync()
+        now = time.time()
+        changed = False
+        for name in names:
+            if name in index:
+                index[name]["last_used"] = now
+                changed = True
+        if changed:
+            self._write_index(index)
+
+    def touch_from_output(self, output: str) -> None:
+        """
+        Marks the cached wheels named in pip output as used.
+
+        Args:
+            output (str): The stdout of a pip command that ran with ``--find-links`` pointing to this cache.
+        """
+        if not output:
+            return
+        names = re.findall(r"([A-Za-z0-9_.+!-]+\.whl)", output)
+        self.touch(name for name in names if (self._root / name).exists())
+
+    def evict(self) -> List[str]:
+        """
+        Removes the least recently used wheels until the cache size is within its budget.
+
+        Returns:
+            List[str]: File names of the removed wheels.
+        """
+        index = self.sync()
+        total = sum(int(item.get("size", 0)) for item in index.values())
+        removed: List[str] = []
+        if total <= self._max_size:
+            return removed
+        for name, item in sorted(index.items(), key=lambda kv: kv[1].get("last_used", 0)):
+            if total <= self._max_size:
+                break
+            try:
+                (self._root / name).unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                # most likely in use by another profile, try the next one
+                continue
+            total -= int(item.get("size", 0))
+            removed.append(name)
+        for name in removed:
+            del index[name]
+        self._write_index(index)
+        return removed
+
+    # region Properties
+    @property
+    def root(self) -> Path:
+        """Gets the cache directory."""
+        return self._root
+
+    @property
+    def max_size(self) -> int:
+        """Gets the cache size budget in bytes."""
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """Gets the current total size in bytes of the cached wheels."""
+        return sum(int(item.get("size", 0)) for item in self.sync().values())
+
+    @property
+    def hits(self) -> int:
+        """Gets the number of ``find()`` calls that found a wheel."""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Gets the number of ``find()`` calls that did not find a wheel."""
+        return self._misses
+
+    # endregion Properties
@@ -0,0 +1,51 @@
+"""
+Constructor of a UNO component that imports the component module on first use.
+
+``g_ImplementationHelper.addImplementation()`` only needs a callable that creates the component,
+``unohelper`` calls it as ``ctor(ctx)`` or ``ctor(ctx, *args)``. Registering a ``LazyFactory`` instead of the class
+means the module of the component, such as an options dialog handler, is not imported when LibreOffice loads
+``py_runner.py`` but when LibreOffice creates the component for the first time.
+"""
+
+from __future__ import annotations
+from typing import Any
+import importlib
+
+
+class LazyFactory:
+    """Creates instances of a class that is imported when the first instance is created."""
+
+    def __init__(self, module_name: str, class_name: str) -> None:
+        """
+        Constructor.
+
+        Args:
+            module_name (str): Absolute name of the module such as ``___lo_pip___.dialog.handler.uninstall``.
+            class_name (str): Name of the component class in the module.
+        """
+        self._module_name = module_name
+        self._class_name = class_name
+        self._clazz: Any = None
+
+    def __call__(self, ctx: Any, *args: Any) -> Any:  # noqa: ANN401
+        return self.get_class()(ctx, *args)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._module_name!r}, {self._class_name!r})"
+
+    def get_class(self) -> Any:  # noqa: ANN401
+        """
+        Gets the component class, importing its module if needed.
+
+        Returns:
+            Any: Component class.
+        """
+        if self._clazz is None:
+            module = importlib.import_module(self._module_name)
+            self._clazz = getattr(module, self._class_name)
+        return self._clazz
+
+    @property
+    def is_loaded(self) -> bool:
+        """Gets if the module of the component has been imported by this factory."""
+        return self._clazz is not None
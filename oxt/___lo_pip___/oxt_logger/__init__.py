@@ -1,3 +1,4 @@
 from .oxt_logger import OxtLogger
+from .log_queue import LogQueue
 
-__all__ = ["OxtLogger"]
+__all__ = ["OxtLogger", "LogQueue"]
@@ -0,0 +1,121 @@
+"""
+Process wide log handlers that write on a background thread.
+
+Every ``OxtLogger`` used to create its own file handler on the same log file.
+``LogQueue`` creates one handler per log file (and one for the console) for the whole process.
+Loggers get a ``QueueHandler`` that only puts records on a queue, and a ``QueueListener`` thread
+passes the records to the real handler so logging does not wait on file I/O.
+"""
+
+from __future__ import annotations
+from typing import Callable, Dict
+import atexit
+import logging
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
+
+
+class _SharedQueueHandler(QueueHandler):
+    """Queue handler that makes sure its listener is running when a record is logged."""
+
+    def __init__(self, log_queue: LogQueue) -> None:
+        super().__init__(log_queue.queue)
+        self._log_queue = log_queue
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._log_queue.start()
+        super().emit(record)
+
+
+class LogQueue:
+    """Queue and listener for one shared handler."""
+
+    _instances: Dict[str, LogQueue] = {}
+    _lock = threading.Lock()
+
+    def __init__(self, handler: logging.Handler) -> None:
+        """
+        Constructor
+
+        Args:
+            handler (logging.Handler): Handler that writes the records, such as a file handler.
+        """
+        self._handler = handler
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._listener: QueueListener | None = None
+        self._start_lock = threading.Lock()
+        self._queue_handler = _SharedQueueHandler(self)
+        self._queue_handler.setLevel(handler.level)
+
+    # region Methods
+    def start(self) -> None:
+        """Starts the listener thread if it is not running."""
+        if self._listener is not None:
+            return
+        with self._start_lock:
+            if self._listener is None:
+                listener = QueueListener(self._queue, self._handler, respect_handler_level=True)
+                listener.start()
+                self._listener = listener
+
+    def stop(self) -> None:
+        """
+        Writes all queued records and stops the listener thread.
+
+        The handler is closed. If a record is logged after this, the listener is started again.
+        """
+        with self._start_lock:
+            listener = self._listener
+            self._listener = None
+            if listener is not None:
+                listener.stop()
+            self._handler.flush()
+            self._handler.close()
+
+    @classmethod
+    def get_handler(cls, key: str, factory: Callable[[], logging.Handler]) -> logging.Handler:
+        """
+        Gets the shared queue handler for a key, creating the real handler on first use.
+
+        Args:
+            key (str): Key such as the log file path.
+            factory (Callable[[], logging.Handler]): Creates the real handler.
+
+        Returns:
+            logging.Handler: Queue handler to add to a logger.
+        """
+        with cls._lock:
+            inst = cls._instances.get(key)
+            if inst is None:
+                inst = cls(factory())
+                cls._instances[key] = inst
+        inst.start()
+        return inst._queue_handler
+
+    @classmethod
+    def stop_all(cls) -> None:
+        """Writes all queued records and stops every listener thread."""
+        with cls._lock:
+            instances = list(cls._instances.values())
+        for inst in instances:
+            inst.stop()
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def queue(self) -> queue.SimpleQueue:
+        """Gets the queue."""
+        return self._queue
+
+    @property
+    def handler(self) -> logging.Handler:
+        """Gets the handler that writes the records."""
+        return self._handler
+
+    # endregion Properties
+
+
+# write any queued records when python exits
+atexit.register(LogQueue.stop_all)
@@ -5,6 +5,7 @@ from logging.handlers import TimedRotatingFileHandler
 
 # from .. import config
 from .logger_config import LoggerConfig
+from .log_queue import LogQueue
 
 
 # https://stackoverflow.com/questions/13521981/implementing-an-optional-logger-in-code
@@ -65,6 +66,10 @@ class OxtLogger(Logger):
             self._config.trigger_log_ready_event()
 
     def _get_console_handler(self):
+        # one console handler is shared by all loggers
+        return LogQueue.get_handler("<console>", self._create_console_handler)
+
+    def _create_console_handler(self) -> logging.Handler:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setFormatter(self.formatter)
         console_handler.setLevel(self._config.log_level)
@@ -74,6 +79,10 @@ class OxtLogger(Logger):
         return logging.NullHandler()
 
     def _get_file_handler(self):
+        # one file handler per log file is shared by all loggers, records are written on a background thread.
+        return LogQueue.get_handler(str(self._log_file), self._create_file_handler)
+
+    def _create_file_handler(self) -> logging.Handler:
         log_file = self._log_file
         file_handler = TimedRotatingFileHandler(
             log_file, when="W0", interval=1, backupCount=3, encoding="utf8", delay=True
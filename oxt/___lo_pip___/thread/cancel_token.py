@@ -0,0 +1,144 @@
+"""
+Cooperative cancellation for threads.
+
+Unlike ``KillableThread`` nothing is traced, a thread is only stopped at the points where it checks its token,
+such as ``checkpoint()`` or ``sleep()``, so code that runs in the thread runs at full speed.
+Subprocesses that are added to a token are terminated when the token is cancelled.
+"""
+
+from __future__ import annotations
+from typing import Iterator, List
+import contextlib
+import subprocess
+import threading
+
+_local = threading.local()
+
+
+class ThreadCancelled(SystemExit):
+    """
+    Raised in a thread when its token is cancelled.
+
+    This is a ``SystemExit`` so it is not caught by ``except Exception`` and the thread ends quietly,
+    the same as a killed ``KillableThread``.
+    """
+
+    pass
+
+
+class CancelToken:
+    """Cancellation token shared by the thread that is cancelled and the thread that cancels it."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._processes: List[subprocess.Popen] = []
+
+    def cancel(self) -> None:
+        """Cancels the token and terminates any subprocess added to it."""
+        with self._lock:
+            self._event.set()
+            processes = list(self._processes)
+        for proc in processes:
+            self._terminate(proc)
+
+    def checkpoint(self) -> None:
+        """
+        Ends the thread if the token is cancelled.
+
+        Raises:
+            ThreadCancelled: If the token is cancelled.
+        """
+        if self._event.is_set():
+            raise ThreadCancelled()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """
+        Waits until the token is cancelled or the timeout ends.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to waiting until cancelled.
+
+        Returns:
+            bool: ``True`` if the token is cancelled; Otherwise, ``False``.
+        """
+        return self._event.wait(timeout)
+
+    def sleep(self, seconds: float) -> None:
+        """
+        Sleeps, waking as soon as the token is cancelled.
+
+        Raises:
+            ThreadCancelled: If the token is cancelled.
+        """
+        if self._event.wait(seconds):
+            raise ThreadCancelled()
+
+    @contextlib.contextmanager
+    def process(self, proc: subprocess.Popen) -> Iterator[subprocess.Popen]:
+        """
+        Terminates a subprocess if the token is cancelled while the context is open.
+
+        Args:
+            proc (subprocess.Popen): Process such as a pip install.
+        """
+        with self._lock:
+            self._processes.append(proc)
+            cancelled = self._event.is_set()
+        if cancelled:
+            self._terminate(proc)
+        try:
+            yield proc
+        finally:
+            with self._lock:
+                self._processes.remove(proc)
+
+    def _terminate(self, proc: subprocess.Popen) -> None:
+        with contextlib.suppress(OSError):
+            if proc.poll() is None:
+                proc.terminate()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Gets if the token is cancelled."""
+        return self._event.is_set()
+
+
+def get_token() -> CancelToken:
+    """
+    Gets the token of the current thread.
+
+    Returns:
+        CancelToken: Token of the current ``CancellableThread``.
+        Any other thread gets a token that is never cancelled.
+    """
+    token = getattr(_local, "token", None)
+    if token is None:
+        token = CancelToken()
+        _local.token = token
+    return token
+
+
+def set_token(token: CancelToken) -> None:
+    """Sets the token of the current thread, used by ``CancellableThread``."""
+    _local.token = token
+
+
+def checkpoint() -> None:
+    """
+    Ends the current thread if its token is cancelled.
+
+    Raises:
+        ThreadCancelled: If the token is cancelled.
+    """
+    get_token().checkpoint()
+
+
+def sleep(seconds: float) -> None:
+    """
+    Sleeps in the current thread, waking as soon as its token is cancelled.
+
+    Raises:
+        ThreadCancelled: If the token is cancelled.
+    """
+    get_token().sleep(seconds)
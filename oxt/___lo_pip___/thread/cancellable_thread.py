@@ -0,0 +1,57 @@
+from __future__ import annotations
+from typing import Any
+
+import contextlib
+import threading
+
+from .cancel_token import CancelToken, ThreadCancelled, set_token
+
+
+class CancellableThread(threading.Thread):
+    """
+    A Thread that can be killed without tracing.
+
+    Same usage as ``KillableThread`` but the target must call ``checkpoint()`` or ``sleep()`` from ``cancel_token``,
+    the thread ends at the next of these calls after ``kill()``.
+    Subprocesses run inside ``token.process()`` are terminated by ``kill()``.
+
+    Example:
+
+        .. code-block:: python
+
+            from ___lo_pip___.thread import cancel_token
+
+            def log_runner(logger) -> None:
+                while True:
+                    logger.debug("running log_runner")
+                    cancel_token.sleep(1)
+
+            my_progress = CancellableThread(target=log_runner, args=(logger,))
+            my_progress.start()
+            time.sleep(10)
+            my_progress.kill()
+            my_progress.join()
+    """
+
+    def __init__(self, *args: Any, **keywords: Any) -> None:  # noqa: ANN401
+        threading.Thread.__init__(self, *args, **keywords)
+        self._token = CancelToken()
+
+    def run(self) -> None:
+        set_token(self._token)
+        with contextlib.suppress(ThreadCancelled):
+            super().run()
+
+    def kill(self) -> None:
+        """Cancels the thread, it ends at its next checkpoint."""
+        self._token.cancel()
+
+    @property
+    def killed(self) -> bool:
+        """Gets if the thread has been killed."""
+        return self._token.is_cancelled
+
+    @property
+    def token(self) -> CancelToken:
+        """Gets the cancellation token of the thread."""
+        return self._token
@@ -8,6 +8,9 @@ class KillableThread(threading.Thread):
     """
     A Thread that can be killed.
 
+    ``sys.settrace`` is used to check for a kill on every line, which makes code in the thread run many times slower.
+    ``CancellableThread`` has the same ``kill()`` and ``join()`` but only stops at ``cancel_token`` checkpoints.
+
     Example:
 
         .. code-block:: python
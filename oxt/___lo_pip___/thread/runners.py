@@ -21,7 +21,7 @@ def run_in_thread(fn: Callable[..., Any]) -> Callable[..., threading.Thread]:
             def actual_log_progress() -> None:
                 logger = OxtLogger(log_name=__name__)
                 logger.debug("Log_progress: Start")
-                my_progress = KillableThread(target=log_runner, args=(logger,))
+                my_progress = CancellableThread(target=log_runner, args=(logger,))
                 my_progress.start()
                 logger.debug("Log_progress: Started")
                 time.sleep(10)
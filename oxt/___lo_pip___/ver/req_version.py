@@ -1,10 +1,27 @@
 from __future__ import annotations
-from typing import Any, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Tuple
 from packaging.version import Version
+import operator
 import re
 
 # https://packaging.pypa.io/en/stable/index.html
 
+_COMPARE_OPS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+@lru_cache(maxsize=512)
+def _get_str_key(version: str) -> Any:  # noqa: ANN401
+    # string operands are parsed once, the comparison key is the same one packaging uses.
+    return Version(version)._key
+
 
 class VersionParts:
     def __init__(self, ver: str) -> None:
@@ -181,14 +198,17 @@ class ReqVersion(Version):
 
     # region Comparisons
     def _compare_version(self, prefix: str, other: object) -> bool:
-        if isinstance(other, (ReqVersion, Version)):
-            return ReqVersion(f"{prefix}{self}").get_ver_is_valid(str(other))
+        # compare the cached keys directly, no temporary version objects are created.
+        if isinstance(other, Version):
+            other_key = other._key
         elif isinstance(other, str):
             try:
-                return ReqVersion(f"{prefix}{self}").get_ver_is_valid(other)
+                other_key = _get_str_key(other)
             except Exception:
                 return False
-        return NotImplemented
+        else:
+            return NotImplemented
+        return _COMPARE_OPS[prefix](self._key, other_key)
 
     def __eq__(self, other: object) -> bool:
         return self._compare_version("==", other)
@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import Iterable, List, Type
+from functools import lru_cache
+from typing import Iterable, List, Tuple, Type
 from .carrot import Carrot
 from .equals import Equals
 from .equals_star import EqualsStar
@@ -11,10 +12,34 @@ from .not_equals import NotEquals
 from .tilde import Tilde
 from .tilde_eq import TildeEq
 from .ver_proto import VerProto
+from .ver_spec import VerSpec
 from .wildcard import Wildcard
 
 # https://www.darius.page/pipdev/
 
+_CACHE_SIZE = 256
+
+
+def _split_and_strip(string: str) -> List[str]:
+    clean_str = string.replace(";", ",")
+    return [s.strip() for s in clean_str.split(",")]
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _match_rules(vstr: str, rules: Tuple[Type[VerProto], ...]) -> Tuple[VerProto, ...]:
+    results: List[VerProto] = []
+    for ver_str in _split_and_strip(vstr):
+        for rule in rules:
+            inst = rule(vstr=ver_str)
+            if inst.get_is_match():
+                results.append(inst)
+    return tuple(results)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _compile_rules(rule_keys: Tuple[Tuple[Type[VerProto], str], ...]) -> VerSpec:
+    return VerSpec(rule(vstr=vstr) for rule, vstr in rule_keys)
+
 
 class VerRules:
     """Manages rules for Versions"""
@@ -89,8 +114,7 @@ class VerRules:
         Returns:
             List[str]: The list of substrings with leading and lagging whitespace removed.
         """
-        clean_str = string.replace(";", ",")
-        return [s.strip() for s in clean_str.split(",")]
+        return _split_and_strip(string)
 
     def get_partial_matched_rules(self, vstr: str) -> List[VerProto]:
         """
@@ -119,13 +143,34 @@ class VerRules:
         Returns:
             List[VerProto]: List of matched rules
         """
-        ver_strings = self.split_and_strip(vstr)
+        # rule instances are not changed after they are created so cached instances can be shared.
+        return list(_match_rules(vstr, tuple(self._rules)))
 
-        results: List[VerProto] = []
+    def compile(self, vstr: str) -> VerSpec:
+        """
+        Compiles a version string into a predicate.
 
-        for ver_str in ver_strings:
-            results.extend(self.get_partial_matched_rules(ver_str))
-        return results
+        Compiled specs are cached so a version string is only compiled once.
+
+        Args:
+            vstr (str): Version in string form, e.g. ``==1.2.3`` or ``^1.2, !=1.3.1``
+
+        Returns:
+            VerSpec: Compiled spec. A spec with no matched rules is never valid.
+        """
+        return self.compile_rules(_match_rules(vstr, tuple(self._rules)))
+
+    def compile_rules(self, rules: Iterable[VerProto]) -> VerSpec:
+        """
+        Compiles matched rules into a predicate.
+
+        Args:
+            rules (Iterable[VerProto]): Matched rules such as the result of ``get_matched_rules()``.
+
+        Returns:
+            VerSpec: Compiled spec. A spec with no rules is never valid.
+        """
+        return _compile_rules(tuple((type(rule), rule.vstr) for rule in rules))
 
     def get_installed_is_valid(self, vstr: str, check_version: str) -> bool:
         """
@@ -138,8 +183,7 @@ class VerRules:
         Returns:
             bool: True if the installed version is valid, False otherwise.
         """
-        rules = self.get_matched_rules(vstr)
-        return self.get_installed_is_valid_by_rules(rules, check_version)
+        return self.compile(vstr).is_valid(check_version)
 
     def get_installed_is_valid_by_rules(self, rules: Iterable[VerProto], check_version: str) -> bool:
         """
@@ -152,8 +196,6 @@ class VerRules:
         Returns:
             bool: True if the installed version is valid, False otherwise.
         """
-        if not rules:
-            return False
-        return all(rule.get_installed_is_valid(check_version) for rule in rules)
+        return self.compile_rules(rules).is_valid(check_version)
 
     # endregion Methods
@@ -0,0 +1,186 @@
+from __future__ import annotations
+from typing import Any, Dict, FrozenSet, Iterable, Tuple
+from packaging.version import Version
+
+from .carrot import Carrot
+from .equals import Equals
+from .equals_star import EqualsStar
+from .greater import Greater
+from .greater_equal import GreaterEqual
+from .lesser import Lesser
+from .lesser_equal import LesserEqual
+from .not_equals import NotEquals
+from .tilde import Tilde
+from .tilde_eq import TildeEq
+from .ver_proto import VerProto
+from .wildcard import Wildcard
+
+# Rules that are fully described by the prefixes of the versions returned by get_versions().
+_INTERVAL_RULES = (Carrot, Equals, EqualsStar, Greater, GreaterEqual, Lesser, LesserEqual, NotEquals, Tilde, TildeEq)
+
+
+class VerSpec:
+    """
+    Immutable predicate compiled from version rules.
+
+    The rules of a spec such as ``^1.2, !=1.3.1`` are compiled into a single interval ``>=1.2.0, <2.0.0``
+    and a set of excluded versions ``1.3.1``. Checking a version is then one parse and a few tuple comparisons.
+
+    Rules that are not known to be intervals, such as custom registered rules, are kept and checked by calling
+    their ``get_installed_is_valid()`` method.
+    """
+
+    __slots__ = (
+        "_rules",
+        "_valid",
+        "_lower",
+        "_lower_inc",
+        "_upper",
+        "_upper_inc",
+        "_excluded",
+        "_others",
+        "_bound_strs",
+    )
+
+    def __init__(self, rules: Iterable[VerProto]) -> None:
+        """
+        Constructor
+
+        Args:
+            rules (Iterable[VerProto]): Matched rules. A spec with no rules is never valid.
+        """
+        self._rules: Tuple[VerProto, ...] = tuple(rules)
+        self._valid = bool(self._rules)
+        self._lower: Any = None
+        self._lower_inc = True
+        self._upper: Any = None
+        self._upper_inc = True
+        # version strings of the keys, used by to_dict()
+        self._bound_strs: Dict[Any, str] = {}
+        excluded = set()
+        others = []
+        for rule in self._rules:
+            if isinstance(rule, Wildcard):
+                # ==* matches any valid version
+                continue
+            if not isinstance(rule, _INTERVAL_RULES):
+                others.append(rule)
+                continue
+            for ver in rule.get_versions():
+                key = ver._key
+                self._bound_strs[key] = str(ver)
+                prefix = ver.prefix
+                if prefix in ("==", ">=", ">"):
+                    self._set_lower(key, prefix != ">")
+                if prefix in ("==", "<=", "<"):
+                    self._set_upper(key, prefix != "<")
+                if prefix in ("!=", "<>"):
+                    excluded.add(key)
+        self._excluded: FrozenSet[Any] = frozenset(excluded)
+        self._others: Tuple[VerProto, ...] = tuple(others)
+
+    def _set_lower(self, key: Any, inclusive: bool) -> None:  # noqa: ANN401
+        if self._lower is None or key > self._lower:
+            self._lower, self._lower_inc = key, inclusive
+        elif key == self._lower:
+            self._lower_inc = self._lower_inc and inclusive
+
+    def _set_upper(self, key: Any, inclusive: bool) -> None:  # noqa: ANN401
+        if self._upper is None or key < self._upper:
+            self._upper, self._upper_inc = key, inclusive
+        elif key == self._upper:
+            self._upper_inc = self._upper_inc and inclusive
+
+    def is_valid(self, check_version: str) -> bool:
+        """
+        Gets if a version meets the spec.
+
+        Args:
+            check_version (str): Version to check such as ``1.2.3`` (no prefix).
+
+        Returns:
+            bool: ``True`` if the version meets every rule of the spec; Otherwise, ``False``.
+        """
+        if not self._valid:
+            return False
+        ver = check_version.strip()
+        # same as ReqVersion(f"=={check_version}"), anything before the first digit makes an invalid prefix
+        if not ver or not ver[0].isdigit():
+            return False
+        try:
+            key = Version(ver)._key
+        except Exception:
+            return False
+        if self._lower is not None and (key < self._lower or (key == self._lower and not self._lower_inc)):
+            return False
+        if self._upper is not None and (key > self._upper or (key == self._upper and not self._upper_inc)):
+            return False
+        if key in self._excluded:
+            return False
+        return all(rule.get_installed_is_valid(check_version) for rule in self._others)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Gets the compiled interval as a dictionary that can be saved as json.
+
+        Raises:
+            ValueError: If the spec has rules that are not intervals.
+
+        Returns:
+            Dict[str, Any]: Such as ``{"valid": True, "lower": "1.2.0", "lower_inc": True, "upper": "2.0.0", "upper_inc": False, "excluded": ["1.3.1"]}``
+        """
+        if self._others:
+            raise ValueError(f"{self!r} has rules that can not be saved as an interval.")
+        return {
+            "valid": self._valid,
+            "lower": "" if self._lower is None else self._bound_strs[self._lower],
+            "lower_inc": self._lower_inc,
+            "upper": "" if self._upper is None else self._bound_strs[self._upper],
+            "upper_inc": self._upper_inc,
+            "excluded": sorted(self._bound_strs[key] for key in self._excluded),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> VerSpec:
+        """
+        Creates a spec from the result of ``to_dict()`` without matching any rules.
+
+        Args:
+            data (Dict[str, Any]): Compiled interval.
+
+        Returns:
+            VerSpec: Compiled spec.
+        """
+        inst = cls(())
+        inst._valid = bool(data.get("valid", False))
+        lower = str(data.get("lower", ""))
+        if lower:
+            inst._lower = Version(lower)._key
+            inst._bound_strs[inst._lower] = lower
+        inst._lower_inc = bool(data.get("lower_inc", True))
+        upper = str(data.get("upper", ""))
+        if upper:
+            inst._upper = Version(upper)._key
+            inst._bound_strs[inst._upper] = upper
+        inst._upper_inc = bool(data.get("upper_inc", True))
+        excluded = set()
+        for ver in data.get("excluded", []):
+            key = Version(ver)._key
+            inst._bound_strs[key] = ver
+            excluded.add(key)
+        inst._excluded = frozenset(excluded)
+        return inst
+
+    def __contains__(self, check_version: str) -> bool:
+        return self.is_valid(check_version)
+
+    def __bool__(self) -> bool:
+        return self._valid
+
+    def __repr__(self) -> str:
+        return f"<VerSpec({', '.join(rule.vstr for rule in self._rules)})>"
+
+    @property
+    def rules(self) -> Tuple[VerProto, ...]:
+        """Gets the rules the spec was compiled from."""
+        return self._rules
@@ -23,7 +23,16 @@ if TYPE_CHECKING:
     from .___lo_pip___.oxt_logger import OxtLogger  # type: ignore
     from .___lo_pip___.lo_util import Session, RegisterPathKind, UnRegisterPathKind  # type: ignore  # noqa: F401
     from .___lo_pip___.install.requirements_check import RequirementsCheck  # type: ignore  # noqa: F401
+    from .___lo_pip___.install.startup_fingerprint import StartupFingerprint  # type: ignore  # noqa: F401
+    from .___lo_pip___.install.internet_probe import InternetProbe  # type: ignore  # noqa: F401
+    from .___lo_pip___.install.install_lock import InstallLock  # type: ignore  # noqa: F401
+    from .___lo_pip___.install.pip_worker.pip_worker import PipWorker  # type: ignore  # noqa: F401
+    from .___lo_pip___.install.distribution_index import DistributionIndex  # type: ignore  # noqa: F401
     from .___lo_pip___.lo_util.resource_resolver import ResourceResolver  # type: ignore
+    from .___lo_pip___.install.install_pip import InstallPip  # type: ignore  # noqa: F401
+    from .___lo_pip___.debug.trace import Tracer  # type: ignore
+    from .___lo_pip___.adapter.top_window_listener import TopWindowListener  # type: ignore  # noqa: F401
+    from .___lo_pip___.events.named_events.startup_events import StartupNamedEvent  # type: ignore  # noqa: F401
 else:
     RegisterPathKind = object
     UnRegisterPathKind = object
@@ -39,31 +48,24 @@ def add_local_path_to_sys_path() -> None:
 add_local_path_to_sys_path()
 if TYPE_CHECKING:
     # Direct imports see to work on Linux but not in a container, so use the relative import and type checking.
-    from .___lo_pip___.dialog.handler import logger_options
     from .___lo_pip___.config import Config
-    from .___lo_pip___.install.install_pip import InstallPip
     from .___lo_pip___.lo_util.util import Util
-    from .___lo_pip___.adapter.top_window_listener import TopWindowListener
-    from .___lo_pip___.events.lo_events import LoEvents
     from .___lo_pip___.events.args.event_args import EventArgs
-    from .___lo_pip___.events.startup.startup_monitor import StartupMonitor
-    from .___lo_pip___.events.named_events.startup_events import StartupNamedEvent
+    from .___lo_pip___.meta.lazy_factory import LazyFactory
+    from .___lo_pip___.dialog.handler import handler_names
 else:
-    from ___lo_pip___.dialog.handler import logger_options
-    from ___lo_pip___.config import Config
-    from ___lo_pip___.install.install_pip import InstallPip
-    from ___lo_pip___.lo_util.util import Util
-    from ___lo_pip___.adapter.top_window_listener import TopWindowListener
-    from ___lo_pip___.events.lo_events import LoEvents
-    from ___lo_pip___.events.args.event_args import EventArgs
-    from ___lo_pip___.events.startup.startup_monitor import StartupMonitor
-    from ___lo_pip___.events.named_events.startup_events import StartupNamedEvent
+    # Only what is needed to register the implementations is imported here.
+    # Everything else is imported when LibreOffice creates the job or a dialog handler.
+    from ___lo_pip___.meta.lazy_factory import LazyFactory
+    from ___lo_pip___.dialog.handler import handler_names
 # endregion imports
 
 # region Constants
 
 implementation_name = "___lo_identifier___.___lo_implementation_name___.py_runner"
 implementation_services = ("com.sun.star.task.Job",)
+# seconds to wait in line for another extension to finish installing.
+install_lock_timeout = 600.0
 
 # endregion Constants
 
@@ -85,7 +87,13 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
         self._start_time = 0.0
         self._is_init = False
         self._window_timer: threading.Timer | None = None
-        self._thread_lock = threading.Lock()
+        if TYPE_CHECKING:
+            from .___lo_pip___.events.lo_events import LoEvents
+            from .___lo_pip___.events.startup.startup_monitor import StartupMonitor
+        else:
+            from ___lo_pip___.events.lo_events import LoEvents
+            from ___lo_pip___.events.startup.startup_monitor import StartupMonitor
+
         self._events = LoEvents()
         self._startup_monitor = StartupMonitor()  # start the singleton startup monitor
         # logger.debug("___lo_implementation_name___ Init")
@@ -99,6 +107,8 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
 
         if not TYPE_CHECKING:
             # run time
+            from ___lo_pip___.config import Config
+            from ___lo_pip___.lo_util.util import Util
             from ___lo_pip___.lo_util import (
                 Session,
                 RegisterPathKind as InitRegisterPathKind,
@@ -136,6 +146,8 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
             # must be after self._add_py_req_pkgs_to_sys_path()
             try:
                 from ___lo_pip___.install.requirements_check import RequirementsCheck
+                from ___lo_pip___.install.startup_fingerprint import StartupFingerprint
+                from ___lo_pip___.install.internet_probe import InternetProbe
             except Exception as err:
                 self._logger.error(err, exc_info=True)
         self._requirements_check = RequirementsCheck()
@@ -179,6 +191,8 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
             self._logger.info("Valid job event names: %s", self._valid_job_event_names)
             return
         self._logger.debug(f"Job event name: {self._job_event_name}")
+        self._start_trace()
+        tracer = self._get_tracer()
         try:
             self._add_py_pkgs_to_sys_path()
             self._add_py_req_pkgs_to_sys_path()
@@ -188,14 +202,29 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
                 self._show_extra_debug_info()
                 # self._config.extension_info.log_extensions(self._logger)
 
+            with tracer.span("startup_fingerprint") as span:
+                fingerprint_match = not self._config.has_locals and self._is_startup_fingerprint_match()
+                span.set("match", fingerprint_match)
+            if fingerprint_match:
+                self._logger.debug("Startup fingerprint matches. Requirements are met. Nothing more to do.")
+                self._init_checks()
+                self._log_ex_time(self._start_time, "Warm start")
+                return
+
+            # check for internet while requirements are checked, only waited on if something must be installed.
+            self._start_internet_probe()
+
             requirements_met = False
-            if self._requirements_check.check_requirements() is True and not self._config.has_locals:
-                requirements_met = True
+            with tracer.span("requirements_check") as span:
+                if self._requirements_check.check_requirements() is True and not self._config.has_locals:
+                    requirements_met = True
+                span.set("met", requirements_met)
 
             if requirements_met:
                 self._logger.debug("Requirements are met. Nothing more to do.")
+                self._save_startup_fingerprint()
                 self._init_checks()
-                self._log_ex_time(self._start_time)
+                self._log_ex_time(self._start_time, "Cold start")
                 return
 
             if self._config.py_pkg_dir:
@@ -218,6 +247,9 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
 
                 self._fn_on_window_opened = _on_window_opened
 
+                if not TYPE_CHECKING:
+                    from ___lo_pip___.adapter.top_window_listener import TopWindowListener
+
                 self._twl = TopWindowListener()
                 self._start_window_timer()
                 self._twl.on("windowOpened", _on_window_opened)
@@ -235,58 +267,83 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
         self._real_execute(start_time=self._start_time, has_window=False)
 
     def _real_execute(self, start_time: float, has_window: bool = False) -> None:
-        if has_window:
-            # LibreOffice runs extension in parallel, so we need to wait in line
-            wait_count = 0
-            while os.environ.get("OOOPIP_RUNNER_WAIT_IN_LINE", ""):
-                wait_count += 1
-                if wait_count == 1:
-                    self._logger.info("Waiting in line. Other Installers are working...")
-                time.sleep(0.5)
-            if wait_count > 0:
-                # reset the time and don't include wait time.
-                start_time = time.time()
-                self._logger.info("Done waiting in line.")
-            else:
-                self._logger.debug("No other Installers are running. Starting...")
+        # LibreOffice runs extension in parallel, so we need to wait in line.
+        # The lock is shared by all extensions built from this template, in any process using this profile.
+        install_lock = self._get_install_lock()
+        if install_lock.acquire(blocking=False):
+            self._logger.debug("No other Installers are running. Starting...")
+        elif not has_window:
+            # the synchronous startup path must not block LibreOffice.
+            self._logger.warning("Other Installers are working. Skipping install, it runs on the next start.")
+            self._log_ex_time(start_time)
+            return
+        else:
+            self._logger.info("Waiting in line. Other Installers are working...")
+            if not install_lock.acquire(timeout=install_lock_timeout):
+                self._logger.error(
+                    "Waited %.3f seconds for other Installers to finish. Skipping install.", install_lock.wait_time
+                )
+                self._log_ex_time(start_time)
+                return
+            # reset the time and don't include wait time.
+            start_time = time.time()
+            self._logger.info("Done waiting in line. Waited %.3f seconds", install_lock.wait_time)
+            # another extension may have installed some of the requirements while waiting.
+            if not TYPE_CHECKING:
+                from ___lo_pip___.install.distribution_index import DistributionIndex
+            DistributionIndex().clear()
 
         try:
-            with self._thread_lock:
-                os.environ["OOOPIP_RUNNER_WAIT_IN_LINE"] = "1"
             if not TYPE_CHECKING:
                 # run time
-                self._logger.debug("Imported InstallPip")
+                from ___lo_pip___.install.install_pip import InstallPip
                 from ___lo_pip___.install.install_pkg import InstallPkg
-            pip_installer = InstallPip(self.ctx)
-            self._logger.debug("Created InstallPip instance")
-            if pip_installer.is_pip_installed():
-                self._logger.info("Pip is already installed")
-            else:
-                self._logger.info("Pip is not installed. Attempting to install")
-                if not pip_installer.is_internet:
-                    self._logger.error("No internet connection!")
-                    return
-                pip_installer.install_pip()
+
+                self._logger.debug("Imported InstallPip")
+            tracer = self._get_tracer()
+            with tracer.span("pip_bootstrap") as span:
+                pip_installer = InstallPip(self.ctx)
+                self._logger.debug("Created InstallPip instance")
                 if pip_installer.is_pip_installed():
-                    self._logger.info("Pip has been installed")
+                    self._logger.info("Pip is already installed")
+                    span.set("installed", False)
                 else:
-                    self._logger.info("Pip was not successfully installed")
-                    return
+                    self._logger.info("Pip is not installed. Attempting to install")
+                    span.set("installed", True)
+                    if not pip_installer.is_internet:
+                        self._logger.error("No internet connection!")
+                        span.fail("No internet connection")
+                        return
+                    pip_installer.install_pip()
+                    if pip_installer.is_pip_installed():
+                        self._logger.info("Pip has been installed")
+                    else:
+                        self._logger.info("Pip was not successfully installed")
+                        span.fail("Pip was not successfully installed")
+                        return
 
             # install wheel if needed
-            self._install_wheel()
+            with tracer.span("install_wheel"):
+                self._install_wheel()
 
             # install any packages that are not installed
             if self._config.has_locals:
-                self._install_locals()
-            pkg_installer = InstallPkg(ctx=self.ctx)
-            self._logger.debug("Created InstallPkg instance")
-            pkg_installer.install()
-
-            self._handel_bz2()
-
-            self._post_install()
-            self._init_checks()
+                with tracer.span("install_locals"):
+                    self._install_locals()
+            with tracer.span("install_packages") as span:
+                pkg_installer = InstallPkg(ctx=self.ctx)
+                self._logger.debug("Created InstallPkg instance")
+                span.set("result", pkg_installer.install())
+
+            with tracer.span("bz2"):
+                self._handel_bz2()
+
+            with tracer.span("post_install"):
+                self._post_install(since=start_time)
+            with tracer.span("precompile"):
+                self._start_precompile(since=start_time)
+            with tracer.span("init_checks"):
+                self._init_checks()
 
             if has_window:
                 self._display_complete_dialog()
@@ -297,8 +354,8 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
                 self._logger.error(err)
         finally:
             # self._remove_local_path_from_sys_path()
-            with self._thread_lock:
-                del os.environ["OOOPIP_RUNNER_WAIT_IN_LINE"]
+            self._stop_pip_worker()
+            install_lock.release()
             self._remove_py_req_pkgs_from_sys_path()
             self._log_ex_time(start_time)
 
@@ -306,6 +363,7 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
 
     # region Destructor
     def __del__(self) -> None:
+        self._stop_logging()
         if self._added_packaging and "packaging" in sys.modules:
             del sys.modules["packaging"]
         if self._config.unload_after_install and "___lo_pip___" in sys.modules:
@@ -439,6 +497,10 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
         # self._logger.debug(dir(event.Source))
         self._twl = None
         self._fn_on_window_opened = None
+        if not TYPE_CHECKING:
+            from ___lo_pip___.events.args.event_args import EventArgs
+            from ___lo_pip___.events.named_events.startup_events import StartupNamedEvent
+
         self._events.trigger(StartupNamedEvent.WINDOW_STARTED, EventArgs(self))
         if self._error_msg:
             with contextlib.suppress(Exception):
@@ -523,9 +585,73 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
     def _log_ex_time(self, start_time: float, msg: str = "") -> None:
         if not self._logger:
             return
+        self._save_trace()
         end_time = time.time()
         total_time = end_time - start_time
-        self._logger.info("%s execution time: %.3f seconds", self._config.lo_implementation_name, total_time)
+        if msg:
+            self._logger.info(
+                "%s %s execution time: %.3f seconds", self._config.lo_implementation_name, msg, total_time
+            )
+        else:
+            self._logger.info("%s execution time: %.3f seconds", self._config.lo_implementation_name, total_time)
+
+    def _stop_pip_worker(self) -> None:
+        if not self._config.pip_worker:
+            return
+        try:
+            if not TYPE_CHECKING:
+                from ___lo_pip___.install.pip_worker.pip_worker import PipWorker
+            PipWorker().stop()
+        except Exception as err:
+            self._logger.error(err, exc_info=True)
+
+    def _get_install_lock(self) -> InstallLock:
+        if not TYPE_CHECKING:
+            from ___lo_pip___.install.install_lock import InstallLock
+
+        return InstallLock(Path(self._get_user_profile_path(True, self.ctx), "ooopip_install.lock"))
+
+    def _get_tracer(self) -> Tracer:
+        if not TYPE_CHECKING:
+            from ___lo_pip___.debug.trace import Tracer
+
+        return Tracer()
+
+    def _start_trace(self) -> None:
+        if not self._config.trace_report or not self._logger.log_file:
+            return
+        try:
+            tracer = self._get_tracer()
+            tracer.start(tracer.get_report_file(self._logger.log_file))
+        except Exception as err:
+            self._logger.error(err, exc_info=True)
+
+    def _save_trace(self) -> None:
+        try:
+            pth = self._get_tracer().save()
+            if pth:
+                self._logger.debug("Trace report saved: %s", pth)
+        except Exception as err:
+            self._logger.error(err, exc_info=True)
+
+    def _is_startup_fingerprint_match(self) -> bool:
+        try:
+            return StartupFingerprint().is_match()
+        except Exception as err:
+            self._logger.error(err, exc_info=True)
+        return False
+
+    def _start_internet_probe(self) -> None:
+        try:
+            InternetProbe().start()
+        except Exception as err:
+            self._logger.error(err, exc_info=True)
+
+    def _save_startup_fingerprint(self) -> None:
+        try:
+            StartupFingerprint().save()
+        except Exception as err:
+            self._logger.error(err, exc_info=True)
 
     def _get_user_profile_path(self, as_sys_path: bool = True, ctx: Any = None) -> str:  # noqa: ANN401
         """
@@ -565,6 +691,17 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
 
     # region Logging
 
+    def _stop_logging(self) -> None:
+        # write queued log records and close the shared log handlers so no file handles are left open between runs.
+        try:
+            if TYPE_CHECKING:
+                from .___lo_pip___.oxt_logger import LogQueue
+            else:
+                from ___lo_pip___.oxt_logger import LogQueue
+            LogQueue.stop_all()
+        except Exception:
+            pass
+
     def _get_local_logger(self) -> OxtLogger:
         from ___lo_pip___.oxt_logger import OxtLogger  # type: ignore
 
@@ -645,7 +782,14 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
     # endregion handel windows _bz2
 
     # region Post Install
-    def _post_install(self) -> None:
+    def _post_install(self, since: float = 0.0) -> None:
+        """
+        Links the ``.so`` files of installed packages when the embedded python suffix does not match.
+
+        Args:
+            since (float, optional): Install start time. When the packages installed since then are tracked,
+                only their files are linked; Otherwise, all of site-packages. Defaults to ``0.0``.
+        """
         self._logger.debug("Post Install starting")
         progress: Progress | None = None
         if not self._config.sym_link_cpython:
@@ -685,7 +829,12 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
                 title = self.resource_resolver.resolve_string("title03")
                 progress = Progress(start_msg=msg, title=title)
                 progress.start()
-            link.link()
+            tracked = link.get_tracked_paths(since) if since > 0.0 else []
+            if tracked:
+                self._logger.debug("Linking %i tracked paths installed in this run.", len(tracked))
+                link.link(tracked)
+            else:
+                link.link()
         except Exception as err:
             self._logger.error(err, exc_info=True)
             return
@@ -694,6 +843,26 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
                 progress.kill()
         self._logger.debug("Post Install Done")
 
+    def _start_precompile(self, since: float) -> None:
+        """
+        Compiles the packages installed since the install started to bytecode in the background.
+
+        Args:
+            since (float): Install start time.
+        """
+        if not self._config.precompile:
+            self._logger.debug("Precompile is turned off in configuration. Skipping precompile.")
+            return
+        try:
+            if TYPE_CHECKING:
+                from .___lo_pip___.install.post.precompile import Precompile
+            else:
+                from ___lo_pip___.install.post.precompile import Precompile
+
+            Precompile().start(since)
+        except Exception as err:
+            self._logger.error(err, exc_info=True)
+
     # endregion Post Install
 
     # region Isolate
@@ -770,7 +939,9 @@ class ___lo_implementation_name___(unohelper.Base, XJob):  # noqa: N801
             else:
                 from ___lo_pip___.install.download import Download
 
-            self._has_internet_connection = Download().is_internet
+            with self._get_tracer().span("internet_probe") as span:
+                self._has_internet_connection = Download().is_internet
+                span.set("online", self._has_internet_connection)
         return self._has_internet_connection
 
     # endregion Properties
@@ -788,22 +959,25 @@ g_ImplementationHelper = unohelper.ImplementationHelper()  # noqa: N816
 # which the loader uses to register/instantiate the component.
 g_ImplementationHelper.addImplementation(___lo_implementation_name___, implementation_name, implementation_services)
 
+# the dialog handlers are imported when LibreOffice first creates them, not when this module is loaded.
 g_ImplementationHelper.addImplementation(
-    logger_options.OptionsDialogHandler, logger_options.IMPLEMENTATION_NAME, (logger_options.IMPLEMENTATION_NAME,)
+    LazyFactory("___lo_pip___.dialog.handler.logger_options", "OptionsDialogHandler"),
+    handler_names.LOGGER_OPTIONS_IMPLE_NAME,
+    (handler_names.LOGGER_OPTIONS_IMPLE_NAME,),
 )
 
 # uncomment here and int options.xcu to use the example dialog
-# from ___lo_pip___.dialog.handler import example
 
 # g_ImplementationHelper.addImplementation(
-#     example.OptionsDialogHandler, example.IMPLEMENTATION_NAME, (example.IMPLEMENTATION_NAME,)
+#     LazyFactory("___lo_pip___.dialog.handler.example", "OptionsDialogHandler"),
+#     handler_names.EXAMPLE_IMPLE_NAME,
+#     (handler_names.EXAMPLE_IMPLE_NAME,),
 # )
 
-if TYPE_CHECKING:
-    from .___lo_pip___.dialog.handler.uninstall import OptionsDialogUninstallHandler
-else:
-    from ___lo_pip___.dialog.handler.uninstall import OptionsDialogUninstallHandler
-
-g_ImplementationHelper.addImplementation(*OptionsDialogUninstallHandler.get_imple())
+g_ImplementationHelper.addImplementation(
+    LazyFactory("___lo_pip___.dialog.handler.uninstall", "OptionsDialogUninstallHandler"),
+    handler_names.UNINSTALL_IMPLE_NAME,
+    (handler_names.UNINSTALL_IMPLE_NAME,),
+)
 
 # endregion Implementation
@@ -1,6 +1,10 @@
 from __future__ import annotations
 import os
+import sys
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List
 from .config import Config
 from . import file_util
 from .build_args import BuildArgs
@@ -16,8 +20,12 @@ from .processing.locale.publisher_update import PublisherUpdate
 from .processing.locale.name import Name
 from .processing.bz2_process import BZ2Processor
 from .install.pre_install_pure import PreInstallPure
+from .install.pip_install_build import PipInstallBuild
 from .processing.idl.idl_rdb import IdlRdb
 from .processing.idl.idl_manifest import IdlManifest
+from .processing.zip_bytecode import ZipBytecode
+from .processing.build_cache import BuildCache
+from .processing.pre_packages_pure import PrePackagesPure
 
 
 class Build:
@@ -32,6 +40,8 @@ class Build:
             raise FileNotFoundError(f"Oxt source directory '{self._src_path}' not found")
         self._dist_path = self._config.root_path / self._config.dist_dir_name
         self._dist_path.mkdir(parents=True, exist_ok=True)
+        self._zip_bytecode = args.zip_bytecode or self._config.zip_bytecode
+        self._cache = BuildCache() if args.incremental else None
 
     def build(self) -> None:
         """Builds the project."""
@@ -46,30 +56,26 @@ class Build:
 
         self._process_config()
 
-        self._copy_py_req_packages()
-        self._copy_py_req_files()
-        self._clear_req_cache()
-        self._zip_req_python_path()
+        self._build_req_python_path()
 
         if self._args.process_py_packages:
-            pythonpath = self._build_path / self._config.py_pkg_dir
-            if pythonpath.exists():
-                shutil.rmtree(pythonpath)
-
-            self._copy_py_packages()
-            self._copy_py_files()
-            self._clear_cache()
-            self._zip_python_path()
+            self._build_python_path()
 
         if self._args.pre_install_pure_packages:
             self._pre_install_pure_packages()
 
+        if self._args.bytecode_report:
+            self._report_bytecode()
+
         if self._args.compile_idl:
             self._build_idl()
         self._write_xml()
         self._process_bz2()
         self._ensure_default_resource()
 
+        if self._cache is not None:
+            self._cache.save()
+
         if self._args.make_dist:
             self._zip_build()
             self._process_update()
@@ -126,17 +132,32 @@ class Build:
         files = file_util.find_files_matching_patterns(
             self._build_path, self._config.token_file_ext, *self._config.token_files
         )
-        for file in files:
-            text = file_util.read_file(file)
-            text = self.process_tokens(text)
-            file_util.write_string_to_file(file, text)
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(self._process_token_file, files))
         # process py_runner.py
         file = self._build_path / "py_runner.py"
         if file.exists():
-            py_file = str(file)
-            text = file_util.read_file(py_file)
-            text = self.process_tokens(text)
-            file_util.write_string_to_file(py_file, text)
+            self._process_token_file(str(file))
+
+    def _process_token_file(self, file: str) -> bool:
+        """
+        Processes the tokens in a file. The file is only written when the tokens change it.
+
+        Args:
+            file (str): File to process.
+
+        Returns:
+            bool: ``True`` if the file is written; Otherwise, ``False``.
+        """
+        with open(file, "rb") as f:
+            data = f.read().decode("UTF-8")
+        # the file is read and written in text mode, line endings that mode would change are a change.
+        text = data.replace("\r\n", "\n").replace("\r", "\n")
+        result = self.process_tokens(text)
+        if result.replace("\n", os.linesep) == data:
+            return False
+        file_util.write_string_to_file(file, result)
+        return True
 
     def _process_config(self) -> None:
         token = Token()
@@ -189,10 +210,116 @@ class Build:
         file_util.zip_folder(folder=pth)
         shutil.rmtree(pth)
 
+    def _build_req_python_path(self) -> None:
+        """Copies, compiles and zips the required packages, or restores the zip from the build cache."""
+        name = f"req_{self._config.py_pkg_dir}"
+        key = self._get_packages_key(ReqPackages())
+        if self._restore_stage(name, key):
+            return
+        self._copy_py_req_packages()
+        self._copy_py_req_files()
+        self._clear_req_cache()
+        self._compile_bytecode(self._build_path / name)
+        self._zip_req_python_path()
+        self._store_stage(name, key, self._build_path / f"{name}.zip")
+
+    def _build_python_path(self) -> None:
+        """Copies, compiles and zips the python packages, or restores the zip from the build cache."""
+        name = self._config.py_pkg_dir
+        pythonpath = self._build_path / name
+        if pythonpath.exists():
+            shutil.rmtree(pythonpath)
+        key = self._get_packages_key(Packages())
+        if self._restore_stage(name, key):
+            return
+
+        self._copy_py_packages()
+        self._copy_py_files()
+        self._clear_cache()
+        self._compile_bytecode(pythonpath)
+        self._zip_python_path()
+        self._store_stage(name, key, self._build_path / f"{name}.zip")
+
+    def _get_bytecode_settings(self) -> List[Any]:
+        """Gets the zip bytecode settings that are part of a build cache key."""
+        if not self._zip_bytecode or self._cache is None:
+            return [False]
+        bytecode = ZipBytecode()
+        python = file_util.get_which(bytecode.python) or bytecode.python
+        return [True, python, self._cache.hash_file(Path(python).resolve()), bytecode.invalidation_mode]
+
+    def _get_packages_key(self, packages: Packages) -> str:
+        """Gets the build cache key of copying packages from the virtual environment, empty if not incremental."""
+        if self._cache is None:
+            return ""
+        names = sorted(packages.pkg_names | packages.pkg_files)
+        sources = self._cache.hash_tree(*[packages.site_packages_path / name for name in names])
+        return self._cache.get_key(names, sources, self._get_bytecode_settings())
+
+    def _restore_stage(self, stage: str, key: str) -> bool:
+        """Restores the outputs of a stage from the build cache into the build directory."""
+        if self._cache is None or not key:
+            return False
+        if self._cache.restore(stage, key, self._build_path):
+            print(f"Build cache: {stage} is unchanged, reusing it.", flush=True)
+            return True
+        return False
+
+    def _store_stage(self, stage: str, key: str, *outputs: Path) -> None:
+        """Stores the outputs of a stage in the build cache."""
+        if self._cache is None or not key:
+            return
+        self._cache.store(stage, key, *outputs)
+
+    def _compile_bytecode(self, pth: Path) -> None:
+        """Compiles the sources of a folder that is about to be zipped, when zip bytecode is on."""
+        if not self._zip_bytecode:
+            return
+        ZipBytecode().compile(pth)
+
+    def _report_bytecode(self) -> None:
+        """Prints the import time of the embedded zip files with and without bytecode."""
+        bytecode = ZipBytecode()
+        names = [f"req_{self._config.py_pkg_dir}.zip", f"{self._config.py_pkg_dir}.zip", "pure.zip"]
+        for name in names:
+            pth = self._build_path / name
+            if not pth.exists():
+                continue
+            result = bytecode.report(pth)
+            print(
+                f"{result.zip_name}: imported {result.imported} of {result.modules} top level modules, "
+                f"{result.bytecode_seconds:.3f}s with bytecode, {result.source_seconds:.3f}s without"
+            )
+
     def _pre_install_pure_packages(self) -> None:
-        """Installs the pure python packages."""
+        """Installs the pure python packages, or restores the zip of them from the build cache."""
+        key = ""
+        # packages installed into pythonpath are mixed with the oxt source, only pure.zip is cached.
+        if self._cache is not None and self._config.zip_preinstall_pure:
+            key = self._get_pure_key()
+            if self._restore_stage("pure", key):
+                return
         pre_install = PreInstallPure()
-        pre_install.install()
+        pre_install.install(zip_bytecode=self._zip_bytecode)
+        self._store_stage("pure", key, self._build_path / "pure.zip")
+
+    def _get_pure_key(self) -> str:
+        """
+        Gets the build cache key of the pure packages from the versions pip resolves for them now.
+
+        Specs such as ``>=1.1.2`` and the dependencies of the packages resolve to newer releases over time,
+        the key changes when a clean build would install something else. Empty if a package can not be resolved.
+        """
+        if self._cache is None:
+            return ""
+        resolved: List[List[str]] = []
+        for pkg, ver in PrePackagesPure().packages.items():
+            dists = PipInstallBuild(pkg, ver).resolve()
+            if not dists:
+                print(f"Build cache: unable to resolve {pkg}{ver}, pure packages are not cached.", flush=True)
+                return ""
+            resolved.append(dists)
+        return self._cache.get_key(resolved, sys.version, self._get_bytecode_settings())
 
     def _zip_req_python_path(self) -> None:
         """Zips the required packages path."""
@@ -210,15 +337,31 @@ class Build:
         if new_file.exists():
             os.remove(new_file)
 
-        file_util.zip_folder(folder=self._build_path, dest_dir=self._dist_path)
+        date_time = file_util.get_source_date_time(self._src_path, self._config.toml_path)
+        file_util.zip_folder(folder=self._build_path, dest_dir=self._dist_path, date_time=date_time)
 
         os.rename(old_file, new_file)
 
     def _build_idl(self) -> None:
-        """Builds the idl files."""
+        """Builds the idl files, or restores the rdb files from the build cache."""
         idl = IdlRdb()
+        key = ""
+        if self._cache is not None and idl.idl_files:
+            key = self._cache.get_key(
+                self._cache.hash_tree(*idl.idl_files),
+                self._get_types_key(self._config.oo_types_uno),
+                self._get_types_key(self._config.oo_types_office),
+            )
+            if self._restore_stage("idl", key):
+                return
         if idl.has_files:
             idl.compile()
+        self._store_stage("idl", key, *idl.rdb_files)
+
+    def _get_types_key(self, types_file: str) -> List[str]:
+        """Gets the build cache key part of a LibreOffice types file used to compile idl files."""
+        assert self._cache is not None
+        return [types_file, self._cache.hash_file(types_file)]
 
     def _process_update(self) -> None:
         """Processes the update file."""
@@ -18,3 +18,9 @@ class BuildArgs:
     """Whether to pre-install pure packages."""
     compile_idl: bool = True
     """Whether to compile idl files."""
+    zip_bytecode: bool = False
+    """Whether to store compiled bytecode in the embedded zip files, also set by ``zip_bytecode`` in pyproject.toml."""
+    bytecode_report: bool = False
+    """Whether to report the import time of the embedded zip files with and without bytecode."""
+    incremental: bool = False
+    """Whether to reuse the outputs of unchanged build stages from the build cache."""
@@ -31,6 +31,9 @@ class Config(metaclass=Singleton):
         self._token_file_ext: Set[str] = set(cast(List, cfg_meta["token_file_ext"]))
         self._py_pkg_dir = cast(str, cfg_meta["py_pkg_dir"])
         self._zip_preinstall_pure = cast(bool, cfg_meta["zip_preinstall_pure"])
+        self._zip_bytecode = cast(bool, cfg_meta.get("zip_bytecode", False))
+        self._zip_bytecode_python = cast(str, cfg_meta.get("zip_bytecode_python", ""))
+        self._zip_bytecode_invalidation = cast(str, cfg_meta.get("zip_bytecode_invalidation", "unchecked-hash"))
 
         self._default_locale = cast(List[str], cfg_meta["default_locale"])
         self._resource_dir_name = cast(str, cfg_meta["resource_dir_name"])
@@ -65,6 +68,8 @@ class Config(metaclass=Singleton):
             raise ValueError("license is empty")
         if not self._py_pkg_dir:
             raise ValueError("py_pkg_dir is empty")
+        if self._zip_bytecode_invalidation not in ("checked-hash", "timestamp", "unchecked-hash"):
+            raise ValueError("zip_bytecode_invalidation must be one of checked-hash, timestamp, unchecked-hash")
 
     def _get_has_locals(self) -> bool:
         """Gets if there are any wheel or tar.gz files in the local directory."""
@@ -145,6 +150,40 @@ class Config(metaclass=Singleton):
         """
         return self._zip_preinstall_pure
 
+    @property
+    def zip_bytecode(self) -> bool:
+        """
+        Whether to store compiled ``.pyc`` files next to the sources in the embedded zip files.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.zip_bytecode)
+
+        zipimport can not write bytecode, without ``.pyc`` files in the zip every module is compiled on each start.
+        """
+        return self._zip_bytecode
+
+    @property
+    def zip_bytecode_python(self) -> str:
+        """
+        Gets the python executable that compiles the bytecode of the embedded zip files.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.zip_bytecode_python)
+
+        The bytecode is only used by the same python version, this should be the python of the target LibreOffice.
+        If empty then the python running the build is used.
+        """
+        return self._zip_bytecode_python
+
+    @property
+    def zip_bytecode_invalidation(self) -> str:
+        """
+        Gets the invalidation mode of the bytecode in the embedded zip files.
+
+        The value for this property can be set in pyproject.toml (tool.oxt.config.zip_bytecode_invalidation)
+
+        One of ``unchecked-hash`` (default), ``checked-hash`` or ``timestamp``.
+        """
+        return self._zip_bytecode_invalidation
+
     @property
     def build_path(self) -> Path:
         """The path to the build directory."""
@@ -2,11 +2,16 @@ from __future__ import annotations
 import os
 import shutil
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Tuple
 import os
+import time
+import zipfile
 from shutil import which
 from contextlib import contextmanager
 
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+"""Time of the entries of zip files that are only read by zipimport, the first time a zip can hold."""
+
 
 @contextmanager
 def change_dir(directory):
@@ -87,15 +92,21 @@ def write_string_to_file(file_path: str, content: str, encoding="UTF-8") -> None
         f.write(content)
 
 
-def zip_folder(folder: str | Path, base_name: str = "", dest_dir: str | Path = "") -> None:
+def zip_folder(
+    folder: str | Path, base_name: str = "", dest_dir: str | Path = "", date_time: Tuple[int, ...] = ZIP_DATE_TIME
+) -> None:
     """
     Zips all files in the given folder to the specified zip file.
 
+    The zip only depends on the names, modes and content of the files, entries are sorted
+    and all have the same time. Zipping the same files again gives the same bytes.
+
     Args:
         folder (str | Path): is a directory that will be the root directory of the archive;
-        base_name (str): is the name of the file to create, minus any format-specific
-            extension; 'format' is the archive format: one of "zip", "tar", "gztar",
-            "bztar", or "xztar".  Or any other registered format.
+        base_name (str): is the name of the file to create, minus the ``.zip`` extension.
+            Defaults to the name of ``folder``.
+        dest_dir (str | Path): Directory the zip file is written to. Defaults to the parent of ``folder``.
+        date_time (Tuple[int, ...]): Time of all entries. Defaults to ``ZIP_DATE_TIME``.
 
     Returns:
         None
@@ -120,8 +131,51 @@ def zip_folder(folder: str | Path, base_name: str = "", dest_dir: str | Path = "
     if not dest_dir.exists():
         raise FileNotFoundError(f"Folder '{dest_dir}' not found")
 
-    with change_dir(dest_dir):
-        shutil.make_archive(base_name, "zip", folder_path)
+    zip_file = dest_dir / f"{base_name}.zip"
+    with zipfile.ZipFile(zip_file, "w", zipfile.ZIP_DEFLATED) as zf:
+        for root, dirs, files in os.walk(folder_path):
+            dirs.sort()
+            root_path = Path(root)
+            for name in dirs:
+                pth = root_path / name
+                info = zipfile.ZipInfo(f"{pth.relative_to(folder_path).as_posix()}/", date_time=date_time)
+                info.external_attr = ((pth.stat().st_mode & 0xFFFF) << 16) | 0x10
+                zf.writestr(info, b"", compress_type=zipfile.ZIP_STORED)
+            for name in sorted(files):
+                pth = root_path / name
+                if pth == zip_file:
+                    continue
+                info = zipfile.ZipInfo(pth.relative_to(folder_path).as_posix(), date_time=date_time)
+                info.external_attr = (pth.stat().st_mode & 0xFFFF) << 16
+                zf.writestr(info, pth.read_bytes(), compress_type=zipfile.ZIP_DEFLATED)
+
+
+def get_source_date_time(*paths: str | Path) -> Tuple[int, ...]:
+    """
+    Gets the time for the entries of a zip that is built from files.
+
+    Args:
+        paths (str | Path): Source files and directories, the newest file gives the time.
+
+    Returns:
+        Tuple[int, ...]: Time such as ``(2024, 5, 1, 12, 30, 0)``.
+        The ``SOURCE_DATE_EPOCH`` environment variable is used when set.
+    """
+    epoch = os.environ.get("SOURCE_DATE_EPOCH", "")
+    if epoch:
+        newest = float(epoch)
+    else:
+        newest = 0.0
+        for path in paths:
+            pth = Path(path)
+            if pth.is_file():
+                newest = max(newest, pth.stat().st_mtime)
+                continue
+            for root, dirs, files in os.walk(pth):
+                dirs[:] = [d for d in dirs if d != "__pycache__"]
+                for name in files:
+                    newest = max(newest, os.stat(os.path.join(root, name)).st_mtime)
+    return max(time.localtime(newest)[:6], ZIP_DATE_TIME)
 
 
 def get_which(name: str | Path) -> str:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
+import json
 import os
 import sys
 import subprocess
@@ -29,7 +30,6 @@ class PipInstallBuild:
             self._pythonpath = self._build_path / "pure"
         else:
             self._pythonpath = self._build_path / "pythonpath"
-        self._pythonpath.mkdir(parents=True, exist_ok=True)
 
     def _cmd_pip(self, *args: str) -> List[str]:
         # pip install --target=d:\somewhere\other\than\the\default package_name
@@ -45,6 +45,7 @@ class PipInstallBuild:
             ver (str): The version of the package to install.
         """
         # sourcery skip: raise-specific-error
+        self._pythonpath.mkdir(parents=True, exist_ok=True)
         target = str(self._pythonpath)
         if " " in target:
             target = f'"{target}"'
@@ -66,3 +67,25 @@ class PipInstallBuild:
         """Install the package."""
         self._install_pkg(self._pkg_name, self._pkg_ver)
         return
+
+    def resolve(self) -> List[str]:
+        """
+        Gets the distributions ``install()`` would install, including dependencies, without installing them.
+
+        Returns:
+            List[str]: Sorted ``name==version`` of each distribution.
+            Empty if pip can not resolve the package, such as when offline or when pip is older than 22.2.
+        """
+        pkg_cmd = f"{self._pkg_name}{self._pkg_ver}" if self._pkg_ver else self._pkg_name
+        cmd = self._cmd_pip("install", "--dry-run", "--ignore-installed", "--quiet", "--report", "-", pkg_cmd)
+        if _si:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, startupinfo=_si)
+        else:
+            process = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if process.returncode != 0:
+            return []
+        try:
+            report = json.loads(process.stdout)
+            return sorted(f"{item['metadata']['name']}=={item['metadata']['version']}" for item in report["install"])
+        except (ValueError, KeyError, TypeError):
+            return []
@@ -6,6 +6,7 @@ from ..processing.pre_packages_pure import PrePackagesPure
 from .pip_install_build import PipInstallBuild
 from ..processing.pre_packages_pure import PrePackagesPure
 from ..config import Config
+from ..processing.zip_bytecode import ZipBytecode
 from .. import file_util
 
 
@@ -25,20 +26,27 @@ class PreInstallPure(metaclass=Singleton):
         else:
             self._dst = self._build_path / "pythonpath"
 
-    def install(self) -> None:
-        """Install the packages."""
+    def install(self, zip_bytecode: bool = False) -> None:
+        """
+        Install the packages.
+
+        Args:
+            zip_bytecode (bool, optional): Store compiled bytecode in the zip of the packages. Defaults to False.
+        """
         for pkg, ver in self._pre_packages.packages.items():
             pip_install = PipInstallBuild(pkg, ver)
             pip_install.install()
         self._clear_cache()
-        self._zip_pure()
+        self._zip_pure(zip_bytecode)
 
-    def _zip_pure(self) -> None:
+    def _zip_pure(self, zip_bytecode: bool = False) -> None:
         """Zip the pure python packages."""
         if not self._config.zip_preinstall_pure:
             return
         if not self._dst.exists():
             return
+        if zip_bytecode:
+            ZipBytecode().compile(self._dst)
         file_util.zip_folder(folder=self._dst)
         shutil.rmtree(self._dst)
 
@@ -0,0 +1,191 @@
+"""
+Persistent cache of the outputs of build stages, used by ``make.py build --incremental``.
+
+Each stage, such as zipping ``py_pkg_names`` or compiling idl files, gets a key that is the hash of its inputs:
+file contents, package names and versions, the pyproject values it reads and the python that runs it.
+When the key matches the key stored by the last build, the outputs of that build are copied into the build
+folder instead of running the stage. Zip files are written by ``file_util.zip_folder()`` which gives the same bytes
+for the same files, so a restored output is the same as the output of a clean build.
+
+File hashes are remembered by path, size and modification time, a file is only read again when it changed.
+"""
+
+from __future__ import annotations
+from typing import Any, Dict, List, Set
+from pathlib import Path
+import hashlib
+import json
+import os
+import shutil
+
+from ..config import Config
+
+_VERSION = 1
+
+
+class BuildCache:
+    """Cache of the outputs of build stages."""
+
+    def __init__(self, cache_dir: str | Path = "") -> None:
+        """
+        Constructor
+
+        Args:
+            cache_dir (str | Path, optional): Cache directory. Defaults to ``.build_cache`` next to ``pyproject.toml``.
+        """
+        self._cache_dir = Path(cache_dir) if cache_dir else Config().root_path / ".build_cache"
+        self._manifest_file = self._cache_dir / "manifest.json"
+        # path -> [size, mtime_ns, sha256]
+        self._files: Dict[str, List[Any]] = {}
+        # stage -> {"key": key, "outputs": [file names]}
+        self._stages: Dict[str, Dict[str, Any]] = {}
+        self._seen: Set[str] = set()
+        self._load()
+
+    # region Methods
+    def _load(self) -> None:
+        try:
+            data = json.loads(self._manifest_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") != _VERSION:
+            return
+        self._files = data.get("files", {})
+        self._stages = data.get("stages", {})
+
+    def save(self) -> None:
+        """Writes the manifest. Hashes of files that were not used in this build are dropped."""
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        files = {key: value for key, value in self._files.items() if key in self._seen}
+        data = {"version": _VERSION, "files": files, "stages": self._stages}
+        tmp = self._manifest_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self._manifest_file)
+
+    def hash_file(self, pth: str | Path) -> str:
+        """
+        Gets the sha256 hash of the content of a file.
+
+        Args:
+            pth (str | Path): File.
+
+        Returns:
+            str: Hex digest, empty if the file does not exist.
+        """
+        key = str(Path(pth).absolute())
+        try:
+            st = os.stat(key)
+        except OSError:
+            return ""
+        self._seen.add(key)
+        cached = self._files.get(key)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+        digest = hashlib.sha256()
+        with open(key, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        result = digest.hexdigest()
+        self._files[key] = [st.st_size, st.st_mtime_ns, result]
+        return result
+
+    def hash_tree(self, *paths: str | Path) -> str:
+        """
+        Gets a hash of the names and content of files and directories.
+
+        ``__pycache__`` and ``.pyc`` files are left out, the build removes them.
+
+        Args:
+            paths (str | Path): Files and directories.
+
+        Returns:
+            str: Hex digest.
+        """
+        digest = hashlib.sha256()
+        for path in paths:
+            pth = Path(path)
+            digest.update(f"{pth.name}\0".encode("utf-8"))
+            if pth.is_file():
+                digest.update(self.hash_file(pth).encode("ascii"))
+                continue
+            if not pth.is_dir():
+                digest.update(b"missing\0")
+                continue
+            for root, dirs, files in os.walk(pth):
+                dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+                for name in sorted(files):
+                    if name.endswith(".pyc"):
+                        continue
+                    file = Path(root, name)
+                    digest.update(f"{file.relative_to(pth).as_posix()}\0".encode("utf-8"))
+                    digest.update(self.hash_file(file).encode("ascii"))
+        return digest.hexdigest()
+
+    def get_key(self, *parts: Any) -> str:  # noqa: ANN401
+        """
+        Gets the key of a stage from its inputs.
+
+        Args:
+            parts (Any): Values that can be written as json such as hashes, names and settings.
+
+        Returns:
+            str: Hex digest.
+        """
+        text = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def restore(self, stage: str, key: str, dst: str | Path) -> bool:
+        """
+        Copies the outputs of a stage into a directory if they were stored with the same key.
+
+        Args:
+            stage (str): Stage name such as ``py_pkgs``.
+            key (str): Key of the inputs, see ``get_key()``.
+            dst (str | Path): Directory the outputs are copied to, such as the build directory.
+
+        Returns:
+            bool: ``True`` if the outputs are restored and the stage can be skipped; Otherwise, ``False``.
+        """
+        entry = self._stages.get(stage)
+        if not entry or entry.get("key") != key:
+            return False
+        stage_dir = self._cache_dir / "stages" / stage
+        names: List[str] = entry.get("outputs", [])
+        if not all((stage_dir / name).is_file() for name in names):
+            return False
+        dest = Path(dst)
+        dest.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            shutil.copyfile(stage_dir / name, dest / name)
+        return True
+
+    def store(self, stage: str, key: str, *outputs: str | Path) -> None:
+        """
+        Stores the outputs of a stage. Outputs that do not exist are left out.
+
+        Args:
+            stage (str): Stage name such as ``py_pkgs``.
+            key (str): Key of the inputs, see ``get_key()``.
+            outputs (str | Path): Files written by the stage.
+        """
+        stage_dir = self._cache_dir / "stages" / stage
+        if stage_dir.exists():
+            shutil.rmtree(stage_dir)
+        stage_dir.mkdir(parents=True)
+        names: List[str] = []
+        for output in outputs:
+            pth = Path(output)
+            if pth.is_file():
+                shutil.copyfile(pth, stage_dir / pth.name)
+                names.append(pth.name)
+        self._stages[stage] = {"key": key, "outputs": names}
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def cache_dir(self) -> Path:
+        """Gets the cache directory."""
+        return self._cache_dir
+
+    # endregion Properties
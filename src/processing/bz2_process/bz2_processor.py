@@ -10,7 +10,11 @@ from ..token import Token
 from ... import file_util
 
 
-class B2ZConfigT(TypedDict):
+class _B2ZConfigOptionalT(TypedDict, total=False):
+    pyd_sha256: str
+
+
+class B2ZConfigT(_B2ZConfigOptionalT):
     url: str
     md5: str
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from pathlib import Path
+from typing import List
 import subprocess
 from ...config import Config
 
@@ -46,4 +47,14 @@ class IdlRdb:
         """Check if there are any idl files in the idl directory."""
         return bool(self._idl_files)
 
+    @property
+    def idl_files(self) -> List[Path]:
+        """Gets the idl files in the idl directory."""
+        return self._idl_files
+
+    @property
+    def rdb_files(self) -> List[Path]:
+        """Gets the rdb files the idl files are compiled into."""
+        return [self._rdb_dir / f"{fnm.stem}.rdb" for fnm in self._idl_files]
+
     # endregion Properties
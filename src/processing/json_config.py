@@ -5,6 +5,7 @@ import json
 import toml
 
 from oxt.___lo_pip___.ver.req_version import ReqVersion
+from oxt.___lo_pip___.install.py_packages.requirement_table import build_requirement_table
 from ..meta.singleton import Singleton
 from ..config import Config
 from .token import Token
@@ -46,6 +47,14 @@ class JsonConfig(metaclass=Singleton):
             self._zip_preinstall_pure = cast(bool, self._cfg["tool"]["oxt"]["config"]["zip_preinstall_pure"])
         except Exception:
             self._zip_preinstall_pure = False
+        try:
+            self._wheel_cache_dir = cast(str, self._cfg["tool"]["oxt"]["config"]["wheel_cache_dir"])
+        except Exception:
+            self._wheel_cache_dir = ""
+        try:
+            self._wheel_cache_max_mb = int(self._cfg["tool"]["oxt"]["config"]["wheel_cache_max_mb"])
+        except Exception:
+            self._wheel_cache_max_mb = 0
         try:
             self._auto_install_in_site_packages = cast(
                 bool, self._cfg["tool"]["oxt"]["config"]["auto_install_in_site_packages"]
@@ -103,6 +112,36 @@ class JsonConfig(metaclass=Singleton):
         except Exception:
             self._install_on_no_uninstall_permission = True
 
+        try:
+            self._install_batch = cast(bool, self._cfg["tool"]["oxt"]["config"]["install_batch"])
+        except Exception:
+            self._install_batch = True
+
+        try:
+            self._internet_probe_hosts = cast(List[str], self._cfg["tool"]["oxt"]["config"]["internet_probe_hosts"])
+        except Exception:
+            self._internet_probe_hosts = ["pypi.org", "files.pythonhosted.org"]
+
+        try:
+            self._internet_probe_ttl = int(self._cfg["tool"]["oxt"]["config"]["internet_probe_ttl"])
+        except Exception:
+            self._internet_probe_ttl = 300
+
+        try:
+            self._pip_worker = cast(bool, self._cfg["tool"]["oxt"]["config"]["pip_worker"])
+        except Exception:
+            self._pip_worker = False
+
+        try:
+            self._trace_report = cast(bool, self._cfg["tool"]["oxt"]["config"]["trace_report"])
+        except Exception:
+            self._trace_report = False
+
+        try:
+            self._precompile = cast(bool, self._cfg["tool"]["oxt"]["config"]["precompile"])
+        except Exception:
+            self._precompile = True
+
         try:
             self._extension_version = cast(str, self._cfg["project"]["version"])
         except Exception:
@@ -171,6 +210,8 @@ class JsonConfig(metaclass=Singleton):
         json_config["lo_pip"] = token.get_token_value("lo_pip")
         json_config["libreoffice_debug_port"] = token.get_unprocessed_token_value("libreoffice_debug_port", 0)
 
+        json_config["wheel_cache_dir"] = self._wheel_cache_dir
+        json_config["wheel_cache_max_mb"] = self._wheel_cache_max_mb
         json_config["zipped_preinstall_pure"] = self._zip_preinstall_pure
         json_config["auto_install_in_site_packages"] = self._auto_install_in_site_packages
         json_config["install_wheel"] = self._install_wheel
@@ -183,6 +224,12 @@ class JsonConfig(metaclass=Singleton):
         json_config["sym_link_cpython"] = self._sym_link_cpython
         json_config["uninstall_on_update"] = self._uninstall_on_update
         json_config["install_on_no_uninstall_permission"] = self._install_on_no_uninstall_permission
+        json_config["install_batch"] = self._install_batch
+        json_config["internet_probe_hosts"] = self._internet_probe_hosts
+        json_config["internet_probe_ttl"] = self._internet_probe_ttl
+        json_config["pip_worker"] = self._pip_worker
+        json_config["trace_report"] = self._trace_report
+        json_config["precompile"] = self._precompile
         json_config["extension_version"] = self._extension_version
         json_config["unload_after_install"] = self._unload_after_install
         json_config["pip_shared_dirs"] = self._pip_shared_dirs
@@ -197,6 +244,7 @@ class JsonConfig(metaclass=Singleton):
 
         # region Requirements Rule
         json_config["py_packages"] = self._py_packages
+        json_config["requirement_table"] = build_requirement_table(self._requirements, self._py_packages)
         # endregion Requirements Rule
 
         self._validate_config_dict(json_config)
@@ -241,6 +289,9 @@ class JsonConfig(metaclass=Singleton):
         assert isinstance(self._run_imports_win, list), "run_imports_win must be a list"
         assert isinstance(self._requirements, dict), "requirements must be a dict"
         assert isinstance(self._zip_preinstall_pure, bool), "zip_preinstall_pure must be a bool"
+        assert isinstance(self._wheel_cache_dir, str), "wheel_cache_dir must be a string"
+        assert isinstance(self._wheel_cache_max_mb, int), "wheel_cache_max_mb must be an int"
+        assert self._wheel_cache_max_mb >= 0, "wheel_cache_max_mb must not be negative"
         assert isinstance(self._auto_install_in_site_packages, bool), "auto_install_in_site_packages must be a bool"
         assert isinstance(self._install_wheel, bool), "install_wheel must be a bool"
         assert isinstance(self._window_timeout, int), "window_timeout must be an int"
@@ -257,6 +308,15 @@ class JsonConfig(metaclass=Singleton):
         assert isinstance(
             self._install_on_no_uninstall_permission, bool
         ), "_install_on_no_uninstall_permission must be a bool"
+        assert isinstance(self._install_batch, bool), "install_batch must be a bool"
+        assert isinstance(self._internet_probe_hosts, list), "internet_probe_hosts must be a list"
+        for host in self._internet_probe_hosts:
+            assert isinstance(host, str), "internet_probe_hosts must be a list of strings"
+        assert isinstance(self._internet_probe_ttl, int), "internet_probe_ttl must be an int"
+        assert self._internet_probe_ttl >= 0, "internet_probe_ttl must not be negative"
+        assert isinstance(self._pip_worker, bool), "pip_worker must be a bool"
+        assert isinstance(self._trace_report, bool), "trace_report must be a bool"
+        assert isinstance(self._precompile, bool), "precompile must be a bool"
         assert isinstance(self._no_pip_remove, list), "no_pip_remove must be a list"
         assert self._extension_version.count(".") == 2, "extension_version must contain two periods"
         assert isinstance(self._unload_after_install, bool), "unload_after_install must be a bool"
@@ -1,12 +1,20 @@
 from __future__ import annotations
-from typing import cast, Any, Dict, List
+from typing import cast, Any, Dict, List, Pattern
+import re
 import toml
 from ..meta.singleton import Singleton
 from .. import file_util
 
 
 class Token(metaclass=Singleton):
-    """Singleton Class the tokens."""
+    """
+    Singleton Class the tokens.
+
+    Text is processed in a single pass, one compiled regex matches every ``___name___`` marker and each
+    marker is replaced by a value that already holds the expansion of the tokens that follow it.
+    This gives the same result as replacing the tokens one after another, in the rare case it could not
+    (text that still holds ``___`` after the pass) the text is processed one token at a time.
+    """
 
     def __init__(self) -> None:
         toml_path = file_util.find_file_in_parent_dirs("pyproject.toml")
@@ -28,9 +36,12 @@ class Token(metaclass=Singleton):
         self._tokens["___authors___"] = ", ".join(authors)
         self._tokens["___contributors___"] = "\n".join(authors)
         self._processed_tokens = {}
+        self._pattern: Pattern[str] | None = None
+        self._replacements: Dict[str, str] = {}
         for token, replacement in self._tokens.items():
             self._processed_tokens[token] = self.process(replacement)
         self._tokens_remove_whitespace()
+        self._compile()
 
     # region Methods
     def _validate_toml_dict(self, cfg: Dict[str, Any]) -> None:
@@ -118,6 +129,30 @@ class Token(metaclass=Singleton):
             if str_key in self._processed_tokens:
                 self._processed_tokens[str_key] = remove_spaces(self._processed_tokens[str_key])
 
+    def _compile(self) -> None:
+        """Compiles the single pass pattern."""
+        items = [(token, str(replacement)) for token, replacement in self._processed_tokens.items()]
+        for token, _ in items:
+            name = token[3:-3]
+            if not name or name.startswith("_") or name.endswith("_") or "___" in name:
+                # markers could overlap, keep replacing one token at a time.
+                return
+        # A value is expanded by the tokens after it, as the one token at a time replace would do.
+        replacements: Dict[str, str] = {}
+        for i, (token, replacement) in enumerate(items):
+            for later, later_replacement in items[i + 1 :]:
+                replacement = replacement.replace(later, later_replacement)
+            replacements[token] = replacement
+        self._replacements = replacements
+        if replacements:
+            markers = sorted(replacements, key=len, reverse=True)
+            self._pattern = re.compile("|".join(re.escape(token) for token in markers))
+
+    def _process_sequential(self, value: str) -> str:
+        for token, replacement in self._processed_tokens.items():
+            value = value.replace(token, str(replacement))
+        return value
+
     def process(self, value: Any) -> str:  # noqa: ANN401
         """Processes the given text."""
         if isinstance(value, bool):
@@ -126,10 +161,14 @@ class Token(metaclass=Singleton):
             return str(value)
         if not isinstance(value, str):
             return str(value)
-        for token, replacement in self._processed_tokens.items():
-            value = value.replace(token, str(replacement))
-
-        return value
+        if "___" not in value:
+            return value
+        if self._pattern is None:
+            return self._process_sequential(value)
+        result = self._pattern.sub(lambda m: self._replacements[m.group(0)], value)
+        if "___" in result:
+            return self._process_sequential(value)
+        return result
 
     def get_token_value(self, token: str) -> str:  # noqa: ANN401
         """
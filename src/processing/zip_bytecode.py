@@ -0,0 +1,246 @@
+"""
+Compiled bytecode for the embedded zip files, ``py_pkgs.zip``, ``req_py_pkgs.zip`` and ``pure.zip``.
+
+zipimport can not write ``__pycache__``, a zip of sources is compiled in memory on every start of LibreOffice.
+zipimport does not read ``__pycache__`` either, it only loads a ``module.pyc`` that is next to ``module.py``.
+The folder that is about to be zipped is compiled with ``python -m compileall -b`` which writes those legacy files.
+
+A ``.pyc`` is only loaded by the python version that wrote it, so there is one target python per build,
+see ``Config.zip_bytecode_python``. Other versions ignore the ``.pyc`` and compile the source as before.
+
+The invalidation mode defaults to ``unchecked-hash``, the zip is never changed after the build.
+``timestamp`` compares with the time of the zip entry, ``file_util.ZIP_DATE_TIME``, which zipimport reads as
+local time, it only matches when the extension is used in the time zone it was built in.
+"""
+
+from __future__ import annotations
+from typing import Dict, List, NamedTuple
+from pathlib import Path
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+
+from ..config import Config
+from .. import file_util
+
+# Imports every top level module of a zip with stub uno modules, prints the time as json.
+# Stubs are created for uno, unohelper and com.* so modules written for LibreOffice can be imported.
+_HARNESS = r"""
+import importlib
+import importlib.abc
+import importlib.machinery
+import json
+import sys
+import time
+import types
+
+
+class _Stub(type):
+    def __getattr__(cls, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub(name, (), {})
+
+    def __call__(cls, *args, **kwargs):
+        return cls
+
+    def __or__(cls, other):
+        return cls
+
+    __ror__ = __or__
+
+
+class _StubModule(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _Stub(name, (), {})
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname in ("uno", "unohelper") or fullname == "com" or fullname.startswith("com."):
+            return importlib.machinery.ModuleSpec(fullname, self, is_package=True)
+        return None
+
+    def create_module(self, spec):
+        module = _StubModule(spec.name)
+        module.__path__ = []
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+sys.meta_path.insert(0, _StubFinder())
+sys.path.insert(0, sys.argv[1])
+names = json.loads(sys.argv[2])
+imported = 0
+start = time.perf_counter()
+for name in names:
+    try:
+        importlib.import_module(name)
+        imported += 1
+    except BaseException:
+        pass
+seconds = time.perf_counter() - start
+print(json.dumps({"seconds": seconds, "imported": imported, "modules": len(names)}))
+"""
+
+
+class ImportTime(NamedTuple):
+    """Import time of the top level modules of a zip."""
+
+    zip_name: str
+    modules: int
+    imported: int
+    bytecode_seconds: float
+    source_seconds: float
+
+
+class ZipBytecode:
+    """Compiles the sources of a folder that is zipped next to the sources, where zipimport looks for them."""
+
+    def __init__(self, python: str = "", invalidation_mode: str = "") -> None:
+        """
+        Constructor
+
+        Args:
+            python (str, optional): Python executable that compiles. Defaults to ``Config.zip_bytecode_python``
+                or the python running the build.
+            invalidation_mode (str, optional): ``unchecked-hash``, ``checked-hash`` or ``timestamp``.
+                Defaults to ``Config.zip_bytecode_invalidation``.
+        """
+        if not python or not invalidation_mode:
+            config = Config()
+            python = python or config.zip_bytecode_python
+            invalidation_mode = invalidation_mode or config.zip_bytecode_invalidation
+        self._python = python or sys.executable
+        self._invalidation_mode = invalidation_mode
+
+    # region Methods
+    def compile(self, folder: str | Path) -> bool:
+        """
+        Writes a ``.pyc`` next to each ``.py`` file of a folder that is about to be zipped.
+
+        Args:
+            folder (str | Path): Folder such as ``build/py_pkgs``.
+
+        Returns:
+            bool: ``True`` if every file compiled. Files that do not compile are still imported from source.
+        """
+        pth = Path(folder)
+        if not pth.exists():
+            return True
+        if self._invalidation_mode == "timestamp":
+            # the pyc must hold the time of the zip entry of its source
+            mtime = time.mktime((*file_util.ZIP_DATE_TIME, 0, 1, -1))
+            for src in pth.rglob("*.py"):
+                os.utime(src, (mtime, mtime))
+        # -d: the file name shown in tracebacks is relative to the zip, not the build folder.
+        cmd = [
+            self._python,
+            "-m",
+            "compileall",
+            "-q",
+            "-b",
+            "-j",
+            "0",
+            f"--invalidation-mode={self._invalidation_mode}",
+            "-d",
+            pth.name,
+            str(pth),
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        if result.returncode != 0:
+            print(f"Some files in {pth.name} did not compile and are zipped as source only:\n{result.stdout}")
+            return False
+        return True
+
+    def get_top_level_names(self, zip_file: str | Path) -> List[str]:
+        """
+        Gets the names of the top level modules and packages of a zip.
+
+        Args:
+            zip_file (str | Path): Zip file such as ``build/py_pkgs.zip``.
+
+        Returns:
+            List[str]: Sorted module names.
+        """
+        names: Dict[str, None] = {}
+        with zipfile.ZipFile(zip_file) as zf:
+            for entry in zf.namelist():
+                parts = entry.split("/")
+                if len(parts) == 1:
+                    name, dot, ext = parts[0].rpartition(".")
+                    if dot and ext in ("py", "pyc") and name.isidentifier():
+                        names[name] = None
+                elif len(parts) == 2 and parts[1] in ("__init__.py", "__init__.pyc") and parts[0].isidentifier():
+                    names[parts[0]] = None
+        return sorted(names)
+
+    def _copy_source_only(self, zip_file: Path, dst: Path) -> Path:
+        """Copies a zip without its ``.pyc`` files."""
+        dst.mkdir(parents=True, exist_ok=True)
+        result = dst / zip_file.name
+        with zipfile.ZipFile(zip_file) as src, zipfile.ZipFile(result, "w", zipfile.ZIP_DEFLATED) as out:
+            for info in src.infolist():
+                if not info.filename.endswith(".pyc"):
+                    out.writestr(info, src.read(info))
+        return result
+
+    def _time_import(self, zip_file: Path, names: List[str]) -> Dict[str, float]:
+        cmd = [self._python, "-B", "-c", _HARNESS, str(zip_file), json.dumps(names)]
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True)
+        return json.loads(result.stdout.strip().splitlines()[-1])
+
+    def report(self, zip_file: str | Path, runs: int = 3) -> ImportTime:
+        """
+        Times importing the top level modules of a zip with and without its bytecode.
+
+        Each import runs in a new process of the target python with stub ``uno``, ``unohelper`` and ``com`` modules.
+        The fastest of the runs is kept.
+
+        Args:
+            zip_file (str | Path): Zip file that contains bytecode such as ``build/py_pkgs.zip``.
+            runs (int, optional): Number of runs of each import. Defaults to ``3``.
+
+        Returns:
+            ImportTime: Import times.
+        """
+        pth = Path(zip_file)
+        names = self.get_top_level_names(pth)
+        tmp_dir = Path(tempfile.mkdtemp())
+        try:
+            source_zip = self._copy_source_only(pth, tmp_dir)
+            with_bytecode = [self._time_import(pth, names) for _ in range(runs)]
+            source_only = [self._time_import(source_zip, names) for _ in range(runs)]
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        return ImportTime(
+            zip_name=pth.name,
+            modules=len(names),
+            imported=int(with_bytecode[0]["imported"]),
+            bytecode_seconds=min(item["seconds"] for item in with_bytecode),
+            source_seconds=min(item["seconds"] for item in source_only),
+        )
+
+    # endregion Methods
+
+    # region Properties
+    @property
+    def python(self) -> str:
+        """Gets the python executable that compiles."""
+        return self._python
+
+    @property
+    def invalidation_mode(self) -> str:
+        """Gets the invalidation mode of the bytecode."""
+        return self._invalidation_mode
+
+    # endregion Properties
@@ -4,9 +4,24 @@ from pathlib import Path
 import shutil
 import stat
 import tempfile
+from typing import Any, Callable, Iterator, List
 import pytest
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption("--benchmark", action="store_true", default=False, help="run the tests marked benchmark")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: List[pytest.Item]) -> None:
+    # wall clock comparisons depend on the load of the machine, they only run when asked for.
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
 def remove_readonly(func, path, excinfo):
     try:
         os.chmod(path, stat.S_IWRITE)
@@ -21,3 +36,24 @@ def tmp_path_session():
     yield result
     if os.path.exists(result):
         shutil.rmtree(result, onerror=remove_readonly)
+
+
+@pytest.fixture
+def new_singleton() -> Iterator[Callable[..., Any]]:
+    """
+    Creates an instance of a ``Singleton`` class that is not shared with other tests.
+
+    The instance kept for the class is cleared before the class is called,
+    the kept instances are restored after the test.
+    """
+    from oxt.___lo_pip___.meta.singleton import Singleton
+
+    saved = dict(Singleton._instances)
+
+    def create(cls: type, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        Singleton._instances.pop(cls, None)
+        return cls(*args, **kwargs)
+
+    yield create
+    Singleton._instances.clear()
+    Singleton._instances.update(saved)
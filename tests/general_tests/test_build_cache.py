@@ -0,0 +1,153 @@
+from __future__ import annotations
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from src import file_util
+from src.processing.build_cache import BuildCache
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _make_pkg(root: Path) -> Path:
+    pkg = root / "my_pkg"
+    (pkg / "sub").mkdir(parents=True)
+    (pkg / "__init__.py").write_text("VALUE = 1\n")
+    (pkg / "sub" / "__init__.py").write_text("")
+    (pkg / "__pycache__").mkdir()
+    (pkg / "__pycache__" / "x.cpython-311.pyc").write_bytes(b"junk")
+    return pkg
+
+
+def test_zip_folder_is_reproducible(tmp_path: Path) -> None:
+    pkg = _make_pkg(tmp_path / "a")
+    file_util.zip_folder(folder=pkg, dest_dir=tmp_path)
+    first = (tmp_path / "my_pkg.zip").read_bytes()
+
+    # same files written later give the same zip
+    time.sleep(0.01)
+    os.utime(pkg / "__init__.py", (time.time() + 10, time.time() + 10))
+    file_util.zip_folder(folder=pkg, dest_dir=tmp_path)
+    assert (tmp_path / "my_pkg.zip").read_bytes() == first
+
+    (pkg / "__init__.py").write_text("VALUE = 2\n")
+    file_util.zip_folder(folder=pkg, dest_dir=tmp_path)
+    assert (tmp_path / "my_pkg.zip").read_bytes() != first
+
+
+def test_source_date_time(tmp_path: Path, mocker: MockerFixture) -> None:
+    pkg = _make_pkg(tmp_path)
+    mtime = time.mktime((2021, 6, 1, 12, 0, 0, 0, 1, -1))
+    for pth in pkg.rglob("*.py"):
+        os.utime(pth, (mtime, mtime))
+    # __pycache__ is not a source
+    assert file_util.get_source_date_time(pkg) == (2021, 6, 1, 12, 0, 0)
+
+    mocker.patch.dict(os.environ, {"SOURCE_DATE_EPOCH": "0"})
+    assert file_util.get_source_date_time(pkg) == file_util.ZIP_DATE_TIME
+
+
+def test_hash_tree(tmp_path: Path) -> None:
+    cache = BuildCache(tmp_path / "cache")
+    pkg = _make_pkg(tmp_path / "src")
+    key = cache.hash_tree(pkg)
+    assert cache.hash_tree(pkg) == key
+
+    # bytecode is not an input
+    (pkg / "__pycache__" / "y.cpython-311.pyc").write_bytes(b"more junk")
+    (pkg / "mod.pyc").write_bytes(b"junk")
+    assert cache.hash_tree(pkg) == key
+
+    (pkg / "sub" / "__init__.py").write_text("X = 1\n")
+    assert cache.hash_tree(pkg) != key
+    assert cache.hash_tree(tmp_path / "missing") != cache.hash_tree(tmp_path / "other")
+
+
+def test_hash_file_memo(tmp_path: Path, mocker: MockerFixture) -> None:
+    cache_dir = tmp_path / "cache"
+    src = tmp_path / "src.py"
+    src.write_text("A = 1\n")
+    cache = BuildCache(cache_dir)
+    digest = cache.hash_file(src)
+    assert cache.hash_file(tmp_path / "missing.py") == ""
+    cache.save()
+
+    # unchanged files are not read again by the next build
+    cache = BuildCache(cache_dir)
+    read_bytes = mocker.patch("builtins.open", side_effect=AssertionError("file read"))
+    assert cache.hash_file(src) == digest
+    read_bytes.assert_not_called()
+
+
+def test_store_restore(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    build = tmp_path / "build"
+    build.mkdir()
+    out = build / "py_pkgs.zip"
+    out.write_bytes(b"zip data")
+
+    cache = BuildCache(cache_dir)
+    key = cache.get_key(["my_pkg"], "abc", [False])
+    assert cache.get_key(["my_pkg"], "abc", [False]) == key
+    assert cache.restore("py_pkgs", key, build) is False
+    cache.store("py_pkgs", key, out, build / "not_written.rdb")
+    cache.save()
+
+    new_build = tmp_path / "new_build"
+    cache = BuildCache(cache_dir)
+    assert cache.restore("py_pkgs", cache.get_key(["my_pkg"], "abd", [False]), new_build) is False
+    assert cache.restore("py_pkgs", key, new_build) is True
+    assert (new_build / "py_pkgs.zip").read_bytes() == b"zip data"
+    assert not (new_build / "not_written.rdb").exists()
+
+    # a stage without outputs is restored as nothing to do
+    cache.store("idl", "key", build / "none.rdb")
+    assert cache.restore("idl", "key", new_build) is True
+
+
+def test_pure_key_uses_resolved_versions(tmp_path: Path, mocker: MockerFixture) -> None:
+    from src.build import Build
+
+    mocker.patch("src.build.PrePackagesPure").return_value.packages = {"verr": ">=1.1.2"}
+    resolve = mocker.patch("src.build.PipInstallBuild").return_value.resolve
+    build = mocker.Mock(_cache=BuildCache(tmp_path / "cache"))
+    build._get_bytecode_settings.return_value = [False]
+
+    resolve.return_value = ["verr==1.1.2"]
+    key = Build._get_pure_key(build)
+    assert key
+    assert Build._get_pure_key(build) == key
+
+    # the same spec resolves to a newer release, a clean build would install it
+    resolve.return_value = ["verr==1.2.0"]
+    assert Build._get_pure_key(build) != key
+
+    # offline, the stage is not cached
+    resolve.return_value = []
+    assert Build._get_pure_key(build) == ""
+
+
+def test_pip_install_build_resolve(mocker: MockerFixture) -> None:
+    import json
+    import subprocess
+    from src.install.pip_install_build import PipInstallBuild
+
+    report = {
+        "install": [{"metadata": {"name": "verr", "version": "1.1.2"}}, {"metadata": {"name": "a", "version": "1"}}]
+    }
+    run = mocker.patch("src.install.pip_install_build.subprocess.run")
+    run.return_value = subprocess.CompletedProcess([], 0, stdout=json.dumps(report).encode(), stderr=b"")
+    pip_install = PipInstallBuild("verr", ">=1.1.2")
+    assert pip_install.resolve() == ["a==1", "verr==1.1.2"]
+    cmd = run.call_args.args[0]
+    assert cmd[3:5] == ["install", "--dry-run"]
+    assert cmd[-1] == "verr>=1.1.2"
+
+    run.return_value = subprocess.CompletedProcess([], 1, stdout=b"", stderr=b"no network")
+    assert pip_install.resolve() == []
@@ -0,0 +1,97 @@
+from __future__ import annotations
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.thread import cancel_token
+from oxt.___lo_pip___.thread.cancellable_thread import CancellableThread
+from oxt.___lo_pip___.thread.killable_thread import KillableThread
+
+_LOOPS = 300_000
+
+
+def test_kill_at_sleep() -> None:
+    started = threading.Event()
+    results: List[str] = []
+
+    def runner() -> None:
+        started.set()
+        try:
+            while True:
+                cancel_token.sleep(10)
+        finally:
+            results.append("done")
+
+    thread = CancellableThread(target=runner, daemon=True)
+    thread.start()
+    assert started.wait(5)
+    start = time.perf_counter()
+    thread.kill()
+    thread.join(5)
+    assert not thread.is_alive()
+    assert thread.killed
+    assert results == ["done"]
+    # the wait is woken by the kill, not by the end of the sleep
+    assert time.perf_counter() - start < 5
+
+
+def test_kill_terminates_process() -> None:
+    started = threading.Event()
+    codes: List[int] = []
+
+    def runner() -> None:
+        token = cancel_token.get_token()
+        with subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"]) as proc, token.process(proc):
+            started.set()
+            codes.append(proc.wait())
+        token.checkpoint()
+        codes.append(0)
+
+    thread = CancellableThread(target=runner, daemon=True)
+    thread.start()
+    assert started.wait(10)
+    thread.kill()
+    thread.join(10)
+    assert not thread.is_alive()
+    # the process was terminated and the checkpoint ended the thread
+    assert len(codes) == 1
+    assert codes[0] != 0
+
+
+def test_main_thread_token_not_cancelled() -> None:
+    cancel_token.checkpoint()
+    assert not cancel_token.get_token().is_cancelled
+
+
+def _cpu_loop() -> None:
+    total = 0
+    for i in range(_LOOPS):
+        total += i * i
+        cancel_token.checkpoint()
+
+
+def _run_time(thread_cls: Callable[..., threading.Thread]) -> float:
+    thread = thread_cls(target=_cpu_loop)
+    start = time.perf_counter()
+    thread.start()
+    thread.join()
+    return time.perf_counter() - start
+
+
+@pytest.mark.benchmark
+def test_overhead_benchmark(record_property: Callable[[str, object], None]) -> None:
+    if sys.gettrace() is not None:
+        pytest.skip("A tracer such as coverage is running")
+    plain = _run_time(threading.Thread)
+    cancellable = _run_time(CancellableThread)
+    killable = _run_time(KillableThread)
+    record_property("thread_seconds", plain)
+    record_property("cancellable_thread_seconds", cancellable)
+    record_property("killable_thread_seconds", killable)
+    assert cancellable < killable
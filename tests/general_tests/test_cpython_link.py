@@ -0,0 +1,85 @@
+from __future__ import annotations
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.pkg_installers.pkg_install_data import PkgInstallData
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.post.cpython_link import CPythonLink
+    from pytest_mock import MockerFixture
+
+_OLD = "cpython-38-x86_64-linux-gnu"
+_NEW = "cpython-3.8"
+
+
+def _get_link(mocker: MockerFixture, site_dir: Path) -> CPythonLink:
+    from oxt.___lo_pip___.install.post.cpython_link import CPythonLink
+
+    mod = "oxt.___lo_pip___.install.post.cpython_link"
+    cfg = mocker.patch(f"{mod}.Config").return_value
+    cfg.site_packages = str(site_dir)
+    cfg.log_level = 10
+    cfg.lo_implementation_name = "my_ext"
+    mocker.patch(f"{mod}.OxtLogger")
+    link = CPythonLink()
+    link.cpy_name = _NEW
+    return link
+
+
+def _make_so(pth: Path) -> Path:
+    pth.parent.mkdir(parents=True, exist_ok=True)
+    pth.write_bytes(b"")
+    return pth
+
+
+def test_link_full_scan(tmp_path: Path, mocker: MockerFixture) -> None:
+    site_dir = tmp_path / "site-packages"
+    one = _make_so(site_dir / "pkg_a" / f"one.{_OLD}.so")
+    two = _make_so(site_dir / "pkg_b" / "sub" / f"two.{_OLD}.so")
+    _make_so(site_dir / "pkg_b" / "plain.abi3.so")
+    link = _get_link(mocker, site_dir)
+    assert link.file_suffix == _OLD
+
+    link.link()
+    for src in (one, two):
+        dst = src.parent / src.name.replace(_OLD, _NEW)
+        assert dst.is_symlink()
+        assert os.readlink(dst) == str(src)
+
+    # links that point to the right file are not removed again.
+    create = mocker.spy(Path, "symlink_to")
+    unlink = mocker.spy(Path, "unlink")
+    link = _get_link(mocker, site_dir)
+    link.overwrite = True
+    link.link()
+    create.assert_not_called()
+    unlink.assert_not_called()
+
+
+def test_link_tracked(tmp_path: Path, mocker: MockerFixture) -> None:
+    site_dir = tmp_path / "site-packages"
+    old_pkg = _make_so(site_dir / "old_pkg" / f"old.{_OLD}.so")
+    new_pkg = _make_so(site_dir / "new_pkg" / f"new.{_OLD}.so")
+    new_mod = _make_so(site_dir / f"_mod.{_OLD}.so")
+    index = mocker.patch("oxt.___lo_pip___.install.post.cpython_link.TrackingIndex").return_value
+    since = time.time()
+    index.get_packages.return_value = [
+        PkgInstallData(package="new_pkg", data={"new_dirs": ["new_pkg"], "new_files": [new_mod.name]})
+    ]
+
+    link = _get_link(mocker, site_dir)
+    tracked = link.get_tracked_paths(since)
+    index.get_packages.assert_called_once_with(str(site_dir), since=since)
+    assert sorted(tracked) == sorted([site_dir / "new_pkg", new_mod])
+
+    link.link(tracked)
+    assert (new_pkg.parent / new_pkg.name.replace(_OLD, _NEW)).is_symlink()
+    assert (site_dir / new_mod.name.replace(_OLD, _NEW)).is_symlink()
+    # packages from earlier runs are not visited.
+    assert not (old_pkg.parent / old_pkg.name.replace(_OLD, _NEW)).exists()
@@ -0,0 +1,117 @@
+from __future__ import annotations
+import sys
+import time
+import zipfile
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any, Callable, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.distribution_index import DistributionIndex
+
+
+def _make_dist(root: Path, name: str, ver: str) -> Path:
+    dist_info = root / f"{name}-{ver}.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {ver}\n\nBody\n")
+    return dist_info
+
+
+@pytest.fixture
+def site_dirs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> List[Path]:
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+    first.mkdir()
+    second.mkdir()
+    monkeypatch.setattr(sys, "path", [str(first), str(second)])
+    return [first, second]
+
+
+def test_get_version(site_dirs: List[Path], new_singleton: Callable[..., Any]) -> None:
+    first, second = site_dirs
+    _make_dist(first, "typing_extensions", "4.12.2")
+    _make_dist(first, "verr", "1.1.2")
+    _make_dist(second, "verr", "1.0.0")
+    egg_info = second / "spam.egg-info"
+    egg_info.mkdir()
+    (egg_info / "PKG-INFO").write_text("Metadata-Version: 1.1\nName: spam\nVersion: 0.3\n")
+
+    index = new_singleton(DistributionIndex)
+    assert index.get_version("Typing-Extensions") == "4.12.2"
+    # first entry on sys.path wins
+    assert index.get_version("verr") == "1.1.2"
+    assert index.get_path("verr") == str(first / "verr-1.1.2.dist-info")
+    assert index.get_version("spam") == "0.3"
+    assert index.get_version("missing") == ""
+    assert len(index) == 3
+
+
+def test_zip_entry(tmp_path: Path, site_dirs: List[Path], new_singleton: Callable[..., Any]) -> None:
+    zip_path = tmp_path / "py_pkgs.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("ooo_dev-0.47.0.dist-info/METADATA", "Name: ooo-dev\nVersion: 0.47.0\n")
+        zf.writestr("ooodev/__init__.py", "")
+    index = new_singleton(DistributionIndex)
+    assert index.get_version("ooo-dev") == ""
+
+    # adding an entry to sys.path is picked up without a refresh
+    sys.path.append(str(zip_path))
+    assert index.get_version("ooo-dev") == "0.47.0"
+
+
+def test_refresh(site_dirs: List[Path], new_singleton: Callable[..., Any]) -> None:
+    first, _ = site_dirs
+    index = new_singleton(DistributionIndex)
+    assert index.get_version("verr") == ""
+
+    _make_dist(first, "verr", "1.1.2")
+    # not scanned again until refreshed
+    assert index.get_version("verr") == ""
+    index.refresh(str(first))
+    assert index.get_version("verr") == "1.1.2"
+
+
+def _make_many(root: Path) -> List[str]:
+    for i in range(2000):
+        _make_dist(root, f"dist_{i}", f"1.{i}.0")
+    return [f"dist-{i * 40}" for i in range(50)]
+
+
+def _lookup_version(names: List[str]) -> List[str]:
+    results = []
+    for name in names:
+        try:
+            results.append(version(name))
+        except PackageNotFoundError:
+            results.append("")
+    return results
+
+
+def test_matches_version(site_dirs: List[Path], new_singleton: Callable[..., Any]) -> None:
+    names = _make_many(site_dirs[0])
+    index = new_singleton(DistributionIndex)
+    assert [index.get_version(name) for name in names] == _lookup_version(names)
+
+
+@pytest.mark.benchmark
+def test_benchmark_against_version(
+    site_dirs: List[Path], new_singleton: Callable[..., Any], record_property: Callable[[str, object], None]
+) -> None:
+    names = _make_many(site_dirs[0])
+
+    start = time.perf_counter()
+    _lookup_version(names)
+    version_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = new_singleton(DistributionIndex)
+    for name in names:
+        index.get_version(name)
+    index_time = time.perf_counter() - start
+
+    record_property("version_seconds", version_time)
+    record_property("index_seconds", index_time)
+    assert index_time < version_time
@@ -0,0 +1,121 @@
+from __future__ import annotations
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, List, Tuple
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.download import Download
+    from pytest_mock import MockerFixture
+
+_DATA = bytes(range(256)) * 4096  # 1 MiB
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # number of requests that are dropped half way
+    drop_count = 0
+    accept_ranges = True
+    requests: List[str] = []
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802
+        start = 0
+        rng = self.headers.get("Range")
+        _Handler.requests.append(rng or "")
+        if rng and _Handler.accept_ranges:
+            start = int(rng.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(_DATA) - 1}/{len(_DATA)}")
+        else:
+            self.send_response(200)
+        body = _DATA[start:]
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", '"abc"')
+        self.end_headers()
+        if _Handler.drop_count > 0:
+            _Handler.drop_count -= 1
+            self.wfile.write(body[: len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _Handler.drop_count = 0
+    _Handler.accept_ranges = True
+    _Handler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/embedded_py.zip"
+    server.shutdown()
+    server.server_close()
+
+
+def _get_download(new_singleton: Callable[..., Any], mocker: MockerFixture) -> Download:
+    from oxt.___lo_pip___.install.download import Download
+
+    mod = "oxt.___lo_pip___.install.download"
+    mocker.patch(f"{mod}.OxtLogger")
+    mocker.patch(f"{mod}.InternetProbe").return_value.wait.return_value = True
+
+    return new_singleton(Download)
+
+
+def test_download(tmp_path: Path, server_url: str, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    dl = _get_download(new_singleton, mocker)
+    progress: List[Tuple[int, int]] = []
+    dst = tmp_path / "embedded_py.zip"
+    result = dl.download_file(server_url, dst, hash_name="md5", on_progress=lambda n, t: progress.append((n, t)))
+    assert result.err == ""
+    assert result.size == len(_DATA)
+    assert result.hexdigest == hashlib.md5(_DATA).hexdigest()
+    assert dst.read_bytes() == _DATA
+    assert not (tmp_path / "embedded_py.zip.part").exists()
+    assert progress[-1] == (len(_DATA), len(_DATA))
+    assert len(progress) > 1
+
+
+@pytest.mark.parametrize("accept_ranges", [True, False])
+def test_resume(
+    tmp_path: Path, server_url: str, mocker: MockerFixture, accept_ranges: bool, new_singleton: Callable[..., Any]
+) -> None:
+    _Handler.drop_count = 1
+    _Handler.accept_ranges = accept_ranges
+    dl = _get_download(new_singleton, mocker)
+    dst = tmp_path / "get-pip.py"
+    result = dl.download_file(server_url, dst)
+    assert result.err == ""
+    assert result.hexdigest == hashlib.sha256(_DATA).hexdigest()
+    assert dst.read_bytes() == _DATA
+    assert len(_Handler.requests) == 2
+    assert _Handler.requests[1] == f"bytes={len(_DATA) // 2}-"
+
+
+def test_retries_exhausted(
+    tmp_path: Path, server_url: str, mocker: MockerFixture, new_singleton: Callable[..., Any]
+) -> None:
+    _Handler.drop_count = 10
+    dl = _get_download(new_singleton, mocker)
+    dst = tmp_path / "pip-wheel.whl"
+    result = dl.download_file(server_url, dst, retries=2)
+    assert result.err
+    assert len(_Handler.requests) == 3
+    assert not dst.exists()
+    assert not (tmp_path / "pip-wheel.whl.part").exists()
+
+
+def test_connection_refused(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    dl = _get_download(new_singleton, mocker)
+    result = dl.download_file("http://127.0.0.1:1/missing.zip", tmp_path / "missing.zip", retries=0)
+    assert result.err
+    assert not (tmp_path / "missing.zip").exists()
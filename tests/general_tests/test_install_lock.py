@@ -0,0 +1,98 @@
+from __future__ import annotations
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.install_lock import InstallLock
+
+
+def test_non_blocking(tmp_path: Path) -> None:
+    lock_file = tmp_path / "ooopip_install.lock"
+    first = InstallLock(lock_file)
+    second = InstallLock(lock_file)
+    assert first.acquire(blocking=False)
+    assert first.is_locked
+    assert second.acquire(blocking=False) is False
+    assert not second.is_locked
+    first.release()
+    assert second.acquire(blocking=False)
+    second.release()
+    with pytest.raises(RuntimeError), first:
+        first.acquire()
+
+
+def test_timeout(tmp_path: Path) -> None:
+    lock_file = tmp_path / "ooopip_install.lock"
+    holder = InstallLock(lock_file)
+    holder.acquire()
+    waiter = InstallLock(lock_file)
+    start = time.perf_counter()
+    assert waiter.acquire(timeout=0.2) is False
+    assert time.perf_counter() - start >= 0.2
+    assert waiter.waited
+    assert not waiter.is_locked
+
+    threading.Timer(0.1, holder.release).start()
+    assert waiter.acquire(timeout=5)
+    assert waiter.wait_time < 1
+    waiter.release()
+
+
+def test_waiter_wakes_on_release(tmp_path: Path) -> None:
+    lock_file = tmp_path / "ooopip_install.lock"
+    order: List[str] = []
+    holder = InstallLock(lock_file)
+    holder.acquire()
+    waiter = InstallLock(lock_file)
+
+    def wait() -> None:
+        with waiter:
+            order.append("waiter")
+
+    thread = threading.Thread(target=wait)
+    thread.start()
+    time.sleep(0.2)
+    order.append("holder")
+    release_time = time.perf_counter()
+    holder.release()
+    thread.join(5)
+    assert order == ["holder", "waiter"]
+    assert waiter.waited
+    assert waiter.wait_time >= 0.15
+    # woken by the release, not by polling
+    assert time.perf_counter() - release_time < 0.1
+
+
+def test_other_process(tmp_path: Path) -> None:
+    lock_file = tmp_path / "ooopip_install.lock"
+    code = (
+        "import sys, time\n"
+        "from oxt.___lo_pip___.install.install_lock import InstallLock\n"
+        "lock = InstallLock(sys.argv[1])\n"
+        "lock.acquire()\n"
+        "print('locked', flush=True)\n"
+        "time.sleep(0.5)\n"
+        "lock.release()\n"
+    )
+    proc = subprocess.Popen(
+        [sys.executable, "-c", code, str(lock_file)],
+        stdout=subprocess.PIPE,
+        text=True,
+        cwd=str(Path(__file__).parents[2]),
+    )
+    try:
+        assert proc.stdout is not None
+        assert proc.stdout.readline().strip() == "locked"
+        lock = InstallLock(lock_file)
+        assert lock.acquire(blocking=False) is False
+        with lock:
+            assert lock.waited
+    finally:
+        proc.wait(5)
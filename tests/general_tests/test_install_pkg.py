@@ -0,0 +1,197 @@
+from __future__ import annotations
+import subprocess
+import types
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _get_installer(mocker: MockerFixture, *methods: str) -> Any:  # noqa: ANN401
+    """Gets a mock installer that runs the named ``InstallPkg`` methods and records the pip commands."""
+    from oxt.___lo_pip___.install.pkg_installers.install_pkg import InstallPkg
+
+    inst = mocker.MagicMock()
+    inst.commands = []
+
+    def run_pip(cmd: List[str]) -> subprocess.CompletedProcess:
+        inst.commands.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr="")
+
+    inst._run_pip.side_effect = run_pip
+    inst._cmd_pip.side_effect = lambda *args: ["python", "-m", "pip", *args]
+    for name in methods:
+        setattr(inst, name, types.MethodType(getattr(InstallPkg, name), inst))
+    return inst
+
+
+def _get_cache_installer(mocker: MockerFixture, root: Path) -> Any:  # noqa: ANN401
+    from oxt.___lo_pip___.install.wheel_cache.wheel_cache import WheelCache
+    from packaging.tags import Tag
+
+    inst = _get_installer(mocker, "_run_install", "_get_wheel_cache_misses", "_fill_wheel_cache")
+    inst.wheel_cache = WheelCache(root, 1024 * 1024, supported_tags=[Tag("py3", "none", "any")])
+    inst.is_internet = True
+    return inst
+
+
+def test_run_install_cache_hit(tmp_path: Path, mocker: MockerFixture) -> None:
+    inst = _get_cache_installer(mocker, tmp_path)
+    (tmp_path / "verr-1.1.2-py3-none-any.whl").write_bytes(b"x")
+
+    cmd = ["python", "-m", "pip", "install", "verr>=1.1.2"]
+    assert inst._run_install(cmd, ["verr>=1.1.2"]).returncode == 0
+    assert inst.commands == [[*cmd, "--no-index"]]
+
+
+def test_run_install_cache_miss(tmp_path: Path, mocker: MockerFixture) -> None:
+    inst = _get_cache_installer(mocker, tmp_path)
+    # a wheel for another interpreter is not a hit
+    (tmp_path / "verr-1.1.2-cp311-cp311-win_amd64.whl").write_bytes(b"x")
+
+    cmd = ["python", "-m", "pip", "install", "verr>=1.1.2"]
+    assert inst._run_install(cmd, ["verr>=1.1.2"]).returncode == 0
+    # the install runs once from the index, the cache is filled after it
+    assert inst.commands[0] == cmd
+    assert len(inst.commands) == 2
+    assert inst.commands[1][3] == "download"
+    assert "--no-index" not in inst.commands[1]
+
+
+def test_run_install_cache_miss_failed(tmp_path: Path, mocker: MockerFixture) -> None:
+    inst = _get_cache_installer(mocker, tmp_path)
+    inst._run_pip.side_effect = lambda cmd: inst.commands.append(cmd) or subprocess.CompletedProcess(cmd, 1, "", "")
+
+    cmd = ["python", "-m", "pip", "install", "verr>=1.1.2"]
+    assert inst._run_install(cmd, ["verr>=1.1.2"]).returncode == 1
+    assert inst.commands == [cmd]
+
+
+def _get_batch_installer(mocker: MockerFixture, targets: Dict[str, str]) -> Any:  # noqa: ANN401
+    mocker.patch("oxt.___lo_pip___.install.pkg_installers.install_pkg.Tracer")
+    inst = _get_installer(
+        mocker, "_install_pkgs", "_install_batch", "_run_install", "_get_target_args", "_get_site_packages_dir"
+    )
+    inst.wheel_cache = None
+    inst.flag_upgrade = False
+    inst.no_pip_install = set()
+    inst.no_pip_remove = set()
+    inst.config.auto_install_in_site_packages = True
+    inst.config.site_packages = "site-packages"
+    inst._target_path.get_package_target.side_effect = targets.__getitem__
+    inst._get_installed_dists.return_value = {}
+    inst._get_dist_owners.side_effect = lambda pth, pkgs, dists: {pkg: {"pkg": pkg} for pkg in pkgs}
+    inst._install_pkg.return_value = True
+    return inst
+
+
+def test_install_pkgs_one_pip_call_per_target(mocker: MockerFixture) -> None:
+    inst = _get_batch_installer(mocker, {"verr": "/lo/site", "ooo-dev-tools": "/lo/site", "numpy": "/lo/other"})
+
+    assert inst._install_pkgs({"verr": ">=1.1.2", "ooo-dev-tools": "", "numpy": "==2.1.0"}, False) is True
+    # verr and ooo-dev-tools share a target and are installed by one pip call
+    assert inst.commands == [["python", "-m", "pip", "install", "--target=/lo/site", "verr>=1.1.2", "ooo-dev-tools"]]
+    assert [c.kwargs["pkg"] for c in inst._save_tracking.call_args_list] == ["verr", "ooo-dev-tools"]
+    assert {c.kwargs["pth"] for c in inst._save_tracking.call_args_list} == {"/lo/site"}
+    # numpy is alone in its target
+    inst._install_pkg.assert_called_once_with("numpy", "==2.1.0", False)
+
+
+def test_install_pkgs_fallback_tries_every_package(mocker: MockerFixture) -> None:
+    inst = _get_batch_installer(mocker, {"verr": "/lo/site", "spam": "/lo/site", "eggs": "/lo/site"})
+    inst._run_pip.side_effect = lambda cmd: inst.commands.append(cmd) or subprocess.CompletedProcess(cmd, 1, "", "")
+    inst._install_pkg.side_effect = lambda pkg, ver, force: pkg != "verr"
+
+    assert inst._install_pkgs({"verr": "", "spam": "", "eggs": ">=1.0"}, True) is False
+    assert len(inst.commands) == 1
+    assert "--force-reinstall" in inst.commands[0]
+    # the first package failed, the rest are still installed
+    assert [c.args for c in inst._install_pkg.call_args_list] == [
+        ("verr", "", True),
+        ("spam", "", True),
+        ("eggs", ">=1.0", True),
+    ]
+    inst._save_tracking.assert_not_called()
+
+
+def test_get_target_args(mocker: MockerFixture) -> None:
+    inst = _get_batch_installer(mocker, {"verr": "/lo/site"})
+    assert inst._get_target_args("verr") == ["--target=/lo/site"]
+
+    inst.config.auto_install_in_site_packages = False
+    inst.config.is_win = False
+    inst.config.is_user_installed = True
+    assert inst._get_target_args("verr") == ["--user"]
+
+    inst.config.is_user_installed = False
+    assert inst._get_target_args("verr") == []
+
+    # isolated packages on Windows get a target without auto_install_in_site_packages
+    inst.config.is_win = True
+    inst.config.isolate_windows = ["verr"]
+    assert inst._get_target_args("verr") == ["--target=/lo/site"]
+
+
+def _make_dist(site: Path, dist_info: str, name: str, version: str, files: List[str]) -> None:
+    info = site / dist_info
+    info.mkdir(parents=True)
+    (info / "METADATA").write_text(f"Metadata-Version: 2.1\nName: {name}\nVersion: {version}\n")
+    records = [*files, f"{dist_info}/METADATA", f"{dist_info}/RECORD"]
+    (info / "RECORD").write_text("".join(f"{rec},,\n" for rec in records))
+    for rec in files:
+        pth = (site / rec).resolve()
+        if site.resolve() in pth.parents:
+            pth.parent.mkdir(parents=True, exist_ok=True)
+            pth.write_text("")
+
+
+def test_get_installed_dists_and_record_entries(tmp_path: Path, mocker: MockerFixture) -> None:
+    inst = _get_installer(mocker, "_get_installed_dists", "_get_record_entries", "_new_entries", "_merge_entries")
+    inst.config.pip_shared_dirs = ["bin"]
+    site = tmp_path / "site"
+    _make_dist(
+        site,
+        "verr-1.1.2.dist-info",
+        "verr",
+        "1.1.2",
+        [
+            "verr/__init__.py",
+            "verr/__pycache__/__init__.cpython-311.pyc",
+            "verr/ver.py",
+            "single_mod.py",
+            "__pycache__/single_mod.cpython-311.pyc",
+            # --target records scripts relative to the lib folder of the temp prefix
+            "../../bin/verr-cli",
+            "../../share/ignored.txt",
+            "bin/verr-tool",
+            "nsonly/mod.py",
+            "google/verr_ext/__init__.py",
+        ],
+    )
+    # a namespace dir that also holds another distribution is not tracked
+    (site / "google" / "protobuf").mkdir(parents=True)
+    # dist-info name that is not in the normalized form
+    _make_dist(site, "Typing_Extensions-4.12.2.dist-info", "typing_extensions", "4.12.2", ["typing_extensions.py"])
+
+    output = (
+        "Using cached verr-1.1.2-py3-none-any.whl\n"
+        "Successfully installed Typing-Extensions-4.12.2 verr-1.1.2 gone-0.1\n"
+    )
+    dists = inst._get_installed_dists(str(site), output)
+    # gone has no dist-info and is skipped
+    assert list(dists) == ["typing-extensions", "verr"]
+    assert inst._get_installed_dists(str(site), "Requirement already satisfied: verr") == {}
+
+    entries = inst._get_record_entries(str(site), dists["verr"])
+    assert entries["dirs"] == {"verr", "verr-1.1.2.dist-info", "nsonly"}
+    assert entries["files"] == {"single_mod.py"}
+    assert entries["shared"] == {"bin": {"verr-cli", "verr-tool"}}
+
+    entries = inst._get_record_entries(str(site), dists["typing-extensions"])
+    assert entries["dirs"] == {"Typing_Extensions-4.12.2.dist-info"}
+    assert entries["files"] == {"typing_extensions.py"}
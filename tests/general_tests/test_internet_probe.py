@@ -0,0 +1,80 @@
+from __future__ import annotations
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.internet_probe import InternetProbe
+    from pytest_mock import MockerFixture
+
+
+def _get_probe(
+    new_singleton: Callable[..., Any], tmp_path: Path, mocker: MockerFixture, hosts: List[str], ttl: int = 300
+) -> InternetProbe:
+    from oxt.___lo_pip___.install.internet_probe import InternetProbe
+
+    mod = "oxt.___lo_pip___.install.internet_probe"
+    mock_config = mocker.patch(f"{mod}.Config")
+    mock_config.return_value.lo_implementation_name = "my_ext"
+    mock_config.return_value.test_internet_url = ""
+    mock_config.return_value.internet_probe_hosts = hosts
+    mock_config.return_value.internet_probe_ttl = ttl
+    mocker.patch(f"{mod}.OxtLogger")
+    mocker.patch(f"{mod}.file_util.get_user_profile_path", return_value=str(tmp_path))
+
+    return new_singleton(InternetProbe)
+
+
+def test_first_success_wins(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    probe = _get_probe(new_singleton, tmp_path, mocker, ["slow.example", "fast.example"])
+
+    def check_host(host: str) -> bool:
+        if host == "slow.example":
+            time.sleep(2.0)
+            return False
+        return True
+
+    mocker.patch.object(probe, "_check_host", side_effect=check_host)
+    start = time.perf_counter()
+    assert probe.wait() is True
+    assert time.perf_counter() - start < 1.5
+
+    data = json.loads(probe.cache_file.read_text())
+    assert data["online"] is True
+
+
+def test_all_fail(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    probe = _get_probe(new_singleton, tmp_path, mocker, ["a.example", "b.example"])
+    mocker.patch.object(probe, "_check_host", return_value=False)
+    assert probe.wait() is False
+
+
+def test_cached_result(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    (tmp_path / "my_ext_internet.json").write_text(json.dumps({"online": True, "time": time.time()}))
+    probe = _get_probe(new_singleton, tmp_path, mocker, ["a.example"])
+    check = mocker.patch.object(probe, "_check_host", return_value=False)
+    assert probe.wait() is True
+    check.assert_not_called()
+
+    # expired result is checked again
+    probe.invalidate()
+    (tmp_path / "my_ext_internet.json").write_text(json.dumps({"online": True, "time": time.time() - 301}))
+    assert probe.wait() is False
+    check.assert_called_once_with("a.example")
+
+
+def test_no_ttl(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    probe = _get_probe(new_singleton, tmp_path, mocker, ["a.example"], ttl=0)
+    mocker.patch.object(probe, "_check_host", return_value=True)
+    assert probe.wait() is True
+    assert not probe.cache_file.exists()
+
+
+def test_no_hosts(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    probe = _get_probe(new_singleton, tmp_path, mocker, [])
+    assert probe.wait() is False
@@ -0,0 +1,70 @@
+from __future__ import annotations
+import logging
+import threading
+from pathlib import Path
+from typing import Iterator
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+
+@pytest.fixture
+def log_queue() -> Iterator[type]:
+    from oxt.___lo_pip___.oxt_logger.log_queue import LogQueue
+
+    yield LogQueue
+    LogQueue.stop_all()
+    LogQueue._instances.clear()
+
+
+def _get_logger(log_queue: type, name: str, log_file: Path) -> logging.Logger:
+    def factory() -> logging.Handler:
+        handler = logging.FileHandler(log_file, encoding="utf8", delay=True)
+        handler.setFormatter(logging.Formatter("%(name)s - %(message)s"))
+        return handler
+
+    logger = logging.Logger(name, level=logging.DEBUG)
+    logger.addHandler(log_queue.get_handler(str(log_file), factory))
+    return logger
+
+
+def test_shared_handler(tmp_path: Path, log_queue: type) -> None:
+    log_file = tmp_path / "pip_install.log"
+    first = _get_logger(log_queue, "first", log_file)
+    second = _get_logger(log_queue, "second", log_file)
+    assert first.handlers[0] is second.handlers[0]
+    assert len(log_queue._instances) == 1
+
+    first.debug("one")
+    second.info("two")
+    try:
+        raise ValueError("oops")
+    except ValueError:
+        first.error("three", exc_info=True)
+    log_queue.stop_all()
+
+    lines = log_file.read_text().splitlines()
+    assert lines[:3] == ["first - one", "second - two", "first - three"]
+    assert "ValueError: oops" in lines[-1]
+
+
+def test_log_after_stop(tmp_path: Path, log_queue: type) -> None:
+    log_file = tmp_path / "pip_install.log"
+    logger = _get_logger(log_queue, "first", log_file)
+    logger.debug("before")
+    log_queue.stop_all()
+    # listener is started again by the next record
+    logger.debug("after")
+    log_queue.stop_all()
+    assert log_file.read_text().splitlines() == ["first - before", "first - after"]
+
+
+def test_no_thread_leak(tmp_path: Path, log_queue: type) -> None:
+    log_file = tmp_path / "pip_install.log"
+    count = threading.active_count()
+    for i in range(10):
+        _get_logger(log_queue, f"logger{i}", log_file).debug("run %i", i)
+        log_queue.stop_all()
+    assert threading.active_count() == count
+    assert len(log_file.read_text().splitlines()) == 10
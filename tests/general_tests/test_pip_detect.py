@@ -0,0 +1,60 @@
+from __future__ import annotations
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.pip_detect import PipDetect
+    from pytest_mock import MockerFixture
+
+
+def _get_detect(new_singleton: Callable[..., Any], mocker: MockerFixture) -> PipDetect:
+    from oxt.___lo_pip___.install.pip_detect import PipDetect
+
+    mocker.patch("oxt.___lo_pip___.install.pip_detect.OxtLogger")
+    return new_singleton(PipDetect)
+
+
+def _make_pip(site_dir: Path) -> Path:
+    (site_dir / "pip").mkdir(parents=True)
+    (site_dir / "pip" / "__init__.py").write_text("__version__ = '24.0'\n")
+    dist_info = site_dir / "pip-24.0.dist-info"
+    dist_info.mkdir()
+    (dist_info / "METADATA").write_text("Name: pip\nVersion: 24.0\n")
+    return dist_info
+
+
+def test_found_on_pythonpath(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    detect = _get_detect(new_singleton, mocker)
+    site_dir = tmp_path / "site-packages"
+    dist_info = _make_pip(site_dir)
+    env = {"PYTHONPATH": os.pathsep.join([str(tmp_path / "empty"), str(site_dir)])}
+    fallback = mocker.Mock(return_value=False)
+
+    assert detect.is_installed(sys.executable, env, fallback) is True
+    # cached, PYTHONPATH is not searched again
+    find_pip = mocker.patch.object(detect, "find_pip", return_value="")
+    assert detect.is_installed(sys.executable, env, fallback) is True
+    find_pip.assert_not_called()
+    fallback.assert_not_called()
+
+    # pip changed, the cache is not used
+    os.utime(dist_info, ns=(0, 0))
+    assert detect.is_installed(sys.executable, env, fallback) is False
+    find_pip.assert_called_once()
+    fallback.assert_called_once()
+
+
+def test_not_found_uses_fallback(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    detect = _get_detect(new_singleton, mocker)
+    env = {"PYTHONPATH": str(tmp_path)}
+    fallback = mocker.Mock(return_value=True)
+    assert detect.is_installed(sys.executable, env, fallback) is True
+    assert detect.is_installed(sys.executable, env, fallback) is True
+    # only results found on PYTHONPATH are cached
+    assert fallback.call_count == 2
@@ -0,0 +1,116 @@
+from __future__ import annotations
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.pip_worker.pip_worker import PipWorker
+    from pytest_mock import MockerFixture
+
+_WORKER = Path(__file__).parents[2] / "oxt" / "___lo_pip___" / "install" / "pip_worker" / "worker.py"
+
+
+@pytest.fixture
+def worker() -> Iterator[subprocess.Popen]:
+    proc = subprocess.Popen(
+        [sys.executable, "-u", str(_WORKER)],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    yield proc
+    if proc.poll() is None:
+        proc.kill()
+    proc.wait()
+    for stream in (proc.stdin, proc.stdout):
+        if stream is not None:
+            stream.close()
+
+
+def _request(proc: subprocess.Popen, request: Dict[str, Any]) -> Dict[str, Any]:
+    assert proc.stdin is not None and proc.stdout is not None
+    proc.stdin.write(json.dumps(request) + "\n")
+    proc.stdin.flush()
+    return json.loads(proc.stdout.readline())
+
+
+def test_worker_protocol(worker: subprocess.Popen) -> None:
+    response = _request(worker, {"id": 1, "op": "version"})
+    assert response["id"] == 1
+    assert response["returncode"] == 0
+    assert response["stdout"].startswith("pip ")
+
+    # the same process runs several pip commands
+    for i in range(2, 4):
+        response = _request(worker, {"id": i, "op": "pip", "args": ["list", "--format=json"]})
+        assert response["id"] == i
+        assert response["returncode"] == 0
+        names = {item["name"].lower() for item in json.loads(response["stdout"])}
+        assert "pip" in names
+
+    response = _request(worker, {"id": 4, "op": "pip", "args": ["show", "not-a-real-package-xyz"]})
+    assert response["returncode"] != 0
+
+    response = _request(worker, {"id": 5, "op": "spam"})
+    assert response["returncode"] == 1
+    assert "Unknown op" in response["stderr"]
+
+    assert worker.stdin is not None
+    worker.stdin.write(json.dumps({"op": "exit"}) + "\n")
+    worker.stdin.flush()
+    assert worker.wait(10) == 0
+
+
+def _get_pip_worker(new_singleton: Callable[..., Any], mocker: MockerFixture) -> PipWorker:
+    from oxt.___lo_pip___.install.pip_worker.pip_worker import PipWorker
+
+    mod = "oxt.___lo_pip___.install.pip_worker.pip_worker"
+    mocker.patch(f"{mod}.Config").return_value.pip_worker = True
+    mocker.patch(f"{mod}.OxtLogger")
+    mocker.patch(f"{mod}.atexit")
+
+    return new_singleton(PipWorker)
+
+
+def test_client(mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    pw = _get_pip_worker(new_singleton, mocker)
+    env = dict(os.environ)
+    try:
+        assert pw.enabled
+        assert pw.is_pip_installed(sys.executable, env) is True
+        result = pw.run(sys.executable, ["list", "--format=json"], env)
+        assert result is not None
+        assert result.returncode == 0
+        assert pw.is_running
+        # commands that change pip are not run by the worker
+        assert pw.run(sys.executable, ["install", "--upgrade", "pip"], env) is None
+        assert pw.can_run(["install", "pip-tools", "pipx"])
+    finally:
+        pw.stop()
+    assert not pw.is_running
+
+
+def test_client_fallback(mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    pw = _get_pip_worker(new_singleton, mocker)
+    # a python that does not exist can not start the worker
+    assert pw.run("/no/such/python", ["list"], dict(os.environ)) is None
+    assert not pw.is_running
+
+
+def test_client_timeout(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    pw = _get_pip_worker(new_singleton, mocker)
+    script = tmp_path / "wedged.py"
+    script.write_text("import time\ntime.sleep(60)\n")
+    pw._script = script
+    pw._timeout = 0.5
+    # a worker that does not answer is stopped and the command falls back to a new process
+    assert pw.run(sys.executable, ["list"], dict(os.environ)) is None
+    assert not pw.is_running
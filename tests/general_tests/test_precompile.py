@@ -0,0 +1,131 @@
+from __future__ import annotations
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.pkg_installers.pkg_install_data import PkgInstallData
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.post.precompile import Precompile
+    from pytest_mock import MockerFixture
+
+_MOD = "oxt.___lo_pip___.install.post.precompile"
+
+
+def _get_precompile(mocker: MockerFixture) -> Precompile:
+    from oxt.___lo_pip___.install.post.precompile import Precompile
+
+    mocker.patch(f"{_MOD}.Config").return_value.python_path = Path(sys.executable)
+    mocker.patch(f"{_MOD}.OxtLogger")
+    return Precompile()
+
+
+def _make_pkg(root: Path, name: str, modules: int = 2, funcs: int = 1) -> Path:
+    pkg = root / name
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("")
+    body = "".join(f"def func_{i}(a, b):\n    return [a * i + b for i in range({i})]\n\n\n" for i in range(funcs))
+    for i in range(modules):
+        (pkg / f"mod_{i}.py").write_text(body)
+    return pkg
+
+
+def _pyc_count(root: Path) -> int:
+    return len(list(root.rglob("__pycache__/*.pyc")))
+
+
+def test_get_tracked_paths(tmp_path: Path, mocker: MockerFixture) -> None:
+    pc = _get_precompile(mocker)
+    _make_pkg(tmp_path, "pkg_a")
+    (tmp_path / "single.py").write_text("")
+    (tmp_path / "native.so").write_bytes(b"")
+    record = PkgInstallData(
+        package="pkg_a",
+        target=str(tmp_path),
+        data={"new_dirs": ["pkg_a", "pkg_a-1.0.dist-info"], "new_files": ["single.py", "native.so"]},
+    )
+    untracked = PkgInstallData(package="old", data={"new_dirs": ["old"]})
+    index = mocker.patch(f"{_MOD}.TrackingIndex").return_value
+    index.get_packages.return_value = [record, untracked]
+
+    paths = pc.get_tracked_paths(123.0)
+    index.get_packages.assert_called_once_with(since=123.0)
+    # dist-info does not exist, .so is not python, a record without a target is skipped.
+    assert sorted(p.name for p in paths) == ["pkg_a", "single.py"]
+
+
+def test_compile(tmp_path: Path, mocker: MockerFixture) -> None:
+    pc = _get_precompile(mocker)
+    pkg = _make_pkg(tmp_path, "pkg_a", modules=3)
+    single = tmp_path / "single.py"
+    single.write_text("X = 1\n")
+
+    assert pc.compile([]) is True
+    assert pc.compile([pkg, single]) is True
+    assert _pyc_count(pkg) == 4
+    assert _pyc_count(tmp_path) == 5
+
+    (pkg / "bad.py").write_text("def (:\n")
+    assert pc.compile([pkg]) is False
+
+
+def test_start_background(tmp_path: Path, mocker: MockerFixture) -> None:
+    pc = _get_precompile(mocker)
+    pkg = _make_pkg(tmp_path, "pkg_a")
+    mocker.patch.object(pc, "get_tracked_paths", return_value=[])
+    assert pc.start(1.0) is None
+
+    mocker.patch.object(pc, "get_tracked_paths", return_value=[pkg])
+    thread = pc.start(1.0)
+    assert thread is not None
+    assert thread.daemon
+    thread.join(60)
+    assert not pc.is_running
+    assert _pyc_count(pkg) == 3
+    pc.stop()
+
+
+def _time_import(root: Path, name: str, modules: int) -> float:
+    code = (
+        "import importlib, time\n"
+        "start = time.perf_counter()\n"
+        f"for i in range({modules}):\n"
+        f"    importlib.import_module(f'{name}.mod_{{i}}')\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(root)
+    # -B, the import that compiles does not write the cache so each run is a first import
+    result = subprocess.run(
+        [sys.executable, "-B", "-c", code], env=env, capture_output=True, text=True, check=True, timeout=120
+    )
+    return float(result.stdout)
+
+
+@pytest.mark.benchmark
+def test_import_benchmark(
+    tmp_path: Path, mocker: MockerFixture, record_property: Callable[[str, object], None]
+) -> None:
+    pc = _get_precompile(mocker)
+    modules = 60
+    cold = _make_pkg(tmp_path / "cold", "bench_pkg", modules=modules, funcs=40)
+    warm = _make_pkg(tmp_path / "warm", "bench_pkg", modules=modules, funcs=40)
+
+    start = time.perf_counter()
+    assert pc.compile([warm]) is True
+    compile_time = time.perf_counter() - start
+    assert _pyc_count(cold) == 0
+
+    cold_time = min(_time_import(cold.parent, "bench_pkg", modules) for _ in range(3))
+    warm_time = min(_time_import(warm.parent, "bench_pkg", modules) for _ in range(3))
+    record_property("compile_at_import_seconds", cold_time)
+    record_property("precompiled_seconds", warm_time)
+    record_property("background_compile_seconds", compile_time)
+    assert warm_time < cold_time
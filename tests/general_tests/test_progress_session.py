@@ -0,0 +1,117 @@
+from __future__ import annotations
+import os
+import sys
+import threading
+import time
+import types
+from typing import TYPE_CHECKING, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_session_one_window(mocker: MockerFixture) -> None:
+    from oxt.___lo_pip___.install.progress import ProgressSession
+
+    mod = "oxt.___lo_pip___.install.progress"
+    progress_cls = mocker.patch(f"{mod}.Progress")
+    mocker.patch(f"{mod}.OxtLogger")
+    progress = progress_cls.return_value
+
+    with ProgressSession(title="Test") as session:
+        assert not session.is_active
+        session.line("ignored before the first step")
+        session.step("Installing: verr")
+        session.line("Collecting verr")
+        session.step("Installing: ooo-dev-tools")
+        session.line("  ")
+        assert session.is_active
+
+    progress_cls.assert_called_once_with(start_msg="Installing: verr", title="Test")
+    progress.start.assert_called_once()
+    assert [c.args[0] for c in progress.update.call_args_list] == [
+        "Installing: verr\nCollecting verr",
+        "Installing: ooo-dev-tools",
+    ]
+    progress.kill.assert_called_once()
+    assert not session.is_active
+
+
+def test_stream_pip() -> None:
+    from oxt.___lo_pip___.install.pkg_installers.install_pkg import InstallPkg, _PIP_ERR_LINES
+
+    code = (
+        "import sys\n"
+        "for i in range(5000): print(f'Collecting pkg{i}')\n"
+        "print('Using cached verr-1.1.2-py3-none-any.whl')\n"
+        "for i in range(1000): print(f'warning {i}', file=sys.stderr)\n"
+        "print('Successfully installed verr-1.1.2')\n"
+        "sys.exit(3)\n"
+    )
+    lines: List[str] = []
+    fake = types.SimpleNamespace(_get_env=lambda: dict(os.environ), _on_pip_line=lines.append)
+    process = InstallPkg._stream_pip(fake, [sys.executable, "-c", code])  # type: ignore[arg-type]
+
+    assert process.returncode == 3
+    # every line is streamed, only the lines used after the install are kept
+    assert len(lines) == 5002
+    assert lines[0] == "Collecting pkg0\n"
+    assert process.stdout == "Using cached verr-1.1.2-py3-none-any.whl\nSuccessfully installed verr-1.1.2\n"
+    err = process.stderr.splitlines()
+    assert len(err) == _PIP_ERR_LINES
+    assert err[-1] == "warning 999"
+
+
+def test_progress_update_optional(mocker: MockerFixture) -> None:
+    from oxt.___lo_pip___.install.progress import Progress
+
+    mod = "oxt.___lo_pip___.install.progress"
+    mocker.patch(f"{mod}.Config")
+    logger = mocker.patch(f"{mod}.OxtLogger").return_value
+    rules = mocker.patch(f"{mod}.ProgressRules").return_value
+
+    # a progress object of a rule written before update() was added
+    rules.get_progress.return_value = types.SimpleNamespace(start=lambda msg, title: None, stop=lambda: None)
+    progress = Progress(start_msg="Installing: verr")
+    progress.start()
+    progress.update("Collecting verr")
+    progress.kill()
+
+    failing = mocker.Mock()
+    failing.update.side_effect = RuntimeError("window closed")
+    rules.get_progress.return_value = failing
+    progress = Progress(start_msg="Installing: verr")
+    progress.update("Collecting verr")
+    progress.update("Installing verr")
+    failing.update.assert_called_once_with("Collecting verr")
+    logger.error.assert_called_once()
+
+
+def test_progress_dialog_throttles_redraws(mocker: MockerFixture) -> None:
+    from oxt.___lo_pip___.install.progress_window.progress_dialog import ProgressDialog
+
+    mod = "oxt.___lo_pip___.install.progress_window.progress_dialog"
+    mocker.patch(f"{mod}.uno")
+    mocker.patch(f"{mod}.StartupMonitor")
+    in_progress = mocker.patch(f"{mod}.InfiniteProgressDialog").return_value
+    disposed = threading.Event()
+    in_progress.dialog.dispose.side_effect = disposed.set
+
+    dialog = ProgressDialog()
+    dialog.start("Installing: verr")
+    start = time.monotonic()
+    while time.monotonic() - start < 0.5:
+        dialog.update("Installing: verr\nCollecting verr")
+        time.sleep(0.001)
+    dialog.stop()
+    assert disposed.wait(5)
+
+    msgs = [c.args[0] for c in in_progress.update.call_args_list]
+    # one redraw per pip line would be hundreds, about 10 a second are drawn
+    assert 2 <= len(msgs) <= 8
+    # the ellipsis only grows when a second passes without a change
+    assert all(msg.startswith("Installing: verr .\n") for msg in msgs[1:])
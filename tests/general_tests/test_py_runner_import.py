@@ -0,0 +1,145 @@
+from __future__ import annotations
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+_OXT = Path(__file__).parents[2] / "oxt"
+
+# cumulative import time of py_runner, in micro seconds, with stub uno modules.
+# Importing py_runner takes about 15 ms, the budget leaves room for slow machines.
+_IMPORT_BUDGET_US = 150_000
+
+# only these ___lo_pip___ modules are needed to register the implementations.
+_ALLOWED_MODULES = {
+    "___lo_pip___",
+    "___lo_pip___.basic_config",
+    "___lo_pip___.dialog",
+    "___lo_pip___.dialog.handler",
+    "___lo_pip___.dialog.handler.handler_names",
+    "___lo_pip___.meta",
+    "___lo_pip___.meta.lazy_factory",
+}
+
+_STUB_UNO = """
+def getComponentContext():
+    raise RuntimeError("no office")
+
+
+def fileUrlToSystemPath(url):
+    return url
+"""
+
+_STUB_UNOHELPER = """
+class Base:
+    pass
+
+
+class ImplementationHelper:
+    def __init__(self):
+        self.entries = []
+
+    def addImplementation(self, ctor, implementation_name, service_names):
+        self.entries.append((ctor, implementation_name, service_names))
+"""
+
+_SCRIPT = """
+import json
+import sys
+from types import SimpleNamespace
+
+# config.json is written by the build, the handler names only need the implementation name.
+from ___lo_pip___.basic_config import BasicConfig
+
+BasicConfig._instance = SimpleNamespace(lo_implementation_name="org.test.lazy")
+
+import py_runner
+
+entries = [
+    [getattr(ctor, "__name__", repr(ctor)), name, list(services)]
+    for ctor, name, services in py_runner.g_ImplementationHelper.entries
+]
+print(json.dumps({"modules": sorted(sys.modules), "entries": entries}))
+"""
+
+
+def _write_stubs(root: Path) -> None:
+    (root / "uno.py").write_text(_STUB_UNO)
+    (root / "unohelper.py").write_text(_STUB_UNOHELPER)
+    pkg = root
+    for name in ("com", "sun", "star", "task"):
+        pkg = pkg / name
+        pkg.mkdir()
+        (pkg / "__init__.py").write_text("")
+    (pkg / "__init__.py").write_text("class XJob:\n    pass\n")
+
+
+def _get_cumulative(stderr: str, module: str) -> int:
+    # import time: self [us] | cumulative | imported package
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1])
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def _import_py_runner(tmp_path: Path) -> subprocess.CompletedProcess:
+    _write_stubs(tmp_path)
+    env: Dict[str, str] = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(tmp_path), str(_OXT)])
+    env["PYTHONDONTWRITEBYTECODE"] = "1"
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _SCRIPT],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+
+def test_py_runner_import(tmp_path: Path) -> None:
+    result = _import_py_runner(tmp_path)
+    assert result.returncode == 0, result.stderr
+    data = json.loads(result.stdout)
+
+    modules: List[str] = [m for m in data["modules"] if m.split(".")[0] == "___lo_pip___"]
+    assert set(modules) <= _ALLOWED_MODULES
+
+    names = {name: ctor for ctor, name, _ in data["entries"]}
+    assert len(names) == 3
+    assert "org.test.lazy.OptUninstallPage" in names
+    assert "org.test.lazy.LoggingOptionsPage" in names
+    lazy = [ctor for ctor in names.values() if ctor.startswith("LazyFactory(")]
+    assert len(lazy) == 2
+    assert any("dialog.handler.uninstall" in ctor for ctor in lazy)
+    assert any("dialog.handler.logger_options" in ctor for ctor in lazy)
+
+
+@pytest.mark.benchmark
+def test_py_runner_import_time(tmp_path: Path, record_property: Callable[[str, object], None]) -> None:
+    result = _import_py_runner(tmp_path)
+    assert result.returncode == 0, result.stderr
+    cumulative = _get_cumulative(result.stderr, "py_runner")
+    record_property("py_runner_import_us", cumulative)
+    assert cumulative < _IMPORT_BUDGET_US, f"py_runner import took {cumulative} us"
+
+
+def test_lazy_factory() -> None:
+    from oxt.___lo_pip___.meta.lazy_factory import LazyFactory
+
+    factory = LazyFactory("fractions", "Fraction")
+    assert not factory.is_loaded
+    # unohelper calls the factory as ctor(ctx, *args)
+    assert factory(1, 4) == 0.25
+    assert factory.is_loaded
+    from fractions import Fraction
+
+    assert factory.get_class() is Fraction
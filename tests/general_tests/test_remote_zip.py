@@ -0,0 +1,118 @@
+from __future__ import annotations
+import io
+import os
+import re
+import threading
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def _make_zip() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        # large random members so fetching the whole zip is easy to spot
+        zf.writestr("python311.dll", os.urandom(2 * 1024 * 1024))
+        zf.writestr("_bz2.pyd", b"bz2 module " * 5000)
+        zf.writestr("python311.zip", os.urandom(1024 * 1024))
+    return buf.getvalue()
+
+
+_DATA = _make_zip()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    accept_ranges = True
+    sent: List[int] = []
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+    def do_GET(self) -> None:  # noqa: N802
+        size = len(_DATA)
+        rng = self.headers.get("Range", "")
+        match = re.match(r"bytes=(\d*)-(\d*)", rng)
+        if match and _Handler.accept_ranges:
+            first, last = match.groups()
+            if first:
+                start, end = int(first), min(int(last or size - 1), size - 1)
+            else:
+                start, end = max(0, size - int(last)), size - 1
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            start, end = 0, size - 1
+            self.send_response(200)
+        body = _DATA[start : end + 1]
+        _Handler.sent.append(len(body))
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _Handler.accept_ranges = True
+    _Handler.sent = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/python-3.11.7-embed-amd64.zip"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def no_logger(mocker: MockerFixture) -> None:
+    mocker.patch("oxt.___lo_pip___.install.remote_zip.OxtLogger")
+
+
+def test_extract_member(tmp_path: Path, server_url: str) -> None:
+    from oxt.___lo_pip___.install.remote_zip import RemoteZip
+
+    dst = tmp_path / "_bz2.pyd"
+    with RemoteZip(server_url, block_size=16 * 1024) as rz:
+        assert rz.namelist() == ["python311.dll", "_bz2.pyd", "python311.zip"]
+        rz.extract("_bz2.pyd", dst)
+        assert rz.request_count <= 4
+    assert dst.read_bytes() == b"bz2 module " * 5000
+    # only a small part of the zip is sent
+    assert sum(_Handler.sent) < len(_DATA) // 10
+
+
+def test_read_missing_member(server_url: str) -> None:
+    from oxt.___lo_pip___.install.remote_zip import RemoteZip
+
+    with RemoteZip(server_url) as rz, pytest.raises(KeyError):
+        rz.read("missing.pyd")
+
+
+def test_range_not_supported(server_url: str) -> None:
+    from oxt.___lo_pip___.install.remote_zip import RemoteZip, RemoteZipError
+
+    _Handler.accept_ranges = False
+    with pytest.raises(RemoteZipError):
+        RemoteZip(server_url)
+
+
+def test_bz2_extract_verified(tmp_path: Path, server_url: str, mocker: MockerFixture) -> None:
+    import hashlib
+    from oxt.___lo_pip___.install.bz2_install.bz2_install import BZ2Install
+
+    installer = mocker.Mock()
+    dst = tmp_path / "_bz2.pyd"
+    sha256 = hashlib.sha256(b"bz2 module " * 5000).hexdigest()
+    assert BZ2Install._extract_remote(installer, server_url, dst, sha256) is True
+    assert dst.exists()
+
+    # a member that does not match the pinned hash is not used
+    assert BZ2Install._extract_remote(installer, server_url, dst, "0" * 64) is False
+    assert not dst.exists()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+import json
+from typing import List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.py_packages.requirement_table import (
+    RequirementTable,
+    build_requirement_table,
+    get_release_key,
+    is_python_version_valid,
+)
+from oxt.___lo_pip___.ver.rules.ver_rules import VerRules
+
+_REQUIREMENTS = {"verr": ">=1.1.2", "ooo-dev-tools": "^0.47", "spam": "", "eggs": "~=1.5, <2, !=1.5.2"}
+_PY_PACKAGES = [
+    {"name": "numpy", "version": "1.26", "restriction": "^", "python_versions": [">=3.9"]},
+    {"name": "numpy", "version": "1.24", "restriction": "==", "python_versions": ["<3.9"]},
+    {"name": "pywin32", "version": "306", "platforms": ["win"]},
+    {"name": "odfpy", "version": "1.4", "ignore_platforms": ["flatpak", "snap"]},
+]
+
+
+def _get_table() -> RequirementTable:
+    # round trip through json the same as config.json
+    return RequirementTable(json.loads(json.dumps(build_requirement_table(_REQUIREMENTS, _PY_PACKAGES))))
+
+
+@pytest.mark.parametrize("vstr", ["==*", ">=1.1.2", "^0.47", "~=1.5, <2, !=1.5.2", "^1.26", "==1.24", ">=306"])
+def test_specs_match_rules(vstr: str) -> None:
+    table = _get_table()
+    vr = VerRules()
+    spec = table.get_spec(vstr)
+    assert spec is not None
+    rules = vr.get_matched_rules(vstr)
+    assert table.get_pip_spec(vstr) == ",".join(rule.get_versions_str() for rule in rules)
+    for ver in ["0.1", "0.47.3", "0.48", "1.1.1", "1.1.2", "1.5.2", "1.5.3", "1.24.0", "1.26.4", "2.0", "306", "abc"]:
+        assert spec.is_valid(ver) == vr.get_installed_is_valid(vstr, ver), ver
+
+
+def test_spec_not_in_table() -> None:
+    table = _get_table()
+    assert table.get_spec("<9") is None
+    assert table.get_pip_spec("<9") is None
+    assert not RequirementTable(None)
+    assert RequirementTable(None).get_packages("win") is None
+
+
+@pytest.mark.parametrize(
+    "platform,py_ver,expected",
+    [
+        ("win", "3.11.7", ["numpy", "pywin32", "odfpy"]),
+        ("win", "3.8.10", ["numpy", "pywin32", "odfpy"]),
+        ("linux", "3.11.7", ["numpy", "odfpy"]),
+        ("flatpak", "3.9.0", ["numpy"]),
+        ("snap", "3.8.0", ["numpy"]),
+    ],
+)
+def test_packages_by_platform(platform: str, py_ver: str, expected: List[str]) -> None:
+    table = _get_table()
+    py_key = get_release_key(py_ver)
+    pkgs = [
+        pkg for pkg in table.get_packages(platform) or [] if is_python_version_valid(pkg["python_constraints"], py_key)
+    ]
+    assert [pkg["name"] for pkg in pkgs] == expected
+    numpy = pkgs[0]
+    assert numpy["restriction"] == ("^" if py_key >= (3, 9) else "==")
+
+
+@pytest.mark.parametrize(
+    "ver,expected",
+    [("3.9", (3, 9)), ("3.9.0", (3, 9)), ("3.10.1", (3, 10, 1)), ("3", (3,))],
+)
+def test_get_release_key(ver: str, expected: tuple) -> None:
+    assert get_release_key(ver) == expected
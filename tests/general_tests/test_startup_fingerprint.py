@@ -0,0 +1,53 @@
+from __future__ import annotations
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.startup_fingerprint import StartupFingerprint
+    from pytest_mock import MockerFixture
+
+
+def _get_fingerprint(
+    new_singleton: Callable[..., Any], tmp_path: Path, site_dir: Path, mocker: MockerFixture
+) -> StartupFingerprint:
+    from oxt.___lo_pip___.install.startup_fingerprint import StartupFingerprint
+
+    mod = "oxt.___lo_pip___.install.startup_fingerprint"
+    mock_config = mocker.patch(f"{mod}.Config")
+    mock_config.return_value.lo_implementation_name = "my_ext"
+    mock_config.return_value.requirements = {}
+    mocker.patch(f"{mod}.OxtLogger")
+    mocker.patch(f"{mod}.file_util.get_user_profile_path", return_value=str(tmp_path))
+    mocker.patch(f"{mod}.TargetPath").return_value.get_targets.return_value = [str(site_dir)]
+    mocker.patch(f"{mod}.Packages").return_value.packages = []
+
+    return new_singleton(StartupFingerprint)
+
+
+def test_fingerprint_match(tmp_path: Path, mocker: MockerFixture, new_singleton: Callable[..., Any]) -> None:
+    site_dir = tmp_path / "site-packages"
+    site_dir.mkdir()
+    fp = _get_fingerprint(new_singleton, tmp_path, site_dir, mocker)
+    assert fp.fingerprint_file == tmp_path / "my_ext_startup.json"
+
+    assert fp.is_match() is False
+    fp.save()
+    assert fp.is_match() is True
+
+    # installing into the target directory changes its modification time
+    time.sleep(0.01)
+    (site_dir / "new_pkg").mkdir()
+    os.utime(site_dir, ns=(time.time_ns(), time.time_ns() + 1_000_000))
+    assert fp.is_match() is False
+
+    fp.save()
+    assert fp.is_match() is True
+    fp.invalidate()
+    assert fp.fingerprint_file.exists() is False
+    assert fp.is_match() is False
@@ -0,0 +1,96 @@
+from __future__ import annotations
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from src import file_util
+from src.build import Build
+from src.config import Config
+from src.processing.token import Token
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+_ROOT = Path(__file__).parents[2]
+
+
+def _replace_each(tokens: Dict[str, str], text: str) -> str:
+    """The engine before the single pass, one ``str.replace`` per token."""
+    for token, replacement in tokens.items():
+        text = text.replace(token, str(replacement))
+    return text
+
+
+def _read_tree() -> List[str]:
+    config = Config()
+    files = file_util.find_files_matching_patterns(_ROOT / "oxt", config.token_file_ext, *config.token_files)
+    return [file_util.read_file(file) for file in files]
+
+
+def test_process_matches_replace_each() -> None:
+    token = Token()
+    tokens = token.tokens
+    texts = _read_tree()
+    assert texts
+    for text in texts:
+        assert token.process(text) == _replace_each(tokens, text)
+
+    # a value that holds a token which follows it is expanded in the same pass
+    text = "url: ___update_url_xml___"
+    assert "___" not in token.process(text)
+    assert token.process(text) == _replace_each(tokens, text)
+
+    for text in (
+        "",
+        "no markers",
+        "____lo_pip___",
+        "___lo_pip______lo_pip___",
+        "___lo_pip___version___",
+        "___unknown___ ___lo_pip___",
+        "___lo___pip___",
+    ):
+        assert token.process(text) == _replace_each(tokens, text)
+
+
+def test_process_file_skips_unchanged(tmp_path: Path, mocker: MockerFixture) -> None:
+    token = Token()
+    build = mocker.Mock(process_tokens=token.process)
+    plain = tmp_path / "plain.py"
+    plain.write_text("X = 1\n")
+    marker = tmp_path / "marker.xml"
+    marker.write_text("<name>___lo_pip___</name>\n")
+    crlf = tmp_path / "crlf.txt"
+    crlf.write_bytes(b"a\r\nb\r\n")
+    mtime = plain.stat().st_mtime_ns
+
+    assert Build._process_token_file(build, str(plain)) is False
+    assert plain.stat().st_mtime_ns == mtime
+    assert Build._process_token_file(build, str(marker)) is True
+    assert marker.read_text() == f"<name>{token.get_token_value('lo_pip')}</name>\n"
+    # text mode writes the line endings of the platform, as before
+    assert Build._process_token_file(build, str(crlf)) is (os.linesep != "\r\n")
+
+
+@pytest.mark.benchmark
+def test_benchmark(record_property: Callable[[str, object], None]) -> None:
+    token = Token()
+    tokens = token.tokens
+    texts = _read_tree() * 10
+
+    start = time.perf_counter()
+    for text in texts:
+        _replace_each(tokens, text)
+    each_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for text in texts:
+        token.process(text)
+    single_time = time.perf_counter() - start
+    record_property("replace_each_seconds", each_time)
+    record_property("single_pass_seconds", single_time)
+    assert single_time < each_time
@@ -0,0 +1,93 @@
+from __future__ import annotations
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.debug.trace import Tracer, traced
+
+
+def test_nested_report(tmp_path: Path, new_singleton: Callable[..., Any]) -> None:
+    tracer = new_singleton(Tracer)
+    report_file = Tracer.get_report_file(tmp_path / "pip_install.log")
+    assert report_file == tmp_path / "pip_install_trace.json"
+    tracer.start(report_file)
+
+    with tracer.span("requirements_check") as span:
+        span.set("met", False)
+    with tracer.span("install_packages"):
+        # separate blocks, the pip span is a child of install_pkg
+        with tracer.span("install_pkg", pkg="verr"):  # noqa: SIM117
+            with tracer.span("pip", args=["install", "verr"]) as pip_span:
+                pip_span.set("returncode", 1)
+                pip_span.fail()
+        with pytest.raises(ValueError), tracer.span("install_pkg", pkg="spam"):
+            raise ValueError("bad version")
+
+    assert tracer.save() == report_file
+    assert tracer.enabled is False
+    report = json.loads(report_file.read_text())
+    assert [span["name"] for span in report["spans"]] == ["requirements_check", "install_packages"]
+    assert report["spans"][0]["attrs"] == {"met": False}
+    verr, spam = report["spans"][1]["children"]
+    assert verr["attrs"] == {"pkg": "verr"}
+    assert verr["outcome"] == "ok"
+    assert verr["children"][0]["outcome"] == "failed"
+    assert verr["children"][0]["attrs"]["returncode"] == 1
+    assert spam["outcome"] == "error"
+    assert spam["attrs"]["error"] == "ValueError: bad version"
+
+
+def test_threads_and_decorator(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, new_singleton: Callable[..., Any]
+) -> None:
+    tracer = new_singleton(Tracer)
+    # the decorator uses the singleton
+    monkeypatch.setitem(type(Tracer)._instances, Tracer, tracer)
+
+    @traced("probe")
+    def probe() -> str:
+        time.sleep(0.01)
+        return "done"
+
+    assert probe() == "done"
+    tracer.start(tmp_path / "trace.json")
+    with tracer.span("execute"):
+        thread = threading.Thread(target=probe)
+        thread.start()
+        thread.join()
+        assert probe() == "done"
+    report = tracer.get_report()
+    names = sorted(span["name"] for span in report["spans"])
+    # the span started on another thread is not a child of execute
+    assert names == ["execute", "probe"]
+    execute = next(span for span in report["spans"] if span["name"] == "execute")
+    assert execute["children"][0]["name"] == "probe"
+    assert execute["children"][0]["duration"] >= 0.01
+
+
+def test_disabled(tmp_path: Path, new_singleton: Callable[..., Any]) -> None:
+    tracer = new_singleton(Tracer)
+    with tracer.span("install_pkg", pkg="verr") as span:
+        span.set("returncode", 0)
+        span.fail()
+    assert tracer.save() is None
+    assert tracer.get_report()["spans"] == []
+
+
+@pytest.mark.benchmark
+def test_disabled_overhead(new_singleton: Callable[..., Any], record_property: Callable[[str, object], None]) -> None:
+    tracer = new_singleton(Tracer)
+    count = 100_000
+    start = time.perf_counter()
+    for _ in range(count):
+        with tracer.span("noop"):
+            pass
+    per_span = (time.perf_counter() - start) / count
+    record_property("disabled_span_ns", per_span * 1e9)
+    assert per_span < 5e-6
@@ -0,0 +1,110 @@
+from __future__ import annotations
+import json
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+if TYPE_CHECKING:
+    from oxt.___lo_pip___.install.tracking_index import TrackingIndex
+    from pytest_mock import MockerFixture
+
+_MOD = "oxt.___lo_pip___.install.tracking_index"
+
+
+def _get_index(
+    new_singleton: Callable[..., Any], mocker: MockerFixture, store_file: Path, use_sqlite: bool = True
+) -> TrackingIndex:
+    from oxt.___lo_pip___.install.tracking_index import TrackingIndex
+
+    cfg = mocker.patch(f"{_MOD}.Config").return_value
+    cfg.lo_implementation_name = "my_ext"
+    cfg.oxt_name = "my_ext"
+    cfg.extension_version = "1.0.0"
+    mocker.patch(f"{_MOD}.OxtLogger")
+    if not use_sqlite:
+        mocker.patch(f"{_MOD}.sqlite3", None)
+    return new_singleton(TrackingIndex, store_file)
+
+
+def _write_tracker(target: Path, pkg: str, dirs: list) -> Path:
+    target.mkdir(parents=True, exist_ok=True)
+    json_file = target / f"my_ext_{pkg}.json"
+    json_data = {
+        "id": "my_ext_pip_pkg",
+        "type_id": "pkg_tracker",
+        "package": pkg,
+        "package_version": "1.0",
+        "version": "0.9.0",
+        "data": {"new_dirs": dirs, "new_files": [], "new_bin_files": [f"{pkg}-cli"]},
+    }
+    json_file.write_text(json.dumps(json_data))
+    return json_file
+
+
+@pytest.mark.parametrize("use_sqlite", [True, False], ids=["sqlite", "json"])
+def test_save_get_remove(
+    tmp_path: Path, mocker: MockerFixture, use_sqlite: bool, new_singleton: Callable[..., Any]
+) -> None:
+    index = _get_index(new_singleton, mocker, tmp_path / "profile" / "tracking.sqlite", use_sqlite)
+    target = str(tmp_path / "site-packages")
+    data = {"new_dirs": ["verr", "verr-1.1.2.dist-info"], "new_files": [], "new_bin_files": ["verr"]}
+
+    index.save("verr", target, data, package_version="1.1.2")
+    start = time.time()
+    index.save("ooo-dev-tools", target, {"new_dirs": ["ooodev"], "new_files": ["six.py"]})
+
+    record = index.get("verr", target)
+    assert record is not None
+    assert record.package_version == "1.1.2"
+    assert record.version == "1.0.0"
+    assert record.target == target
+    assert record.new_dirs == ["verr", "verr-1.1.2.dist-info"]
+    assert record.get_files("new_bin_files") == ["verr"]
+
+    assert [r.package for r in index.get_packages()] == ["ooo-dev-tools", "verr"]
+    assert [r.package for r in index.get_packages(since=start)] == ["ooo-dev-tools"]
+    assert [r.package for r in index.get_packages(target, names=["verr"])] == ["verr"]
+    assert index.get_packages(str(tmp_path / "other")) == []
+
+    # saving again replaces the entries of that package only
+    index.save("verr", target, {"new_dirs": ["verr"], "new_files": []})
+    record = index.get("verr", target)
+    assert record is not None and record.new_dirs == ["verr"] and record.get_files("new_bin_files") == []
+
+    assert index.remove("verr", target)
+    assert not index.remove("verr", target)
+    assert index.get("verr", target) is None
+
+    # the store is kept between instances
+    index.close()
+    index = _get_index(new_singleton, mocker, tmp_path / "profile" / "tracking.sqlite", use_sqlite)
+    assert [r.package for r in index.get_packages()] == ["ooo-dev-tools"]
+    assert index.store_file.exists()
+    assert index.store_file.suffix == (".sqlite" if use_sqlite else ".json")
+
+
+@pytest.mark.parametrize("use_sqlite", [True, False], ids=["sqlite", "json"])
+def test_migrate(tmp_path: Path, mocker: MockerFixture, use_sqlite: bool, new_singleton: Callable[..., Any]) -> None:
+    target = tmp_path / "site-packages"
+    json_file = _write_tracker(target, "verr", ["verr"])
+    (target / "my_ext_other.json").write_text(json.dumps({"type_id": "other"}))
+    index = _get_index(new_singleton, mocker, tmp_path / "tracking.sqlite", use_sqlite)
+
+    record = index.get("verr", str(target))
+    assert record is not None
+    assert record.new_dirs == ["verr"]
+    assert record.get_files("new_bin_files") == ["verr-cli"]
+    assert record.package_version == "1.0"
+    # imported once then removed, files that are not trackers are left
+    assert not json_file.exists()
+    assert (target / "my_ext_other.json").exists()
+
+    _write_tracker(target, "late", ["late"])
+    assert index.migrate(str(target)) == 0
+    index.close()
+    index = _get_index(new_singleton, mocker, tmp_path / "tracking.sqlite", use_sqlite)
+    assert index.get("late", str(target)) is None
@@ -0,0 +1,116 @@
+from __future__ import annotations
+import json
+import time
+from pathlib import Path
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.install.wheel_cache.wheel_cache import WheelCache
+
+
+def _make_wheel(root: Path, name: str, size: int = 10) -> Path:
+    pth = root / name
+    pth.write_bytes(b"x" * size)
+    return pth
+
+
+@pytest.mark.parametrize(
+    "file_name, expected",
+    [
+        ("verr-1.1.2-py3-none-any.whl", ("verr", "1.1.2", "py3-none-any")),
+        (
+            "Typing_Extensions-4.12.2-py3-none-any.whl",
+            ("typing-extensions", "4.12.2", "py3-none-any"),
+        ),
+        (
+            "numpy-2.1.0-1-cp311-cp311-manylinux_2_17_x86_64.whl",
+            ("numpy", "2.1.0", "cp311-cp311-manylinux_2_17_x86_64"),
+        ),
+        ("verr-1.1.2.tar.gz", ("", "", "")),
+        ("verr-1.1.2.whl", ("", "", "")),
+    ],
+)
+def test_parse_wheel_name(file_name: str, expected: tuple) -> None:
+    assert WheelCache.parse_wheel_name(file_name) == expected
+
+
+@pytest.mark.parametrize(
+    "vstr, expected",
+    [
+        ("", 2),
+        (">=1.0.0", 2),
+        ("==1.1.2", 1),
+        (">=1.0.0, <1.1.0", 1),
+        ("^2.0", 0),
+    ],
+)
+def test_find(tmp_path: Path, vstr: str, expected: int) -> None:
+    _make_wheel(tmp_path, "verr-1.0.5-py3-none-any.whl")
+    _make_wheel(tmp_path, "verr-1.1.2-py3-none-any.whl")
+    _make_wheel(tmp_path, "other-1.1.2-py3-none-any.whl")
+    cache = WheelCache(tmp_path, 1024)
+    result = cache.find("Verr", vstr)
+    assert len(result) == expected
+    assert cache.hits == (1 if expected else 0)
+    assert cache.misses == (0 if expected else 1)
+
+
+def test_sync_index(tmp_path: Path) -> None:
+    _make_wheel(tmp_path, "verr-1.1.2-py3-none-any.whl", 7)
+    cache = WheelCache(tmp_path, 1024)
+    index = cache.sync()
+    assert list(index) == ["verr-1.1.2-py3-none-any.whl"]
+    assert index["verr-1.1.2-py3-none-any.whl"]["size"] == 7
+    assert len(index["verr-1.1.2-py3-none-any.whl"]["sha256"]) == 64
+
+    (tmp_path / "verr-1.1.2-py3-none-any.whl").unlink()
+    assert cache.sync() == {}
+    with open(tmp_path / WheelCache.INDEX_NAME, "r") as f:
+        assert json.load(f) == {}
+
+
+def test_evict_least_recently_used(tmp_path: Path) -> None:
+    names = ["a-1.0-py3-none-any.whl", "b-1.0-py3-none-any.whl", "c-1.0-py3-none-any.whl"]
+    for name in names:
+        _make_wheel(tmp_path, name, 10)
+    cache = WheelCache(tmp_path, 20)
+    index = cache.sync()
+    now = time.time()
+    for i, name in enumerate(names):
+        index[name]["last_used"] = now - 100 + i
+    cache._write_index(index)
+
+    # a is the oldest, touching it makes b the least recently used
+    cache.touch(["a-1.0-py3-none-any.whl"])
+    removed = cache.evict()
+    assert removed == ["b-1.0-py3-none-any.whl"]
+    assert not (tmp_path / "b-1.0-py3-none-any.whl").exists()
+    assert cache.size == 20
+
+
+def test_touch_from_output(tmp_path: Path) -> None:
+    _make_wheel(tmp_path, "verr-1.1.2-py3-none-any.whl")
+    cache = WheelCache(tmp_path, 1024)
+    index = cache.sync()
+    index["verr-1.1.2-py3-none-any.whl"]["last_used"] = 0
+    cache._write_index(index)
+
+    output = f"Looking in links: {tmp_path}\nProcessing {tmp_path / 'verr-1.1.2-py3-none-any.whl'}\n"
+    cache.touch_from_output(output)
+    assert cache.sync()["verr-1.1.2-py3-none-any.whl"]["last_used"] > 0
+
+
+def test_find_supported_tags(tmp_path: Path) -> None:
+    from packaging.tags import Tag
+
+    _make_wheel(tmp_path, "verr-1.1.2-py2.py3-none-any.whl")
+    _make_wheel(tmp_path, "numpy-2.1.0-cp311-cp311-win_amd64.whl")
+    cache = WheelCache(tmp_path, 1024, supported_tags=[Tag("py3", "none", "any"), Tag("cp312", "cp312", "win_amd64")])
+    assert len(cache.find("verr")) == 1
+    # a wheel of a shared cache that another interpreter downloaded is not a hit
+    assert cache.find("numpy") == []
+    assert cache.misses == 1
+    assert cache.is_supported("cp312-cp312-win_amd64") is True
+    assert cache.is_supported("not a tag") is False
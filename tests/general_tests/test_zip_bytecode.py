@@ -0,0 +1,94 @@
+from __future__ import annotations
+import shutil
+import sys
+import zipfile
+from pathlib import Path
+from typing import Callable
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from src.processing.zip_bytecode import ZipBytecode
+
+
+def _make_folder(root: Path, modules: int = 2, funcs: int = 1) -> Path:
+    folder = root / "py_pkgs"
+    pkg = folder / "my_pkg"
+    pkg.mkdir(parents=True)
+    body = "".join(f"def func_{i}(a, b):\n    return [a * i + b for i in range({i})]\n\n\n" for i in range(funcs))
+    for i in range(modules):
+        (pkg / f"mod_{i}.py").write_text(body)
+    (pkg / "__init__.py").write_text("".join(f"from . import mod_{i}\n" for i in range(modules)))
+    # written for LibreOffice, imported with stub uno modules
+    (folder / "lo_mod.py").write_text(
+        "import uno\nimport unohelper\nfrom com.sun.star.task import XJob\n\n\n"
+        "class Job(unohelper.Base, XJob):\n    pass\n"
+    )
+    return folder
+
+
+def _zip(folder: Path) -> Path:
+    return Path(shutil.make_archive(str(folder), "zip", folder))
+
+
+def test_compile_legacy_pyc(tmp_path: Path) -> None:
+    folder = _make_folder(tmp_path)
+    bytecode = ZipBytecode(python=sys.executable, invalidation_mode="unchecked-hash")
+    assert bytecode.compile(folder) is True
+    # zipimport only finds pyc files next to the source
+    assert (folder / "my_pkg" / "mod_0.pyc").exists()
+    assert (folder / "lo_mod.pyc").exists()
+    assert not list(folder.rglob("__pycache__"))
+
+    (folder / "bad.py").write_text("def (:\n")
+    assert bytecode.compile(folder) is False
+
+
+def test_zipimport_uses_pyc(tmp_path: Path) -> None:
+    folder = _make_folder(tmp_path)
+    bytecode = ZipBytecode(python=sys.executable, invalidation_mode="unchecked-hash")
+    bytecode.compile(folder)
+    zip_file = _zip(folder)
+    with zipfile.ZipFile(zip_file) as zf:
+        assert "my_pkg/__init__.pyc" in zf.namelist()
+    assert bytecode.get_top_level_names(zip_file) == ["lo_mod", "my_pkg"]
+
+    sys.path.insert(0, str(zip_file))
+    try:
+        import my_pkg.mod_0  # type: ignore
+
+        # loaded from bytecode, the file name is relative to the zip
+        assert my_pkg.mod_0.func_0.__code__.co_filename.replace("\\", "/") == "py_pkgs/my_pkg/mod_0.py"
+    finally:
+        sys.path.remove(str(zip_file))
+        for name in [name for name in sys.modules if name.split(".")[0] == "my_pkg"]:
+            del sys.modules[name]
+
+
+def test_report(tmp_path: Path) -> None:
+    folder = _make_folder(tmp_path)
+    bytecode = ZipBytecode(python=sys.executable, invalidation_mode="unchecked-hash")
+    bytecode.compile(folder)
+    zip_file = _zip(folder)
+
+    result = bytecode.report(zip_file, runs=1)
+    assert result.zip_name == "py_pkgs.zip"
+    assert result.modules == 2
+    # lo_mod imports uno, the harness stubs it
+    assert result.imported == 2
+    assert result.bytecode_seconds > 0
+    assert result.source_seconds > 0
+
+
+@pytest.mark.benchmark
+def test_report_benchmark(tmp_path: Path, record_property: Callable[[str, object], None]) -> None:
+    folder = _make_folder(tmp_path, modules=40, funcs=40)
+    bytecode = ZipBytecode(python=sys.executable, invalidation_mode="unchecked-hash")
+    bytecode.compile(folder)
+    zip_file = _zip(folder)
+
+    result = bytecode.report(zip_file)
+    record_property("bytecode_seconds", result.bytecode_seconds)
+    record_property("source_seconds", result.source_seconds)
+    assert result.bytecode_seconds < result.source_seconds
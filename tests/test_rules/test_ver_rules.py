@@ -188,3 +188,33 @@ def test_expect_not_equal(installed_str: str, vstr: str, expected_result: bool)
 def test_meet_requirements(check_ver: str, vstr: str, result: bool) -> None:
     vr = VerRules()
     assert vr.get_installed_is_valid(vstr=vstr, check_version=check_ver) == result
+
+
+@pytest.mark.parametrize(
+    "vstr",
+    [
+        "^1.2, !=1.3.1",
+        "~=1.5, <2, !=1.5.2",
+        "==1.*, !=1.6.0",
+        "==1.2.*",
+        ">=1.5, >1.1.5",
+        ">=1.1.5, <=1.1.5",
+        "~1.2.3",
+        "^0.0.3",
+        "==*",
+        "<> 1.2.3",
+    ],
+)
+def test_compiled_spec_matches_rules(vstr: str) -> None:
+    vr = VerRules()
+    spec = vr.compile(vstr)
+    assert spec is vr.compile(vstr)
+    rules = vr.get_matched_rules(vstr)
+    assert len(spec.rules) == len(rules)
+    versions = [
+        "0.0.2", "0.0.3", "0.0.4", "1.1.5", "1.2", "1.2.0", "1.2.3", "1.2.9", "1.3.0", "1.3.1",
+        "1.5.1", "1.5.2", "1.6.0", "1.9.9", "2.0", "2.0.0rc1", "1.2.3.post1", "1.2.3.dev1", "abc", "",
+    ]  # fmt: skip
+    for ver in versions:
+        expected = bool(rules) and all(rule.get_version_is_valid(ver) == 0 for rule in rules)
+        assert spec.is_valid(ver) == expected, ver
@@ -0,0 +1,48 @@
+from __future__ import annotations
+import time
+from typing import Callable
+import pytest
+
+if __name__ == "__main__":
+    pytest.main([__file__])
+
+from oxt.___lo_pip___.ver.req_version import ReqVersion
+
+_COUNT = 2000
+
+
+def _legacy_compare(prefix: str, ver: ReqVersion, other: object) -> bool:
+    # comparison as it was done before comparison keys, a new ReqVersion per comparison.
+    return ReqVersion(f"{prefix}{ver}").get_ver_is_valid(str(other))
+
+
+def _per_second(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    for _ in range(_COUNT):
+        fn()
+    return _COUNT / (time.perf_counter() - start)
+
+
+@pytest.mark.parametrize("other", [ReqVersion("<2.0.0"), "2.0.0"], ids=["ReqVersion", "str"])
+def test_compare_matches_legacy(other: object) -> None:
+    ver = ReqVersion(">=1.2.3")
+    expected = _legacy_compare(">=", ver, other), _legacy_compare("<", ver, other)
+    assert (ver >= other, ver < other) == expected  # type: ignore[operator]
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("other", [ReqVersion("<2.0.0"), "2.0.0"], ids=["ReqVersion", "str"])
+def test_compare_benchmark(other: object, record_property: Callable[[str, object], None]) -> None:
+    ver = ReqVersion(">=1.2.3")
+
+    def before() -> tuple:
+        return _legacy_compare(">=", ver, other), _legacy_compare("<", ver, other)
+
+    def after() -> tuple:
+        return ver >= other, ver < other  # type: ignore[operator]
+
+    before_rate = _per_second(before) * 2
+    after_rate = _per_second(after) * 2
+    record_property("before_per_second", before_rate)
+    record_property("after_per_second", after_rate)
+    assert after_rate > before_rate
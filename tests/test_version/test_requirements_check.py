@@ -43,10 +43,10 @@ def test_check_requirements(pkg_name: str, installed_ver: str, check_ver: str, r
     _ = mocker.patch("oxt.___lo_pip___.install.requirements_check.OxtLogger")
     # mock_logger.OxtLogger = dummy_logger
 
-    # mock the importlib.metadata.version function
-    mock_version = mocker.patch("oxt.___lo_pip___.install.requirements_check.version")
-    # assign the get_version function to the mock_version function
-    mock_version.side_effect = get_version
+    # mock the installed distribution lookup
+    mock_index = mocker.patch("oxt.___lo_pip___.install.requirements_check.DistributionIndex")
+    # assign the get_version function to the mock index get_version method
+    mock_index.return_value.get_version.side_effect = get_version
 
     mock_pkg = mocker.patch("oxt.___lo_pip___.install.requirements_check.Packages")
     mock_pkg_inst = mock_pkg.return_value
@@ -103,10 +103,10 @@ def test_check_requirements_packages(
 
     _ = mocker.patch("oxt.___lo_pip___.install.requirements_check.OxtLogger")
 
-    # mock the importlib.metadata.version function
-    mock_version = mocker.patch("oxt.___lo_pip___.install.requirements_check.version")
-    # assign the get_version function to the mock_version function
-    mock_version.side_effect = get_version
+    # mock the installed distribution lookup
+    mock_index = mocker.patch("oxt.___lo_pip___.install.requirements_check.DistributionIndex")
+    # assign the get_version function to the mock index get_version method
+    mock_index.return_value.get_version.side_effect = get_version
 
     from oxt.___lo_pip___.install.py_packages.py_package import PyPackage
 